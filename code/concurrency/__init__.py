@@ -0,0 +1,7 @@
+# Concurrency primitive benchmarks
+
+from .memory_cost import run_benchmarks as run_memory_cost_benchmarks
+
+__all__ = [
+    'run_memory_cost_benchmarks',
+]
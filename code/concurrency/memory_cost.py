@@ -0,0 +1,263 @@
+"""
+Concurrency primitive memory benchmarks.
+
+Measures the memory cost per unit and creation time of:
+- Threads (started, blocked on an Event)
+- asyncio Tasks (started, suspended on a Future)
+- Coroutine objects (created, never awaited)
+- Generators (started, suspended at a yield)
+- Frame objects (kept alive after their function returned)
+- Subinterpreters (Python 3.14+ concurrent.interpreters)
+
+Each primitive is spawned many times in a fresh subprocess, and the RSS and
+tracemalloc deltas are divided by the count. tracemalloc only sees Python
+allocations, so for threads and subinterpreters RSS is the number to use.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    MemoryResult,
+    collect_results,
+    format_bytes,
+    measure_rss_bytes,
+    measure_traced_allocation,
+    print_comparison_table,
+    print_header,
+    print_skip_message,
+    print_subheader,
+    run_script_json,
+    try_import,
+)
+
+CATEGORY = 'concurrency_memory'
+
+
+# =============================================================================
+# Primitives
+# =============================================================================
+# Each spawn function creates n live units and returns a cleanup function.
+
+
+def spawn_threads(n: int) -> Callable[[], None]:
+    release = threading.Event()
+    threads = [threading.Thread(target=release.wait) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+
+    def cleanup():
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    return cleanup
+
+
+def spawn_tasks(n: int) -> Callable[[], None]:
+    loop = asyncio.new_event_loop()
+    release = loop.create_future()
+
+    async def waiter():
+        await release
+
+    tasks = [loop.create_task(waiter()) for _ in range(n)]
+    # Run every task up to its first suspension point
+    loop.run_until_complete(asyncio.sleep(0))
+
+    def cleanup():
+        release.set_result(None)
+        loop.run_until_complete(asyncio.gather(*tasks))
+        loop.close()
+
+    return cleanup
+
+
+async def idle_coroutine():
+    pass
+
+
+def spawn_coroutines(n: int) -> Callable[[], None]:
+    coroutines = [idle_coroutine() for _ in range(n)]
+
+    def cleanup():
+        for coroutine in coroutines:
+            coroutine.close()
+
+    return cleanup
+
+
+def suspended_generator():
+    yield
+
+
+def spawn_generators(n: int) -> Callable[[], None]:
+    generators = [suspended_generator() for _ in range(n)]
+    for generator in generators:
+        next(generator)
+
+    return generators.clear
+
+
+def capture_frame():
+    return sys._getframe()
+
+
+def spawn_frames(n: int) -> Callable[[], None]:
+    frames = [capture_frame() for _ in range(n)]
+    return frames.clear
+
+
+def spawn_interpreters(n: int) -> Callable[[], None]:
+    from concurrent import interpreters  # type: ignore[attr-defined]
+
+    created = [interpreters.create() for _ in range(n)]
+
+    def cleanup():
+        for interpreter in created:
+            interpreter.close()
+
+    return cleanup
+
+
+@dataclass
+class Primitive:
+    label: str
+    count: int
+    spawn: Callable[[int], Callable[[], None]]
+
+
+def get_primitives() -> dict[str, Primitive]:
+    """Return all primitives available on this Python, keyed by short name."""
+    primitives = {
+        'thread': Primitive('Thread (blocked)', 1_000, spawn_threads),
+        'asyncio_task': Primitive('asyncio Task (suspended)', 100_000, spawn_tasks),
+        'coroutine': Primitive('Coroutine object', 1_000_000, spawn_coroutines),
+        'generator': Primitive('Generator (suspended)', 1_000_000, spawn_generators),
+        'frame': Primitive('Frame object', 100_000, spawn_frames),
+    }
+    if try_import('concurrent.interpreters'):
+        primitives['subinterpreter'] = Primitive('Subinterpreter', 20, spawn_interpreters)
+    return primitives
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def measure_primitive(key: str, count: int) -> dict[str, float]:
+    """
+    Measure one primitive in this process.
+
+    Intended to run in a fresh subprocess (see run_benchmarks).
+    """
+    primitive = get_primitives()[key]
+
+    # Pass 1: creation time and RSS delta (no tracemalloc overhead)
+    gc.collect()
+    rss_before = measure_rss_bytes()
+    start = perf_counter_ns()
+    cleanup = primitive.spawn(count)
+    create_ns = perf_counter_ns() - start
+    rss_delta = measure_rss_bytes() - rss_before
+    cleanup()
+
+    # Pass 2: Python-level bytes allocated according to tracemalloc
+    cleanup, traced_bytes = measure_traced_allocation(lambda: primitive.spawn(count))
+    cleanup()
+
+    return {
+        'rss_bytes_per_unit': rss_delta / count,
+        'tracemalloc_bytes_per_unit': traced_bytes / count,
+        'create_ms_per_unit': create_ns / count / 1_000_000,
+    }
+
+
+def run_benchmarks() -> list[BenchmarkResult | MemoryResult]:
+    """Run all concurrency primitive memory benchmarks."""
+    results: list[BenchmarkResult | MemoryResult] = []
+    rows: list[list[str]] = []
+
+    print_header('Concurrency Primitive Memory')
+    print('  (Each primitive measured in fresh subprocess)')
+
+    primitives = get_primitives()
+    if 'subinterpreter' not in primitives:
+        print_skip_message('subinterpreters', 'requires Python 3.14+ (concurrent.interpreters)')
+
+    for key, primitive in primitives.items():
+        measured = run_script_json(__file__, ['--measure', key, '--count', str(primitive.count)])
+        if measured is None:
+            continue
+
+        results.extend(
+            [
+                MemoryResult(
+                    name=f'{key}_bytes_rss',
+                    value=measured['rss_bytes_per_unit'],
+                    unit='bytes',
+                    category=CATEGORY,
+                ),
+                MemoryResult(
+                    name=f'{key}_bytes_tracemalloc',
+                    value=measured['tracemalloc_bytes_per_unit'],
+                    unit='bytes',
+                    category=CATEGORY,
+                ),
+                BenchmarkResult(
+                    name=f'{key}_create',
+                    value=measured['create_ms_per_unit'],
+                    category=CATEGORY,
+                ),
+            ]
+        )
+        rows.append(
+            [
+                primitive.label,
+                f'{primitive.count:,}',
+                format_bytes(int(measured['rss_bytes_per_unit'])),
+                format_bytes(int(measured['tracemalloc_bytes_per_unit'])),
+                f'{measured["create_ms_per_unit"] * 1_000:.2f} µs',
+            ]
+        )
+
+    print_subheader('Per Unit')
+    print_comparison_table(['Primitive', 'Count', 'RSS', 'tracemalloc', 'Create'], rows)
+
+    return results
+
+
+def main():
+    """Run benchmarks and output results."""
+    results = run_benchmarks()
+    output = collect_results(CATEGORY, results)
+
+    print()
+    print(f'Total benchmarks: {len(results)}')
+
+    return output
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Concurrency primitive memory benchmarks')
+    parser.add_argument('--measure', help='Measure a single primitive in this process and print JSON (internal)')
+    parser.add_argument('--count', type=int, help='Units to spawn for --measure')
+    args = parser.parse_args()
+
+    if args.measure:
+        primitive_count = args.count or get_primitives()[args.measure].count
+        print(json.dumps(measure_primitive(args.measure, primitive_count)))
+    else:
+        main()
@@ -3,9 +3,15 @@
 from .diskcache_bench import run_benchmarks as run_diskcache_benchmarks
 from .mongodb_bench import run_benchmarks as run_mongodb_benchmarks
 from .sqlite_bench import run_benchmarks as run_sqlite_benchmarks
+from .sqlite_bulk_load import run_benchmarks as run_sqlite_bulk_load_benchmarks
+from .sqlite_json_index import run_benchmarks as run_sqlite_json_index_benchmarks
+from .sqlite_pragmas import run_benchmarks as run_sqlite_pragma_benchmarks
 
 __all__ = [
     'run_sqlite_benchmarks',
+    'run_sqlite_pragma_benchmarks',
+    'run_sqlite_json_index_benchmarks',
+    'run_sqlite_bulk_load_benchmarks',
     'run_diskcache_benchmarks',
     'run_mongodb_benchmarks',
 ]
@@ -0,0 +1,254 @@
+"""
+SQLite bulk-load strategies.
+
+Loads 1,000,000 USER_DATA rows (distinct id, username and email, the full
+document as JSON) into a table with a unique index on username and an index on
+email, using:
+- commit_per_row: autocommit, one transaction per INSERT
+- txn_N: execute() per row, COMMIT every 10 / 100 / 1,000 / 10,000 rows
+- executemany_generator: one executemany() over a generator, one transaction
+- executemany_list: the same over a pre-built list of rows
+- multi_row_values: INSERT ... VALUES (...), (...), ... with 500 rows per statement
+- index_after_load: executemany() over a generator into the bare table, then
+  CREATE INDEX
+
+Every strategy runs in a fresh subprocess with journal_mode=WAL and
+synchronous=NORMAL (see sqlite_pragmas.py), and reports rows/sec (for
+index_after_load including creating the indexes) and peak RSS above the
+process's starting RSS. Use --dir to put the database on the disk the real job
+writes to.
+
+Rows are built while loading, so executemany_list pays for materialising them
+and the generator-vs-list memory comparison is real. Building is cheap: the
+document is spliced into JSON serialized once up front, since a json.dumps()
+per row would take most of the load time and hide the differences between
+strategies. The time to build the rows alone is printed for reference.
+"""
+
+import argparse
+import itertools
+import json
+import sqlite3
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    USER_DATA,
+    BenchmarkResult,
+    MemoryResult,
+    collect_results,
+    format_bytes,
+    measure_process_memory_mb,
+    measure_rss_bytes,
+    print_comparison_table,
+    print_header,
+    print_subheader,
+    run_script_json,
+)
+
+CATEGORY = 'database_sqlite'
+
+ROWS = 1_000_000
+VALUES_PER_STATEMENT = 500  # 1,500 parameters, well under SQLITE_MAX_VARIABLE_NUMBER
+
+CREATE_TABLE = 'CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT NOT NULL, email TEXT NOT NULL, data TEXT)'
+CREATE_INDEXES = [
+    'CREATE UNIQUE INDEX users_username ON users (username)',
+    'CREATE INDEX users_email ON users (email)',
+]
+INSERT = 'INSERT INTO users (id, username, email, data) VALUES (?, ?, ?, ?)'
+
+Row = tuple[int, str, str, str]
+
+# USER_DATA serialized once without its per-row fields, minus the opening brace
+DOCUMENT_REST = json.dumps({k: v for k, v in USER_DATA.items() if k not in ('id', 'username', 'email')})[1:]
+
+
+def iter_rows(count: int) -> Iterator[Row]:
+    for i in range(count):
+        username = f'user_{i}'
+        email = f'{username}@example.com'
+        yield (i, username, email, f'{{"id": {i}, "username": "{username}", "email": "{email}", {DOCUMENT_REST}')
+
+
+def build_rows_per_sec(count: int) -> float:
+    """Rows/sec for building the rows alone, the floor under every strategy's load time."""
+    start = perf_counter_ns()
+    for _ in iter_rows(count):
+        pass
+    return count / ((perf_counter_ns() - start) / 1e9)
+
+
+def load_commit_per_row(conn: sqlite3.Connection, rows: Iterable[Row]):
+    for row in rows:
+        conn.execute(INSERT, row)  # Autocommit: isolation_level=None and no BEGIN
+
+
+def load_in_transactions(size: int) -> Callable[[sqlite3.Connection, Iterable[Row]], None]:
+    def load(conn: sqlite3.Connection, rows: Iterable[Row]):
+        conn.execute('BEGIN')
+        for i, row in enumerate(rows, 1):
+            conn.execute(INSERT, row)
+            if i % size == 0:
+                conn.execute('COMMIT')
+                conn.execute('BEGIN')
+        conn.execute('COMMIT')
+
+    return load
+
+
+def load_executemany(conn: sqlite3.Connection, rows: Iterable[Row]):
+    conn.execute('BEGIN')
+    conn.executemany(INSERT, rows)
+    conn.execute('COMMIT')
+
+
+def load_executemany_list(conn: sqlite3.Connection, rows: Iterable[Row]):
+    load_executemany(conn, list(rows))
+
+
+def values_statement(count: int) -> str:
+    return INSERT + ', (?, ?, ?, ?)' * (count - 1)
+
+
+def load_multi_row_values(conn: sqlite3.Connection, rows: Iterable[Row]):
+    full_statement = values_statement(VALUES_PER_STATEMENT)
+    rows = iter(rows)
+    conn.execute('BEGIN')
+    while batch := list(itertools.islice(rows, VALUES_PER_STATEMENT)):
+        statement = full_statement if len(batch) == VALUES_PER_STATEMENT else values_statement(len(batch))
+        conn.execute(statement, [value for row in batch for value in row])
+    conn.execute('COMMIT')
+
+
+@dataclass
+class LoadStrategy:
+    label: str
+    load: Callable[[sqlite3.Connection, Iterable[Row]], None]
+    index_after: bool = False  # Create the indexes after loading instead of before
+
+
+STRATEGIES = {
+    'commit_per_row': LoadStrategy('Commit per row', load_commit_per_row),
+    'txn_10': LoadStrategy('Transactions of 10', load_in_transactions(10)),
+    'txn_100': LoadStrategy('Transactions of 100', load_in_transactions(100)),
+    'txn_1k': LoadStrategy('Transactions of 1,000', load_in_transactions(1_000)),
+    'txn_10k': LoadStrategy('Transactions of 10,000', load_in_transactions(10_000)),
+    'executemany_generator': LoadStrategy('executemany(generator)', load_executemany),
+    'executemany_list': LoadStrategy('executemany(list)', load_executemany_list),
+    'multi_row_values': LoadStrategy(f'Multi-row VALUES ({VALUES_PER_STATEMENT}/stmt)', load_multi_row_values),
+    'index_after_load': LoadStrategy('Load, then CREATE INDEX', load_executemany, index_after=True),
+}
+
+
+def measure_strategy(key: str, rows: int, db_dir: str) -> dict[str, float]:
+    """
+    Load `rows` rows with one strategy in this process.
+
+    Intended to run in a fresh subprocess (see run_benchmarks) so peak RSS is per strategy.
+    """
+    strategy = STRATEGIES[key]
+    db_path = Path(db_dir) / f'{key}.db'
+    conn = sqlite3.connect(db_path, isolation_level=None)  # Each strategy manages its own transactions
+    try:
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute(CREATE_TABLE)
+        if not strategy.index_after:
+            for statement in CREATE_INDEXES:
+                conn.execute(statement)
+
+        rss_before = measure_rss_bytes()
+        start = perf_counter_ns()
+        strategy.load(conn, iter_rows(rows))
+        if strategy.index_after:
+            for statement in CREATE_INDEXES:
+                conn.execute(statement)
+        elapsed_s = (perf_counter_ns() - start) / 1e9
+        peak_rss = measure_process_memory_mb() * 1024 * 1024
+
+        loaded = conn.execute('SELECT COUNT(*) FROM users').fetchone()[0]
+        if loaded != rows:
+            raise RuntimeError(f'{key} loaded {loaded:,} of {rows:,} rows')
+    finally:
+        conn.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(f'{db_path}{suffix}').unlink(missing_ok=True)
+
+    return {
+        'rows_per_sec': rows / elapsed_s,
+        'seconds': elapsed_s,
+        'peak_rss_bytes': max(0, peak_rss - rss_before),
+    }
+
+
+def run_benchmarks(rows: int = ROWS, db_dir: str | None = None) -> list[BenchmarkResult | MemoryResult]:
+    """Load the same rows with every strategy, each in a fresh subprocess, and print a ranking."""
+    results: list[BenchmarkResult | MemoryResult] = []
+
+    print_header('SQLite Bulk Load Strategies')
+    print(f'  ({rows:,} rows per strategy, WAL + NORMAL, each in a fresh subprocess)')
+    print(f'  (building the rows alone: {build_rows_per_sec(rows):,.0f} rows/sec)')
+
+    measured: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(dir=db_dir) as tmpdir:
+        for key, strategy in STRATEGIES.items():
+            print(f'  {strategy.label}')
+            m = run_script_json(__file__, ['--measure', key, '--rows', str(rows), '--dir', tmpdir], timeout=3600)
+            if m is not None:
+                measured[key] = m
+
+    for key, m in measured.items():
+        details = {'rows': rows, 'seconds': m['seconds'], 'peak_rss_bytes': m['peak_rss_bytes']}
+        results.append(BenchmarkResult(f'bulk_load_{key}', m['rows_per_sec'], 'rows/sec', CATEGORY, details))
+        results.append(MemoryResult(f'bulk_load_{key}_peak_rss', m['peak_rss_bytes'], 'bytes', CATEGORY))
+
+    if measured:
+        fastest = max(m['rows_per_sec'] for m in measured.values())
+        print_subheader('Ranked by rows/sec (peak RSS above process start)')
+        print_comparison_table(
+            ['Strategy', 'Rows/sec', 'Time', 'Peak RSS', 'vs fastest'],
+            [
+                [
+                    STRATEGIES[key].label,
+                    f'{m["rows_per_sec"]:,.0f}',
+                    f'{m["seconds"]:,.1f} s',
+                    format_bytes(int(m['peak_rss_bytes'])),
+                    f'{m["rows_per_sec"] / fastest:.0%}',
+                ]
+                for key, m in sorted(measured.items(), key=lambda item: item[1]['rows_per_sec'], reverse=True)
+            ],
+        )
+
+    return results
+
+
+def main():
+    """Run benchmarks and output results."""
+    parser = argparse.ArgumentParser(description='SQLite bulk-load strategies')
+    parser.add_argument('--rows', type=int, default=ROWS, help=f'Rows per strategy (default: {ROWS:,})')
+    parser.add_argument('--dir', help='Directory for the database files (default: system temp directory)')
+    parser.add_argument('--measure', choices=list(STRATEGIES), help='Measure one strategy and print JSON (internal)')
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_strategy(args.measure, args.rows, args.dir or tempfile.gettempdir())))
+        return None
+
+    results = run_benchmarks(rows=args.rows, db_dir=args.dir)
+    output = collect_results(CATEGORY, results)  # type: ignore
+
+    print()
+    print(f'Total benchmarks: {len(results)}')
+
+    return output
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+"""
+SQLite JSON field queries vs table size and index strategy.
+
+Tables of 10^3 to 10^7 USER_DATA-shaped documents (unique username, one of
+100 locations) are built three ways:
+- none: JSON text only, so every filter is a full scan through json_extract()
+- expression: indexes on json_extract(data, '$.username') and '$.profile.location'
+- generated: STORED generated columns for both fields, each indexed
+
+Indexes exist before loading, so the load rate shows each strategy's insert
+cost; documents are serialized outside the timed inserts. Per table size and
+strategy:
+- Bulk load rate (10,000-row transactions) and single-row INSERT time at that size
+- Point lookup by username (1 row)
+- COUNT(*) by location (1% of rows)
+- Database size
+
+Queries time themselves adaptively: a full scan of 10^7 rows takes seconds,
+an index probe microseconds. By default the sweep stops at 10^6 rows; 10^7
+adds roughly 25 minutes and several GB of temp disk, so it needs
+--max-rows 10000000.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    USER_DATA,
+    BenchmarkResult,
+    collect_results,
+    format_bytes,
+    print_comparison_table,
+    print_header,
+    print_skip_message,
+    print_subheader,
+    time_operation,
+)
+
+CATEGORY = 'database_sqlite'
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+LOCATIONS = [f'City {i}' for i in range(100)]
+QUERY_BUDGET_MS = 200  # Target time per timing run
+LOAD_BATCH = 10_000
+DEFAULT_MAX_ROWS = 10**6  # 10^7 only on request (--max-rows)
+
+
+@dataclass
+class IndexStrategy:
+    name: str
+    schema: list[str]
+    username: str  # SQL expression the point lookup filters on
+    location: str  # SQL expression the count filters on
+    min_sqlite: tuple[int, int, int] = (3, 9, 0)
+
+
+STRATEGIES = [
+    IndexStrategy(
+        name='none',
+        schema=['CREATE TABLE docs (id INTEGER PRIMARY KEY, data TEXT NOT NULL)'],
+        username="json_extract(data, '$.username')",
+        location="json_extract(data, '$.profile.location')",
+    ),
+    IndexStrategy(
+        name='expression',
+        schema=[
+            'CREATE TABLE docs (id INTEGER PRIMARY KEY, data TEXT NOT NULL)',
+            "CREATE INDEX docs_username ON docs (json_extract(data, '$.username'))",
+            "CREATE INDEX docs_location ON docs (json_extract(data, '$.profile.location'))",
+        ],
+        username="json_extract(data, '$.username')",
+        location="json_extract(data, '$.profile.location')",
+    ),
+    IndexStrategy(
+        name='generated',
+        schema=[
+            """
+            CREATE TABLE docs (
+                id INTEGER PRIMARY KEY,
+                data TEXT NOT NULL,
+                username TEXT GENERATED ALWAYS AS (json_extract(data, '$.username')) STORED,
+                location TEXT GENERATED ALWAYS AS (json_extract(data, '$.profile.location')) STORED
+            )
+            """,
+            'CREATE INDEX docs_username ON docs (username)',
+            'CREATE INDEX docs_location ON docs (location)',
+        ],
+        username='username',
+        location='location',
+        min_sqlite=(3, 31, 0),  # Generated columns
+    ),
+]
+
+QUERIES = ['insert_one', 'by_username', 'count_by_location']  # Timed in ms; the load is rows/sec
+
+
+def make_document(i: int) -> str:
+    return json.dumps(
+        {
+            **USER_DATA,
+            'id': i,
+            'username': f'user_{i}',
+            'email': f'user_{i}@example.com',
+            'profile': {**USER_DATA['profile'], 'location': LOCATIONS[i % len(LOCATIONS)]},
+        }
+    )
+
+
+def iter_documents(start: int, count: int) -> Iterator[tuple[str]]:
+    for i in range(start, start + count):
+        yield (make_document(i),)
+
+
+def time_adaptive(func: Callable[[], Any], budget_ms: float = QUERY_BUDGET_MS) -> float:
+    """Median ms per call, with as many iterations as fit the budget (at least one)."""
+    start = perf_counter_ns()
+    func()
+    first_ms = (perf_counter_ns() - start) / 1e6
+    iterations = max(1, int(budget_ms / max(first_ms, 0.001)))
+    return time_operation(func, iterations=iterations, warmup=min(iterations, 10), repeat=3)
+
+
+def uses_index(conn: sqlite3.Connection, sql: str, params: tuple) -> bool:
+    plan = conn.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()
+    return any('INDEX' in row[-1] for row in plan)
+
+
+def measure_strategy(strategy: IndexStrategy, rows: int, db_dir: Path) -> dict[str, Any]:
+    """Build one table and return load rows/sec, per-query ms, index use and database size."""
+    db_path = db_dir / f'{strategy.name}_{rows}.db'
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        for statement in strategy.schema:
+            conn.execute(statement)
+
+        # Each batch is serialized before its clock starts, so json.dumps() doesn't dilute the index cost
+        load_ns = 0
+        for batch_start in range(0, rows, LOAD_BATCH):
+            documents = list(iter_documents(batch_start, min(LOAD_BATCH, rows - batch_start)))
+            start = perf_counter_ns()
+            conn.execute('BEGIN')
+            conn.executemany('INSERT INTO docs (data) VALUES (?)', documents)
+            conn.execute('COMMIT')
+            load_ns += perf_counter_ns() - start
+        load_s = load_ns / 1e9
+        conn.execute('ANALYZE')
+
+        # Single-row insert into the full table, rolled back so the size stays fixed
+        extra = make_document(rows)
+        conn.execute('BEGIN')
+        insert_ms = time_operation(
+            lambda: conn.execute('INSERT INTO docs (data) VALUES (?)', (extra,)),
+            iterations=200,
+            warmup=10,
+        )
+        conn.execute('ROLLBACK')
+
+        rng = random.Random(42)
+        usernames = itertools.cycle([f'user_{rng.randrange(rows)}' for _ in range(100)])
+        locations = itertools.cycle(rng.sample(LOCATIONS, len(LOCATIONS)))
+        username_sql = f'SELECT id, data FROM docs WHERE {strategy.username} = ?'
+        location_sql = f'SELECT COUNT(*) FROM docs WHERE {strategy.location} = ?'
+
+        measured = {
+            'load_rows_per_sec': rows / load_s,
+            'insert_one_ms': insert_ms,
+            'by_username_ms': time_adaptive(lambda: conn.execute(username_sql, (next(usernames),)).fetchall()),
+            'count_by_location_ms': time_adaptive(lambda: conn.execute(location_sql, (next(locations),)).fetchone()),
+            'uses_index': uses_index(conn, username_sql, ('user_0',)),
+            'db_bytes': conn.execute('PRAGMA page_count').fetchone()[0]
+            * conn.execute('PRAGMA page_size').fetchone()[0],
+        }
+    finally:
+        conn.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(f'{db_path}{suffix}').unlink(missing_ok=True)
+
+    return measured
+
+
+def fmt_ms(ms: float) -> str:
+    return f'{ms * 1000:.1f} µs' if ms < 1 else f'{ms:,.1f} ms'
+
+
+def run_benchmarks(max_rows: int = DEFAULT_MAX_ROWS, db_dir: str | None = None) -> list[BenchmarkResult]:
+    """Sweep table sizes for every index strategy and print comparison tables."""
+    results: list[BenchmarkResult] = []
+
+    print_header('SQLite JSON Field Indexing vs Table Size')
+    sizes = [n for n in SIZES if n <= max_rows]
+    strategies = []
+    for strategy in STRATEGIES:
+        if sqlite3.sqlite_version_info < strategy.min_sqlite:
+            version = '.'.join(map(str, strategy.min_sqlite))
+            print_skip_message(strategy.name, f'needs SQLite {version}+, have {sqlite3.sqlite_version}')
+        else:
+            strategies.append(strategy)
+    print(f'  (sizes: {", ".join(f"{n:,}" for n in sizes)} rows; strategies: {", ".join(s.name for s in strategies)})')
+
+    measured: dict[tuple[str, int], dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(dir=db_dir) as tmpdir:
+        for rows in sizes:
+            for strategy in strategies:
+                print(f'  {strategy.name}: {rows:,} rows')
+                measured[(strategy.name, rows)] = measure_strategy(strategy, rows, Path(tmpdir))
+
+    for (name, rows), m in measured.items():
+        details = {'rows': rows, 'strategy': name, 'uses_index': m['uses_index'], 'db_bytes': m['db_bytes']}
+        results.append(
+            BenchmarkResult(f'json_index_{name}_{rows}_load', m['load_rows_per_sec'], 'rows/sec', CATEGORY, details)
+        )
+        for query in QUERIES:
+            results.append(
+                BenchmarkResult(f'json_index_{name}_{rows}_{query}', m[f'{query}_ms'], 'ms', CATEGORY, details)
+            )
+
+    names = [s.name for s in strategies]
+
+    def table(title: str, cell: Callable[[dict[str, Any]], str]):
+        print_subheader(title)
+        print_comparison_table(
+            ['Rows', *names],
+            [[f'{n:,}', *(cell(measured[(name, n)]) for name in names)] for n in sizes],
+        )
+
+    table('Lookup by username (1 row)', lambda m: fmt_ms(m['by_username_ms']))
+    table('COUNT(*) by location (1% of rows)', lambda m: fmt_ms(m['count_by_location_ms']))
+    table('Bulk load (rows/sec, indexes maintained during load)', lambda m: f'{m["load_rows_per_sec"]:,.0f}')
+    table('Single-row INSERT at table size', lambda m: fmt_ms(m['insert_one_ms']))
+    table('Database size', lambda m: format_bytes(m['db_bytes']))
+
+    if 'none' in names:
+        print_subheader('vs no index (lookup speedup / load slowdown)')
+        table_rows = []
+        for n in sizes:
+            base = measured[('none', n)]
+            row = [f'{n:,}']
+            for name in names[1:]:
+                m = measured[(name, n)]
+                speedup = base['by_username_ms'] / m['by_username_ms']
+                slowdown = 1 - m['load_rows_per_sec'] / base['load_rows_per_sec']
+                row.append(f'{speedup:,.0f}x / {slowdown:.0%}')
+            table_rows.append(row)
+        print_comparison_table(['Rows', *names[1:]], table_rows)
+
+    missing_index = sorted({name for (name, _), m in measured.items() if name != 'none' and not m['uses_index']})
+    if missing_index:
+        print(f'  Warning: the query planner did not use the index for: {", ".join(missing_index)}')
+
+    return results
+
+
+def main():
+    """Run benchmarks and output results."""
+    parser = argparse.ArgumentParser(description='SQLite JSON field indexing vs table size')
+    parser.add_argument(
+        '--max-rows',
+        type=int,
+        default=DEFAULT_MAX_ROWS,
+        help=f'Largest table size in the sweep, up to {SIZES[-1]:,} (default: {DEFAULT_MAX_ROWS:,})',
+    )
+    parser.add_argument('--dir', help='Directory for the database files (default: system temp directory)')
+    args = parser.parse_args()
+
+    results = run_benchmarks(max_rows=args.max_rows, db_dir=args.dir)
+    output = collect_results(CATEGORY, results)  # type: ignore
+
+    print()
+    print(f'Total benchmarks: {len(results)}')
+
+    return output
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+"""
+SQLite PRAGMA tuning matrix.
+
+For each PRAGMA combination, a fresh database of 20,000 USER_DATA rows is built
+and four operations are timed:
+- INSERT, one row per transaction (commit cost: journal_mode x synchronous)
+- SELECT by random primary key (page cache, mmap)
+- Range scan of 100 consecutive rows
+- UPDATE by random primary key, one row per transaction
+
+The matrix is journal_mode (DELETE/WAL/MEMORY) x synchronous (OFF/NORMAL/FULL)
+at SQLite's other defaults, then mmap_size, cache_size, temp_store and
+page_size varied one at a time from WAL + NORMAL. --full runs the complete
+cross product instead.
+
+Commit costs depend on the filesystem holding the database: on tmpfs fsync is
+nearly free and synchronous barely matters. Use --dir to put it on the disk
+you care about. temp_store only affects statements that spill temporary
+tables or sorts, so it is expected to be flat for these operations.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    USER_DATA,
+    BenchmarkResult,
+    collect_results,
+    format_bytes,
+    print_comparison_table,
+    print_header,
+    print_subheader,
+    time_operation,
+)
+
+CATEGORY = 'database_sqlite'
+
+ROWS = 20_000
+SCAN_ROWS = 100
+
+JOURNAL_MODES = ['DELETE', 'WAL', 'MEMORY']
+SYNCHRONOUS = ['OFF', 'NORMAL', 'FULL']
+MMAP_SIZES = [0, 256 * 1024 * 1024]
+CACHE_SIZES = [-2_000, -65_536]  # Negative values are KiB; -2000 is SQLite's default (~2 MB)
+TEMP_STORES = ['DEFAULT', 'MEMORY']
+PAGE_SIZES = [4_096, 16_384]
+
+OPERATIONS = ['insert', 'point_select', 'range_scan', 'update']
+
+
+@dataclass(frozen=True)
+class PragmaConfig:
+    """One PRAGMA combination; the defaults are SQLite's own."""
+
+    journal_mode: str = 'DELETE'
+    synchronous: str = 'FULL'
+    mmap_size: int = 0
+    cache_size: int = -2_000
+    temp_store: str = 'DEFAULT'
+    page_size: int = 4_096
+
+    def describe(self, name: str) -> str:
+        """Human-readable value of one PRAGMA."""
+        value = getattr(self, name)
+        if name == 'cache_size':
+            return format_bytes(-value * 1024) if value < 0 else f'{value} pages'
+        if name in ('mmap_size', 'page_size'):
+            return format_bytes(value) if value else 'off'
+        return str(value)
+
+    @property
+    def label(self) -> str:
+        return (
+            f'{self.journal_mode}/{self.synchronous} mmap={self.describe("mmap_size")} '
+            f'cache={self.describe("cache_size")} temp={self.temp_store} page={self.describe("page_size")}'
+        )
+
+    @property
+    def key(self) -> str:
+        """Result name fragment, e.g. 'wal_normal_mmap0_cache-2000_tempdefault_page4096'."""
+        return (
+            f'{self.journal_mode}_{self.synchronous}_mmap{self.mmap_size}_cache{self.cache_size}_'
+            f'temp{self.temp_store}_page{self.page_size}'
+        ).lower()
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        """Set every PRAGMA; page_size must come first, before any table exists or WAL is enabled."""
+        conn.execute(f'PRAGMA page_size = {self.page_size}')
+        conn.execute(f'PRAGMA journal_mode = {self.journal_mode}')
+        conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+        conn.execute(f'PRAGMA mmap_size = {self.mmap_size}')
+        conn.execute(f'PRAGMA cache_size = {self.cache_size}')
+        conn.execute(f'PRAGMA temp_store = {self.temp_store}')
+
+
+TUNED_BASE = PragmaConfig(journal_mode='WAL', synchronous='NORMAL')
+
+
+def matrix_configs(full: bool = False) -> list[PragmaConfig]:
+    """journal_mode x synchronous grid plus one-at-a-time variations from WAL + NORMAL, or the full product."""
+    if full:
+        return [
+            PragmaConfig(*values)
+            for values in itertools.product(
+                JOURNAL_MODES, SYNCHRONOUS, MMAP_SIZES, CACHE_SIZES, TEMP_STORES, PAGE_SIZES
+            )
+        ]
+
+    configs = [PragmaConfig(journal_mode=j, synchronous=s) for j in JOURNAL_MODES for s in SYNCHRONOUS]
+    for name, values in [
+        ('mmap_size', MMAP_SIZES),
+        ('cache_size', CACHE_SIZES),
+        ('temp_store', TEMP_STORES),
+        ('page_size', PAGE_SIZES),
+    ]:
+        configs.extend(replace(TUNED_BASE, **{name: value}) for value in values)
+    return list(dict.fromkeys(configs))  # The tuned base appears once per knob
+
+
+def measure_config(config: PragmaConfig, db_dir: Path, rows: int = ROWS) -> dict[str, float]:
+    """Build a fresh database with `config` and return operations/sec for each operation."""
+    db_path = db_dir / f'{config.key}.db'
+    conn = sqlite3.connect(db_path, isolation_level=None)  # Explicit BEGIN/COMMIT below
+    try:
+        config.apply(conn)
+        conn.execute('CREATE TABLE users (id INTEGER PRIMARY KEY, data TEXT NOT NULL)')
+        json_data = json.dumps(USER_DATA)
+        conn.execute('BEGIN')
+        conn.executemany('INSERT INTO users (data) VALUES (?)', ((json_data,) for _ in range(rows)))
+        conn.execute('COMMIT')
+
+        rng = random.Random(42)
+        ids = itertools.cycle(rng.sample(range(1, rows + 1), 1_000))
+        scan_starts = itertools.cycle(rng.sample(range(1, rows - SCAN_ROWS + 2), 1_000))
+        modified_data = json.dumps({**USER_DATA, 'username': 'bob_dev'})
+
+        def insert():
+            conn.execute('BEGIN')
+            conn.execute('INSERT INTO users (data) VALUES (?)', (json_data,))
+            conn.execute('COMMIT')
+
+        def point_select():
+            return conn.execute('SELECT data FROM users WHERE id = ?', (next(ids),)).fetchone()
+
+        def range_scan():
+            start = next(scan_starts)
+            return conn.execute(
+                'SELECT id, data FROM users WHERE id BETWEEN ? AND ?', (start, start + SCAN_ROWS - 1)
+            ).fetchall()
+
+        def update():
+            conn.execute('BEGIN')
+            conn.execute('UPDATE users SET data = ? WHERE id = ?', (modified_data, next(ids)))
+            conn.execute('COMMIT')
+
+        timings_ms = {
+            'insert': time_operation(insert, iterations=200, warmup=20),
+            'point_select': time_operation(point_select, iterations=5_000),
+            'range_scan': time_operation(range_scan, iterations=500),
+            'update': time_operation(update, iterations=200, warmup=20),
+        }
+    finally:
+        conn.close()
+        for suffix in ('', '-wal', '-shm', '-journal'):
+            Path(f'{db_path}{suffix}').unlink(missing_ok=True)
+
+    return {op: 1000 / ms for op, ms in timings_ms.items()}
+
+
+def run_benchmarks(full: bool = False, db_dir: str | None = None, rows: int = ROWS) -> list[BenchmarkResult]:
+    """Run the PRAGMA matrix and print throughput tables."""
+    results: list[BenchmarkResult] = []
+
+    print_header('SQLite PRAGMA Matrix')
+    configs = matrix_configs(full)
+    print(f'  ({len(configs)} configurations, {rows:,} rows each, operations/sec; higher is better)')
+
+    with tempfile.TemporaryDirectory(dir=db_dir) as tmpdir:
+        print(f'  Database directory: {tmpdir}')
+
+        measured: dict[PragmaConfig, dict[str, float]] = {}
+        for config in configs:
+            print(f'  {config.label}')
+            measured[config] = measure_config(config, Path(tmpdir), rows)
+
+    for config, ops in measured.items():
+        for op, ops_per_sec in ops.items():
+            results.append(
+                BenchmarkResult(
+                    name=f'pragma_{config.key}_{op}',
+                    value=ops_per_sec,
+                    unit='ops/sec',
+                    category=CATEGORY,
+                    details={f.name: getattr(config, f.name) for f in fields(config)},
+                )
+            )
+
+    def table(title: str, configs: list[PragmaConfig], knobs: list[str]):
+        print_subheader(title)
+        rows = [
+            [*(config.describe(knob) for knob in knobs), *(f'{measured[config][op]:,.0f}' for op in OPERATIONS)]
+            for config in configs
+        ]
+        print_comparison_table([*knobs, *OPERATIONS], rows)
+
+    if full:
+        table('All combinations', configs, [f.name for f in fields(PragmaConfig)])
+    else:
+        table(
+            'journal_mode x synchronous (other PRAGMAs at defaults)',
+            [c for c in configs if replace(c, journal_mode='DELETE', synchronous='FULL') == PragmaConfig()],
+            ['journal_mode', 'synchronous'],
+        )
+        for knob, values in [
+            ('mmap_size', MMAP_SIZES),
+            ('cache_size', CACHE_SIZES),
+            ('temp_store', TEMP_STORES),
+            ('page_size', PAGE_SIZES),
+        ]:
+            table(f'{knob} (WAL + NORMAL)', [replace(TUNED_BASE, **{knob: v}) for v in values], [knob])
+
+    return results
+
+
+def main():
+    """Run benchmarks and output results."""
+    parser = argparse.ArgumentParser(description='SQLite PRAGMA tuning matrix')
+    parser.add_argument('--full', action='store_true', help='Run the full cross product of every PRAGMA value')
+    parser.add_argument('--dir', help='Directory for the database files (default: system temp directory)')
+    parser.add_argument('--rows', type=int, default=ROWS, help=f'Rows per database (default: {ROWS:,})')
+    args = parser.parse_args()
+
+    results = run_benchmarks(full=args.full, db_dir=args.dir, rows=args.rows)
+    output = collect_results(CATEGORY, results)  # type: ignore
+
+    print()
+    print(f'Total benchmarks: {len(results)}')
+
+    return output
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
 # Import time benchmarks
 
+from .import_memory import run_benchmarks as run_import_memory_benchmarks
 from .import_times import run_benchmarks as run_import_times_benchmarks
 
 __all__ = [
+    'run_import_memory_benchmarks',
     'run_import_times_benchmarks',
 ]
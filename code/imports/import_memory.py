@@ -0,0 +1,166 @@
+"""
+Import memory benchmarks.
+
+Measures how much memory importing each module adds to a process, by running
+each import in a fresh subprocess. Uses the same module list as import_times.
+
+Two measurements per module:
+- RSS delta (current resident set size after import minus before)
+- tracemalloc delta (Python-level allocations made by the import)
+
+The tracemalloc run is separate from the RSS run since tracing inflates RSS,
+and uses the built-in _tracemalloc started via -X tracemalloc so the
+measurement itself doesn't import anything.
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    MemoryResult,
+    collect_results,
+    print_comparison_table,
+    print_header,
+    print_result,
+    print_skip_message,
+    print_subheader,
+)
+
+from imports.import_times import (
+    BUILTIN_MODULES,
+    LARGE_PACKAGES,
+    RUST_PACKAGES,
+    SMALL_PACKAGES,
+    STDLIB_MODULES,
+    check_module_available,
+)
+
+CATEGORY = 'import_memory'
+
+# Number of subprocess runs for each import
+ITERATIONS = 3
+
+RSS_CODE = """
+import os
+import sys
+
+if sys.platform == 'linux':
+
+    def rss_bytes():
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+else:
+    import psutil  # Imported before the baseline so it isn't counted
+
+    def rss_bytes():
+        return psutil.Process().memory_info().rss
+
+before = rss_bytes()
+import {module}
+print(rss_bytes() - before)
+"""
+
+TRACEMALLOC_CODE = """
+import _tracemalloc
+
+before = _tracemalloc.get_traced_memory()[0]
+import {module}
+print(_tracemalloc.get_traced_memory()[0] - before)
+"""
+
+
+def measure_import_subprocess(module_name: str, code: str, python_args: list[str]) -> float | None:
+    """
+    Run an import measurement script in fresh subprocesses.
+
+    Returns the median number of bytes printed by the script, or None if the import fails.
+    """
+    values = []
+    for _ in range(ITERATIONS):
+        try:
+            result = subprocess.run(
+                [sys.executable, *python_args, '-c', code.format(module=module_name)],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                values.append(float(result.stdout.strip()))
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, ValueError):
+            continue
+
+    if values:
+        return statistics.median(values)
+    return None
+
+
+def measure_import_memory_mb(module_name: str) -> tuple[float, float] | None:
+    """Return (RSS MB, tracemalloc MB) added by importing a module, or None if it fails."""
+    rss_bytes = measure_import_subprocess(module_name, RSS_CODE, [])
+    traced_bytes = measure_import_subprocess(module_name, TRACEMALLOC_CODE, ['-X', 'tracemalloc'])
+    if rss_bytes is None or traced_bytes is None:
+        return None
+    return rss_bytes / (1024 * 1024), traced_bytes / (1024 * 1024)
+
+
+def run_benchmarks() -> list[MemoryResult]:
+    """Run all import memory benchmarks."""
+    results: list[MemoryResult] = []
+    rows: list[list[str]] = []
+
+    print_header('Import Memory Benchmarks')
+    print('  (Each import measured in fresh subprocess)')
+
+    groups = [
+        ('Built-in Modules', BUILTIN_MODULES, False),
+        ('Standard Library', STDLIB_MODULES, False),
+        ('External Packages (Small)', SMALL_PACKAGES, True),
+        ('External Packages (Rust-based)', RUST_PACKAGES, True),
+        ('External Packages (Large)', LARGE_PACKAGES, True),
+    ]
+
+    for title, modules, external in groups:
+        print_subheader(title)
+        for module, label in modules:
+            if external and not check_module_available(module):
+                print_skip_message(label, 'not installed')
+                continue
+
+            measured = measure_import_memory_mb(module)
+            if measured is None:
+                continue
+
+            rss_mb, traced_mb = measured
+            results.append(MemoryResult(f'import {label} memory (RSS)', rss_mb, unit='MB', category=CATEGORY))
+            results.append(
+                MemoryResult(f'import {label} memory (tracemalloc)', traced_mb, unit='MB', category=CATEGORY)
+            )
+            print_result(f'import {label} (RSS)', rss_mb, unit='MB')
+            print_result(f'import {label} (tracemalloc)', traced_mb, unit='MB')
+            rows.append([f'import {label}', f'{rss_mb:.2f}', f'{traced_mb:.2f}'])
+
+    print_subheader('MB per Import')
+    rows.sort(key=lambda row: float(row[1]), reverse=True)
+    print_comparison_table(['Module', 'RSS (MB)', 'tracemalloc (MB)'], rows)
+
+    return results
+
+
+def main():
+    """Run benchmarks and output results."""
+    results = run_benchmarks()
+    output = collect_results(CATEGORY, results)  # type: ignore
+
+    print()
+    print(f'Total benchmarks: {len(results)}')
+
+    return output
+
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,7 @@ Tests:
 - Local module (small .py file)
 - Small external package (diskcache)
 - Rust-based external package (pydantic)
-- Large external package (django)
+- Large external packages (django, pandas)
 """
 
 import statistics
@@ -35,6 +35,52 @@ CATEGORY = 'import_times'
 ITERATIONS = 10
 WARMUP = 2
 
+# Built-in modules (compiled into Python)
+BUILTIN_MODULES = [
+    ('sys', 'sys (built-in)'),
+    ('os', 'os'),
+    ('json', 'json'),
+    ('math', 'math'),
+    ('time', 'time'),
+]
+
+# Standard library (pure Python)
+STDLIB_MODULES = [
+    ('pathlib', 'pathlib'),
+    ('dataclasses', 'dataclasses'),
+    ('typing', 'typing'),
+    ('collections', 'collections'),
+    ('datetime', 'datetime'),
+    ('re', 're'),
+    ('logging', 'logging'),
+    ('urllib.parse', 'urllib.parse'),
+    ('asyncio', 'asyncio'),
+    ('sqlite3', 'sqlite3'),
+]
+
+# External packages - small
+SMALL_PACKAGES = [
+    ('colorama', 'colorama'),
+    ('diskcache', 'diskcache'),
+]
+
+# External packages - Rust-based
+RUST_PACKAGES = [
+    ('pydantic', 'pydantic'),
+    ('orjson', 'orjson'),
+    ('msgspec', 'msgspec'),
+]
+
+# External packages - large
+LARGE_PACKAGES = [
+    ('django', 'django'),
+    ('flask', 'flask'),
+    ('fastapi', 'fastapi'),
+    ('starlette', 'starlette'),
+    ('litestar', 'litestar'),
+    ('pandas', 'pandas'),
+]
+
 
 def time_import_subprocess(module_name: str, from_import: str | None = None) -> float | None:
     """
@@ -113,15 +159,7 @@ def run_benchmarks() -> list[BenchmarkResult]:
     # -------------------------------------------------------------------------
     print_subheader('Built-in Modules')
 
-    builtins = [
-        ('sys', 'sys (built-in)'),
-        ('os', 'os'),
-        ('json', 'json'),
-        ('math', 'math'),
-        ('time', 'time'),
-    ]
-
-    for module, label in builtins:
+    for module, label in BUILTIN_MODULES:
         time_ms = time_import_subprocess(module)
         if time_ms is not None:
             results.append(BenchmarkResult(f'import {label}', time_ms, category=CATEGORY))
@@ -132,20 +170,7 @@ def run_benchmarks() -> list[BenchmarkResult]:
     # -------------------------------------------------------------------------
     print_subheader('Standard Library')
 
-    stdlib = [
-        ('pathlib', 'pathlib'),
-        ('dataclasses', 'dataclasses'),
-        ('typing', 'typing'),
-        ('collections', 'collections'),
-        ('datetime', 'datetime'),
-        ('re', 're'),
-        ('logging', 'logging'),
-        ('urllib.parse', 'urllib.parse'),
-        ('asyncio', 'asyncio'),
-        ('sqlite3', 'sqlite3'),
-    ]
-
-    for module, label in stdlib:
+    for module, label in STDLIB_MODULES:
         time_ms = time_import_subprocess(module)
         if time_ms is not None:
             results.append(BenchmarkResult(f'import {label}', time_ms, category=CATEGORY))
@@ -192,12 +217,7 @@ print((end - start) / 1_000_000)
     # -------------------------------------------------------------------------
     print_subheader('External Packages (Small)')
 
-    small_packages = [
-        ('colorama', 'colorama'),
-        ('diskcache', 'diskcache'),
-    ]
-
-    for module, label in small_packages:
+    for module, label in SMALL_PACKAGES:
         if check_module_available(module):
             time_ms = time_import_subprocess(module)
             if time_ms is not None:
@@ -211,13 +231,7 @@ print((end - start) / 1_000_000)
     # -------------------------------------------------------------------------
     print_subheader('External Packages (Rust-based)')
 
-    rust_packages = [
-        ('pydantic', 'pydantic'),
-        ('orjson', 'orjson'),
-        ('msgspec', 'msgspec'),
-    ]
-
-    for module, label in rust_packages:
+    for module, label in RUST_PACKAGES:
         if check_module_available(module):
             time_ms = time_import_subprocess(module)
             if time_ms is not None:
@@ -231,15 +245,7 @@ print((end - start) / 1_000_000)
     # -------------------------------------------------------------------------
     print_subheader('External Packages (Large)')
 
-    large_packages = [
-        ('django', 'django'),
-        ('flask', 'flask'),
-        ('fastapi', 'fastapi'),
-        ('starlette', 'starlette'),
-        ('litestar', 'litestar'),
-    ]
-
-    for module, label in large_packages:
+    for module, label in LARGE_PACKAGES:
         if check_module_available(module):
             time_ms = time_import_subprocess(module)
             if time_ms is not None:
@@ -13,12 +13,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.benchmark import (
     MemoryResult,
+    measure_allocated_results,
     measure_deep_size,
     print_header,
     print_memory_result,
     print_subheader,
 )
 
+# Setup for measure_allocated_results(): n ints outside the small-int cache, distinct for each instance i
+INTS_SETUP = """
+def ints(i, n):
+    start = 1_000_000 + i * 2_000
+    return range(start, start + n)
+"""
+
 
 def run_benchmarks() -> dict:
     """Run collection memory benchmarks."""
@@ -33,6 +41,7 @@ def run_benchmarks() -> dict:
     size = measure_deep_size(empty_list)
     print_memory_result('Empty list []', size)
     results.append(MemoryResult(name='empty_list', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('empty_list', '[]'))
 
     # We are using dynamically created numbers outside of [-5, 255] to avoid 
     # Python's caching and reuse of these ints.
@@ -41,21 +50,36 @@ def run_benchmarks() -> dict:
     size = measure_deep_size(list_10)
     print_memory_result('List with 10 ints (including elements)', size)
     results.append(MemoryResult(name='list_10_container', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('list_10_container', '[k for k in ints(i, 10)]', setup=INTS_SETUP))
 
     list_100 = list(i*int("2000") for i in range(100))
     size = measure_deep_size(list_100)
     print_memory_result('List with 100 ints (including elements)', size)
     results.append(MemoryResult(name='list_100_container', value=size, unit='bytes', category='memory'))
+    results.extend(
+        measure_allocated_results('list_100_container', '[k for k in ints(i, 100)]', count=10_000, setup=INTS_SETUP)
+    )
 
     list_1000 = list(i*int("3000") for i in range(1_000))
     size = measure_deep_size(list_1000)
     print_memory_result('List with 1000 ints (including elements)', size)
     results.append(MemoryResult(name='list_1000_container', value=size, unit='bytes', category='memory'))
+    results.extend(
+        measure_allocated_results('list_1000_container', '[k for k in ints(i, 1_000)]', count=1_000, setup=INTS_SETUP)
+    )
 
     list_1000_floats = list(float(i) for i in range(1_000))
     size = measure_deep_size(list_1000_floats)
     print_memory_result('List with 1000 floats (including elements)', size)
     results.append(MemoryResult(name='list_1000_floats_container', value=size, unit='bytes', category='memory'))
+    results.extend(
+        measure_allocated_results(
+            'list_1000_floats_container',
+            '[float(k) for k in ints(i, 1_000)]',
+            count=1_000,
+            setup=INTS_SETUP,
+        )
+    )
 
     # Dicts
     print_subheader('Dicts')
@@ -64,21 +88,39 @@ def run_benchmarks() -> dict:
     size = measure_deep_size(empty_dict)
     print_memory_result('Empty dict {}', size)
     results.append(MemoryResult(name='empty_dict', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('empty_dict', '{}'))
 
     dict_10 = {i*int("5000"): i*int("6000") for i in range(10)}
     size = measure_deep_size(dict_10)
     print_memory_result('Dict with 10 items (including elements)', size)
     results.append(MemoryResult(name='dict_10_container', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('dict_10_container', '{k: k + 1 for k in ints(i, 10)}', setup=INTS_SETUP))
 
     dict_100 = {i*int("7000"): i*int("7000") for i in range(100)}
     size = measure_deep_size(dict_100)
     print_memory_result('Dict with 100 items (including elements)', size)
     results.append(MemoryResult(name='dict_100_container', value=size, unit='bytes', category='memory'))
+    results.extend(
+        measure_allocated_results(
+            'dict_100_container',
+            '{k: k + 1 for k in ints(i, 100)}',
+            count=10_000,
+            setup=INTS_SETUP,
+        )
+    )
 
     dict_1000 = {i*int("7000"): i*int("7000") for i in range(1_000)}
     size = measure_deep_size(dict_1000)
     print_memory_result('Dict with 1000 items (including elements)', size)
     results.append(MemoryResult(name='dict_1000_container', value=size, unit='bytes', category='memory'))
+    results.extend(
+        measure_allocated_results(
+            'dict_1000_container',
+            '{k: k + 1 for k in ints(i, 1_000)}',
+            count=1_000,
+            setup=INTS_SETUP,
+        )
+    )
 
     # Sets
     print_subheader('Sets')
@@ -87,21 +129,29 @@ def run_benchmarks() -> dict:
     size = measure_deep_size(empty_set)
     print_memory_result('Empty set()', size)
     results.append(MemoryResult(name='empty_set', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('empty_set', 'set()'))
 
     set_10 = set(i*int("8000") for i in range(10))
     size = measure_deep_size(set_10)
     print_memory_result('Set with 10 items (including elements)', size)
     results.append(MemoryResult(name='set_10_container', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('set_10_container', '{k for k in ints(i, 10)}', setup=INTS_SETUP))
 
     set_100 = set(i*int("9000") for i in range(100))
     size = measure_deep_size(set_100)
     print_memory_result('Set with 100 items (including elements)', size)
     results.append(MemoryResult(name='set_100_container', value=size, unit='bytes', category='memory'))
+    results.extend(
+        measure_allocated_results('set_100_container', '{k for k in ints(i, 100)}', count=10_000, setup=INTS_SETUP)
+    )
 
     set_1000 = set(i*int("10000") for i in range(1_000))
     size = measure_deep_size(set_1000)
     print_memory_result('Set with 1000 items (including elements)', size)
     results.append(MemoryResult(name='set_1000_container', value=size, unit='bytes', category='memory'))
+    results.extend(
+        measure_allocated_results('set_1000_container', '{k for k in ints(i, 1_000)}', count=1_000, setup=INTS_SETUP)
+    )
 
     return {
         'category': 'memory',
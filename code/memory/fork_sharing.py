@@ -0,0 +1,204 @@
+"""
+Benchmark: Copy-on-Write Sharing in Pre-Fork Workers
+
+Pre-fork servers (Granian, gunicorn, ...) load the app in a parent and fork
+workers, expecting the workers to share the parent's memory. Reference count
+updates and GC passes write to object headers, which un-shares those pages.
+
+Loads a large object graph in a parent, forks children that use it, and
+reports each child's unique memory (USS) and proportional share (PSS) from
+/proc/<pid>/smaps_rollup. Scenarios:
+- idle: children never touch the graph (lower bound, what immortal objects would give)
+- read: children read every record (refcount writes)
+- read_gc: read + gc.collect() (a long-running worker)
+- read_gc_freeze: parent calls gc.freeze() before forking, then read + gc.collect()
+
+CPython has no API to immortalize arbitrary objects, so `idle` stands in for it.
+Linux only.
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    MemoryResult,
+    print_comparison_table,
+    print_header,
+    print_skip_message,
+    print_subheader,
+    run_script_json,
+)
+
+# Number of records in the shared graph (~100 MB)
+GRAPH_SIZE = 250_000
+CHILDREN = 4
+
+SCENARIOS = {
+    'idle': 'Idle (no access)',
+    'read': 'Read graph',
+    'read_gc': 'Read graph + gc.collect()',
+    'read_gc_freeze': 'gc.freeze() + read + gc.collect()',
+}
+
+
+def build_graph(size: int) -> list[dict]:
+    """A cache-like graph of small dicts, similar to what apps load at startup."""
+    return [
+        {
+            'id': 100_000 + i,
+            'name': f'user_{i}',
+            'email': f'user_{i}@example.com',
+            'score': i * 0.5,
+            'tags': [f'tag_{i % 100}', f'group_{i % 7}'],
+        }
+        for i in range(size)
+    ]
+
+
+def read_smaps_rollup_mb(pid: int) -> tuple[float, float]:
+    """Return (USS MB, PSS MB) for a process from /proc/<pid>/smaps_rollup."""
+    fields: dict[str, int] = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+
+    uss_kb = fields['Private_Clean'] + fields['Private_Dirty']
+    return uss_kb / 1024, fields['Pss'] / 1024
+
+
+def child_main(graph: list[dict], scenario: str, ready_fd: int, exit_fd: int) -> None:
+    """Use the inherited graph per scenario, report ready, then wait to be measured."""
+    if scenario != 'idle':
+        total = 0.0
+        for record in graph:
+            total += record['score']
+    if scenario in ('read_gc', 'read_gc_freeze'):
+        gc.collect()
+
+    os.write(ready_fd, b'.')
+    os.close(ready_fd)  # So the parent sees EOF once every child has signalled or died
+    os.read(exit_fd, 1)  # Blocks until the parent closes the pipe
+
+
+def measure_scenario(scenario: str, size: int, children: int) -> dict[str, float]:
+    """
+    Fork children for one scenario and measure their memory.
+
+    Intended to run in a fresh subprocess (see run_benchmarks).
+    """
+    graph = build_graph(size)
+    gc.collect()
+    if scenario == 'read_gc_freeze':
+        gc.freeze()
+
+    ready_read, ready_write = os.pipe()
+    exit_read, exit_write = os.pipe()
+
+    pids = []
+    for _ in range(children):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(exit_write)
+                child_main(graph, scenario, ready_write, exit_read)
+            finally:
+                os._exit(0)
+        pids.append(pid)
+
+    os.close(exit_read)
+    os.close(ready_write)  # Only the children hold it now, so a dead child can't block the read forever
+    try:
+        for _ in range(children):
+            if not os.read(ready_read, 1):
+                raise RuntimeError(f'{scenario}: a child exited before signalling ready')
+
+        measurements = [read_smaps_rollup_mb(pid) for pid in pids]
+        parent_uss, _ = read_smaps_rollup_mb(os.getpid())
+    finally:
+        os.close(exit_write)
+        for pid in pids:
+            os.waitpid(pid, 0)
+
+    return {
+        'child_uss_mb': statistics.median(uss for uss, _ in measurements),
+        'child_pss_mb': statistics.median(pss for _, pss in measurements),
+        'parent_uss_mb': parent_uss,
+    }
+
+
+def run_benchmarks(size: int = GRAPH_SIZE, children: int = CHILDREN) -> dict:
+    """Run copy-on-write fork sharing benchmarks."""
+    print_header('Copy-on-Write Sharing in Pre-Fork Workers')
+
+    results: list[MemoryResult] = []
+
+    if not Path('/proc/self/smaps_rollup').exists():
+        print_skip_message('fork sharing', 'requires Linux /proc/<pid>/smaps_rollup')
+        return {'category': 'memory', 'section': 'fork_sharing', 'results': []}
+
+    print(f'  ({size:,} records in parent, {children} forked children, median per child)')
+
+    rows: list[list[str]] = []
+    for scenario, label in SCENARIOS.items():
+        measured = run_script_json(__file__, ['--scenario', scenario, '--size', str(size), '--children', str(children)])
+        if measured is None:
+            continue
+
+        results.extend(
+            [
+                MemoryResult(
+                    name=f'fork_{scenario}_child_uss',
+                    value=measured['child_uss_mb'],
+                    unit='MB',
+                    category='memory',
+                ),
+                MemoryResult(
+                    name=f'fork_{scenario}_child_pss',
+                    value=measured['child_pss_mb'],
+                    unit='MB',
+                    category='memory',
+                ),
+            ]
+        )
+        rows.append(
+            [
+                label,
+                f'{measured["child_uss_mb"]:.1f} MB',
+                f'{measured["child_pss_mb"]:.1f} MB',
+                f'{measured["parent_uss_mb"]:.1f} MB',
+            ]
+        )
+
+    print_subheader('Per Child')
+    print_comparison_table(['Scenario', 'Child USS', 'Child PSS', 'Parent USS'], rows)
+
+    return {
+        'category': 'memory',
+        'section': 'fork_sharing',
+        'results': [r.to_dict() for r in results],
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Copy-on-write fork sharing benchmarks')
+    parser.add_argument('--size', type=int, default=GRAPH_SIZE, help=f'Records in the graph (default: {GRAPH_SIZE:,})')
+    parser.add_argument('--children', type=int, default=CHILDREN, help=f'Children to fork (default: {CHILDREN})')
+    parser.add_argument('--scenario', choices=list(SCENARIOS), help='Measure one scenario and print JSON (internal)')
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(measure_scenario(args.scenario, args.size, args.children)))
+    else:
+        results = run_benchmarks(args.size, args.children)
+        print()
+        print(json.dumps(results, indent=2))
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.benchmark import (
     MemoryResult,
+    measure_allocated_results,
     measure_size,
     print_header,
     print_memory_result,
@@ -34,30 +35,35 @@ def run_benchmarks() -> dict:
     size = measure_size(small_int)
     print_memory_result('Small int (42, cached range)', size)
     results.append(MemoryResult(name='small_int', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('small_int', '42'))
 
     # Boundary int (just outside cache)
     boundary_int = 257
     size = measure_size(boundary_int)
     print_memory_result('Boundary int (257)', size)
     results.append(MemoryResult(name='boundary_int', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('boundary_int', '257 + i'))
 
     # Large int
     large_int = 1_000
     size = measure_size(large_int)
     print_memory_result('Large int (1,000)', size)
     results.append(MemoryResult(name='large_int', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('large_int', '1_000 + i'))
 
     # Very large int
     very_large_int = 10**20
     size = measure_size(very_large_int)
     print_memory_result('Very large int (10^20)', size)
     results.append(MemoryResult(name='very_large_int_20', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('very_large_int_20', '10**20 + i'))
 
     # Huge int
     huge_int = 10**100
     size = measure_size(huge_int)
     print_memory_result('Huge int (10^100)', size)
     results.append(MemoryResult(name='huge_int_100', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('huge_int_100', '10**100 + i'))
 
     # Floats
     print_subheader('Floats')
@@ -67,12 +73,14 @@ def run_benchmarks() -> dict:
     size = measure_size(f)
     print_memory_result('Float (3.14159)', size)
     results.append(MemoryResult(name='float', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('float', '3.14159 + i'))
 
     # Large float
     large_float = 1.0e308
     size = measure_size(large_float)
     print_memory_result('Large float (1e308)', size)
     results.append(MemoryResult(name='large_float', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('large_float', '1.0e308 - i'))
 
     return {
         'category': 'memory',
@@ -0,0 +1,334 @@
+"""
+Benchmark: Record Representation Memory at Scale
+
+Builds 1,000,000 realistic records (ints, short strings, a float, a bool and
+an optional field) in each common in-memory representation and measures:
+- Bytes per record (tracemalloc and RSS delta)
+- Construction time per record
+- Field access time
+
+Each representation is measured in a fresh subprocess so RSS deltas aren't
+polluted by memory that earlier representations freed but never returned to the OS.
+Construction time includes generating the field values, which is the same for every representation.
+"""
+
+import argparse
+import array
+import json
+import sys
+from collections import namedtuple
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    MemoryResult,
+    format_bytes,
+    measure_rss_bytes,
+    measure_traced_allocation,
+    print_comparison_table,
+    print_header,
+    print_skip_message,
+    print_subheader,
+    run_script_json,
+    time_operation,
+    try_import,
+)
+
+RECORD_COUNT = 1_000_000
+
+FIELDS = ['id', 'name', 'email', 'score', 'age', 'active']
+
+
+def iter_rows(count: int) -> Iterator[tuple[int, str, str | None, float, int, bool]]:
+    """Yield realistic record field values; every third record has no email."""
+    for i in range(count):
+        yield (
+            100_000 + i,
+            f'user_{i}',
+            None if i % 3 == 0 else f'user_{i}@example.com',
+            i * 0.5,
+            18 + i % 60,
+            i % 2 == 0,
+        )
+
+
+# =============================================================================
+# Record Types
+# =============================================================================
+
+
+class RegularRecord:
+    def __init__(self, id, name, email, score, age, active):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.score = score
+        self.age = age
+        self.active = active
+
+
+class SlotsRecord:
+    __slots__ = FIELDS
+
+    def __init__(self, id, name, email, score, age, active):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.score = score
+        self.age = age
+        self.active = active
+
+
+@dataclass(slots=True)
+class SlotsDataclassRecord:
+    id: int
+    name: str
+    email: str | None
+    score: float
+    age: int
+    active: bool
+
+
+TupleRecord = namedtuple('TupleRecord', FIELDS)
+
+
+@dataclass
+class Representation:
+    label: str
+    build: Callable[[int], Any]
+    access: Callable[[Any, int], Any]  # Reads the `score` field of record i
+
+
+def build_columns(count: int) -> dict[str, Any]:
+    """Column-wise storage: array.array for numbers, lists for strings."""
+    columns: dict[str, Any] = {
+        'id': array.array('q'),
+        'name': [],
+        'email': [],
+        'score': array.array('d'),
+        'age': array.array('B'),
+        'active': array.array('b'),
+    }
+    for id_, name, email, score, age, active in iter_rows(count):
+        columns['id'].append(id_)
+        columns['name'].append(name)
+        columns['email'].append(email)
+        columns['score'].append(score)
+        columns['age'].append(age)
+        columns['active'].append(active)
+    return columns
+
+
+def get_representations() -> dict[str, Representation]:
+    """Return all representations whose libraries are installed, keyed by short name."""
+    representations = {
+        'dict': Representation(
+            'dict',
+            lambda n: [dict(zip(FIELDS, row)) for row in iter_rows(n)],
+            lambda records, i: records[i]['score'],
+        ),
+        'regular_class': Representation(
+            'Regular class',
+            lambda n: [RegularRecord(*row) for row in iter_rows(n)],
+            lambda records, i: records[i].score,
+        ),
+        'slots_class': Representation(
+            '__slots__ class',
+            lambda n: [SlotsRecord(*row) for row in iter_rows(n)],
+            lambda records, i: records[i].score,
+        ),
+        'slots_dataclass': Representation(
+            'Slots dataclass',
+            lambda n: [SlotsDataclassRecord(*row) for row in iter_rows(n)],
+            lambda records, i: records[i].score,
+        ),
+        'namedtuple': Representation(
+            'namedtuple',
+            lambda n: [TupleRecord(*row) for row in iter_rows(n)],
+            lambda records, i: records[i].score,
+        ),
+    }
+
+    msgspec = try_import('msgspec')
+    if msgspec:
+
+        class StructRecord(msgspec.Struct):
+            id: int
+            name: str
+            email: str | None
+            score: float
+            age: int
+            active: bool
+
+        representations['msgspec_struct'] = Representation(
+            'msgspec Struct',
+            lambda n: [StructRecord(*row) for row in iter_rows(n)],
+            lambda records, i: records[i].score,
+        )
+
+    pydantic = try_import('pydantic')
+    if pydantic:
+
+        class ModelRecord(pydantic.BaseModel):
+            id: int
+            name: str
+            email: str | None
+            score: float
+            age: int
+            active: bool
+
+        representations['pydantic_model'] = Representation(
+            'Pydantic model',
+            lambda n: [ModelRecord(**dict(zip(FIELDS, row))) for row in iter_rows(n)],
+            lambda records, i: records[i].score,
+        )
+
+    representations['array_columns'] = Representation(
+        'array.array columns',
+        build_columns,
+        lambda columns, i: columns['score'][i],
+    )
+
+    numpy = try_import('numpy')
+    if numpy:
+        record_dtype = numpy.dtype(
+            [('id', 'i8'), ('name', 'U16'), ('email', 'U32'), ('score', 'f8'), ('age', 'u1'), ('active', '?')]
+        )
+
+        def build_structured(n: int) -> Any:
+            # None is stored as '' since fixed-width string fields can't be null
+            rows = (row[:2] + (row[2] or '',) + row[3:] for row in iter_rows(n))
+            return numpy.fromiter(rows, dtype=record_dtype, count=n)
+
+        representations['numpy_structured'] = Representation(
+            'NumPy structured array',
+            build_structured,
+            lambda records, i: records['score'][i],
+        )
+
+    return representations
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def measure_representation(key: str, count: int) -> dict[str, float]:
+    """
+    Measure one representation in this process.
+
+    Intended to run in a fresh subprocess (see run_benchmarks).
+    """
+    representation = get_representations()[key]
+
+    # Pass 1: construction time and RSS delta (no tracemalloc overhead)
+    rss_before = measure_rss_bytes()
+    start = perf_counter_ns()
+    records = representation.build(count)
+    build_ns = perf_counter_ns() - start
+    rss_delta = measure_rss_bytes() - rss_before
+
+    middle = count // 2
+    access_ms = time_operation(lambda: representation.access(records, middle), iterations=10_000)
+    records = None  # Release before the tracemalloc pass
+
+    # Pass 2: exact bytes allocated by the build according to tracemalloc
+    _, traced_bytes = measure_traced_allocation(lambda: representation.build(count))
+
+    return {
+        'tracemalloc_bytes_per_record': traced_bytes / count,
+        'rss_bytes_per_record': rss_delta / count,
+        'construct_ms_per_record': build_ns / count / 1_000_000,
+        'field_access_ms': access_ms,
+    }
+
+
+def run_benchmarks(count: int = RECORD_COUNT) -> dict:
+    """Run record representation memory benchmarks."""
+    print_header('Record Representation Memory at Scale')
+    print(f'  ({count:,} records per representation, each in a fresh subprocess)')
+
+    results: list[MemoryResult | BenchmarkResult] = []
+    rows: list[list[str]] = []
+
+    representations = get_representations()
+    for library, key in [('msgspec', 'msgspec_struct'), ('pydantic', 'pydantic_model'), ('numpy', 'numpy_structured')]:
+        if key not in representations:
+            print_skip_message(library)
+
+    for key, representation in representations.items():
+        measured = run_script_json(__file__, ['--measure', key, '--count', str(count)])
+        if measured is None:
+            continue
+
+        results.extend(
+            [
+                MemoryResult(
+                    name=f'records_{key}_bytes_tracemalloc',
+                    value=measured['tracemalloc_bytes_per_record'],
+                    unit='bytes',
+                    category='memory',
+                ),
+                MemoryResult(
+                    name=f'records_{key}_bytes_rss',
+                    value=measured['rss_bytes_per_record'],
+                    unit='bytes',
+                    category='memory',
+                ),
+                BenchmarkResult(
+                    name=f'records_{key}_construct',
+                    value=measured['construct_ms_per_record'],
+                    category='memory',
+                ),
+                BenchmarkResult(
+                    name=f'records_{key}_field_access',
+                    value=measured['field_access_ms'],
+                    category='memory',
+                ),
+            ]
+        )
+        rows.append(
+            [
+                representation.label,
+                format_bytes(int(measured['tracemalloc_bytes_per_record'])),
+                format_bytes(int(measured['rss_bytes_per_record'])),
+                f'{measured["construct_ms_per_record"] * 1_000_000:.0f} ns',
+                f'{measured["field_access_ms"] * 1_000_000:.1f} ns',
+            ]
+        )
+
+    print_subheader('Per Record')
+    print_comparison_table(['Representation', 'tracemalloc', 'RSS', 'Construct', 'Field access'], rows)
+
+    return {
+        'category': 'memory',
+        'section': 'records',
+        'results': [r.to_dict() for r in results],
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Record representation memory benchmarks')
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=RECORD_COUNT,
+        help=f'Records per representation (default: {RECORD_COUNT:,})',
+    )
+    parser.add_argument('--measure', help='Measure a single representation in this process and print JSON (internal)')
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_representation(args.measure, args.count)))
+    else:
+        results = run_benchmarks(args.count)
+        print()
+        print(json.dumps(results, indent=2))
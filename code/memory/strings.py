@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.benchmark import (
     MemoryResult,
+    measure_allocated_results,
     measure_size,
     print_header,
     print_memory_result,
@@ -30,30 +31,35 @@ def run_benchmarks() -> dict:
     size = measure_size(empty_str)
     print_memory_result('Empty string ""', size)
     results.append(MemoryResult(name='empty_string', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('empty_string', "''"))
 
     # 1-character string
     one_char = 'a'
     size = measure_size(one_char)
     print_memory_result('1-char string "a"', size)
     results.append(MemoryResult(name='1_char_string', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('1_char_string', "'a'"))
 
     # 10-character string
     ten_char = 'a' * 10
     size = measure_size(ten_char)
     print_memory_result('10-char string', size)
     results.append(MemoryResult(name='10_char_string', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('10_char_string', "f'{i:010d}'"))
 
     # 100-character string
     hundred_char = 'a' * 100
     size = measure_size(hundred_char)
     print_memory_result('100-char string', size)
     results.append(MemoryResult(name='100_char_string', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('100_char_string', "f'{i:0100d}'"))
 
     # 1000-character string
     thousand_char = 'a' * 1_000
     size = measure_size(thousand_char)
     print_memory_result('1000-char string', size)
     results.append(MemoryResult(name='1000_char_string', value=size, unit='bytes', category='memory'))
+    results.extend(measure_allocated_results('1000_char_string', "f'{i:01000d}'", count=10_000))
 
     return {
         'category': 'memory',
@@ -49,6 +49,8 @@ BENCHMARK_CATEGORIES = {
             ('memory.numbers_mem', 'run_benchmarks'),
             ('memory.collections_mem', 'run_benchmarks'),
             ('memory.classes', 'run_benchmarks'),
+            ('memory.records', 'run_benchmarks'),
+            ('memory.fork_sharing', 'run_benchmarks'),
         ],
     },
     'basic_ops': {
@@ -86,6 +88,8 @@ BENCHMARK_CATEGORIES = {
         'name': 'Web Frameworks',
         'modules': [
             ('web_frameworks.benchmarks', 'run_benchmarks'),
+            ('web_frameworks.in_process', 'run_benchmarks'),
+            ('web_frameworks.cold_start', 'run_benchmarks'),
         ],
     },
     'file_io': {
@@ -99,6 +103,9 @@ BENCHMARK_CATEGORIES = {
         'name': 'Database Operations',
         'modules': [
             ('database.sqlite_bench', 'run_benchmarks'),
+            ('database.sqlite_pragmas', 'run_benchmarks'),
+            ('database.sqlite_json_index', 'run_benchmarks'),
+            ('database.sqlite_bulk_load', 'run_benchmarks'),
             ('database.diskcache_bench', 'run_benchmarks'),
             ('database.mongodb_bench', 'run_benchmarks'),
         ],
@@ -117,10 +124,17 @@ BENCHMARK_CATEGORIES = {
             ('async_bench.async_overhead', 'run_benchmarks'),
         ],
     },
+    'concurrency': {
+        'name': 'Concurrency Memory',
+        'modules': [
+            ('concurrency.memory_cost', 'run_benchmarks'),
+        ],
+    },
     'imports': {
-        'name': 'Import Times',
+        'name': 'Import Times and Memory',
         'modules': [
             ('imports.import_times', 'run_benchmarks'),
+            ('imports.import_memory', 'run_benchmarks'),
         ],
     },
 }
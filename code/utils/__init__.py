@@ -9,9 +9,13 @@ from .benchmark import (
     collect_results,
     format_bytes,
     format_ms,
+    measure_allocated_results,
+    measure_allocated_size,
     measure_deep_size,
     measure_process_memory_mb,
+    measure_rss_bytes,
     measure_size,
+    measure_traced_allocation,
     ns_to_ms,
     print_comparison_table,
     print_error,
@@ -23,6 +27,7 @@ from .benchmark import (
     print_success,
     require_import,
     run_benchmarks,
+    run_script_json,
     time_operation,
     time_operation_ns,
     time_with_timeit,
@@ -45,7 +50,11 @@ __all__ = [
     # Memory utilities
     'measure_size',
     'measure_deep_size',
+    'measure_allocated_size',
+    'measure_allocated_results',
     'measure_process_memory_mb',
+    'measure_rss_bytes',
+    'measure_traced_allocation',
     # Formatting utilities
     'format_ms',
     'format_bytes',
@@ -63,5 +72,6 @@ __all__ = [
     'require_import',
     # Runner utilities
     'run_benchmarks',
+    'run_script_json',
     'collect_results',
 ]
@@ -6,10 +6,14 @@ Provides timing, memory measurement, colored output, and result formatting.
 
 import gc
 import importlib
+import json
 import statistics
 import sys
 import timeit
+import types
+from collections.abc import Iterable
 from dataclasses import dataclass
+from itertools import chain
 from time import perf_counter_ns
 from typing import Any, Callable, Optional
 
@@ -237,36 +241,167 @@ def measure_size(obj: Any) -> int:
     return sys.getsizeof(obj)
 
 
-def measure_deep_size(obj: Any) -> int:
-    """
-    Measure the total memory of an object including all referenced objects.
+# Types that are shared program structure rather than data: never counted or walked into
+_DEEP_SIZE_EXCLUDED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+    types.GetSetDescriptorType,
+    types.MemberDescriptorType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+)
+
+# A class statement makes a mutable heap type; static types and extension types made from a
+# type spec (most of the stdlib since 3.12) are immutable
+_IMMUTABLETYPE_FLAG = 1 << 8
+_HEAPTYPE_FLAG = 1 << 9
+
+_ATOMIC_TYPES = frozenset({int, float, complex, bool, str, bytes, bytearray, range, type(None)})
+
+# Objects shared process-wide: singletons and the cached small ints [-5, 256]
+_SHARED_OBJECT_IDS = frozenset(
+    [id(o) for o in (None, True, False, Ellipsis, NotImplemented, (), '', b'')] + [id(i) for i in range(-5, 257)]
+)
+
+# sys._is_interned() is Python 3.13+; older versions can't tell without interning the string
+_is_interned: Callable[[str], bool] = getattr(sys, '_is_interned', lambda s: False)
+
+
+def _slot_descriptors(t: type) -> list[Any]:
+    """Member descriptors for every __slots__ entry on t and its base classes."""
+    descriptors = []
+    for cls in t.__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = f'_{cls.__name__.lstrip("_")}{name}'
+            descriptors.append(cls.__dict__[name])
+    return descriptors
+
+
+def _builtin_base(t: type) -> type:
+    """The first class in t's MRO defined in C rather than Python (object for plain Python classes)."""
+    return next(c for c in t.__mro__ if c.__flags__ & _IMMUTABLETYPE_FLAG or not c.__flags__ & _HEAPTYPE_FLAG)
+
+
+def _dict_referents(d: dict) -> Iterable[Any]:
+    # gc.get_referents() skips the str keys of dicts, so walk the items explicitly
+    return chain.from_iterable(dict.items(d))
+
+
+def _excluded_referents(o: Any) -> Iterable[Any]:
+    # Marker handler for _DEEP_SIZE_EXCLUDED_TYPES; never called
+    return ()
+
+
+def _referents_handler(t: type) -> Callable[[Any], Iterable[Any]] | None:
+    """Build the function that returns an object's children for instances of type t."""
+    if t in _ATOMIC_TYPES:
+        return None
+    if issubclass(t, _DEEP_SIZE_EXCLUDED_TYPES):
+        return _excluded_referents
+
+    items: Callable[[Any], Iterable[Any]] | None
+    if issubclass(t, dict):
+        items = _dict_referents
+    elif issubclass(t, (list, tuple, set, frozenset)):
+        items = iter
+    else:
+        items = None
+
+    descriptors = _slot_descriptors(t)
+    has_dict = t.__dictoffset__ != 0
+
+    if not descriptors and not has_dict:
+        if items is not None:
+            return items
+        # Extension types (NumPy arrays, msgspec internals, ...) report their own references
+        return gc.get_referents
+
+    # A Python subclass of an extension type (deque, ndarray, ...) keeps its contents in the
+    # C base, which only gc.get_referents() can see; it also reports __dict__, so dedupe
+    from_gc = items is None and _builtin_base(t) is not object
+    if from_gc:
+        items = gc.get_referents
 
-    Uses recursive traversal with seen tracking to avoid double-counting.
+    def attribute_referents(o: Any) -> list[Any]:
+        children = list(items(o)) if items is not None else []
+        if has_dict:
+            children.append(o.__dict__)
+        for descriptor in descriptors:
+            try:
+                children.append(descriptor.__get__(o, t))
+            except AttributeError:
+                pass  # Unset slot
+        if from_gc:
+            return list({id(child): child for child in children}.values())
+        return children
+
+    return attribute_referents
+
+
+_REFERENTS_BY_TYPE: dict[type, Callable[[Any], Iterable[Any]] | None] = {}
+
+
+def measure_deep_size(obj: Any, skip_shared: bool = False) -> int:
     """
-    seen = set()
+    Measure the total memory of an object including all referenced objects.
 
-    def _get_size(o: Any) -> int:
-        # Avoid counting the same object twice
-        obj_id = id(o)
-        if obj_id in seen:
-            return 0
-        seen.add(obj_id)
+    Walks the object graph iteratively (no recursion limit) using a per-type
+    dispatch table, counting each object once with sys.getsizeof. Classes,
+    modules, functions and descriptors are shared program structure and are not counted.
 
-        size = sys.getsizeof(o)
+    Args:
+        obj: Root of the object graph
+        skip_shared: Don't count objects shared process-wide (None/True/False,
+            cached small ints, interned strings), as they cost nothing extra per reference
 
-        # Recursively get size of contents
-        if isinstance(o, dict):
-            size += sum(_get_size(k) + _get_size(v) for k, v in o.items())
-        elif isinstance(o, (list, tuple, set, frozenset)):
-            size += sum(_get_size(item) for item in o)
-        elif hasattr(o, '__dict__'):
-            size += _get_size(o.__dict__)
-        elif hasattr(o, '__slots__'):
-            size += sum(_get_size(getattr(o, slot)) for slot in o.__slots__ if hasattr(o, slot))
+    Returns:
+        Total size in bytes
+    """
+    handlers = _REFERENTS_BY_TYPE
+    getsizeof = sys.getsizeof
+    seen: set[int] = set(_SHARED_OBJECT_IDS) if skip_shared else set()
+    seen_add = seen.add
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    total = 0
+
+    while stack:
+        o = pop()
+        oid = id(o)
+        if oid in seen:
+            continue
+        seen_add(oid)
+
+        t = type(o)
+        try:
+            handler = handlers[t]
+        except KeyError:
+            handler = handlers[t] = _referents_handler(t)
 
-        return size
+        if handler is None:
+            if skip_shared and t is str and _is_interned(o):
+                continue
+            total += getsizeof(o)
+        elif handler is _excluded_referents:
+            if o is obj:
+                total += getsizeof(o)
+        else:
+            total += getsizeof(o)
+            extend(handler(o))
 
-    return _get_size(obj)
+    return total
 
 
 def measure_process_memory_mb() -> float:
@@ -284,6 +419,134 @@ def measure_process_memory_mb() -> float:
         return usage.ru_maxrss / 1024
 
 
+def measure_rss_bytes() -> int:
+    """
+    Measure the current resident set size (RSS) of this process in bytes.
+
+    Unlike measure_process_memory_mb() this is the current value, not the peak,
+    so it can be used to take before/after deltas.
+    """
+    import psutil
+
+    return psutil.Process().memory_info().rss
+
+
+def measure_traced_allocation(build: Callable[[], Any]) -> tuple[Any, int]:
+    """
+    Call build() under tracemalloc and return (result, net bytes allocated).
+
+    The result is returned so the caller keeps it alive while using the number.
+    """
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, after - before
+
+
+def measure_allocated_size(expr: str, count: int = 100_000, setup: str = '') -> tuple[float, float] | None:
+    """
+    Measure the real memory cost of one object by allocating many and dividing by count.
+
+    Unlike sys.getsizeof this includes GC headers, allocator size-class rounding
+    and sharing (cached small ints and interned strings cost ~0 bytes each).
+    Runs in a fresh subprocess so memory freed by earlier measurements
+    can't be reused and hide from the RSS delta.
+
+    Args:
+        expr: Expression evaluated for i in range(count); must build a new object
+        count: Number of objects to allocate
+        setup: Code run before measuring (e.g. helper definitions used by expr)
+
+    Returns:
+        (tracemalloc bytes per object, RSS bytes per object), or None (after
+        printing the error) if the subprocess fails
+    """
+    import subprocess
+
+    code = f"""
+import gc
+import json
+import tracemalloc
+
+import psutil
+
+{setup}
+
+count = {count}
+process = psutil.Process()
+
+# Pre-size the holder so its own growth isn't counted
+holder = [None] * count
+
+# Pass 1: RSS delta (tracemalloc's bookkeeping would inflate RSS, so it's off here)
+gc.collect()
+rss_before = process.memory_info().rss
+for i in range(count):
+    holder[i] = {expr}
+rss_delta = process.memory_info().rss - rss_before
+
+for i in range(count):
+    holder[i] = None
+
+# Pass 2: tracemalloc delta
+gc.collect()
+tracemalloc.start()
+before, _ = tracemalloc.get_traced_memory()
+for i in range(count):
+    holder[i] = {expr}
+after, _ = tracemalloc.get_traced_memory()
+
+print(json.dumps([(after - before) / count, rss_delta / count]))
+"""
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        stderr = result.stderr.strip()
+        print_error(f'allocated size of {expr!r}: {stderr.splitlines()[-1] if stderr else "no output"}')
+        return None
+
+    traced, rss = json.loads(result.stdout)
+    return traced, rss
+
+
+def measure_allocated_results(
+    name: str,
+    expr: str,
+    count: int = 100_000,
+    setup: str = '',
+    category: str = 'memory',
+) -> list[MemoryResult]:
+    """
+    Measure allocated size per object, print it, and return it as results.
+
+    Produces `{name}_allocated` (tracemalloc) and `{name}_allocated_rss` results,
+    meant to sit next to the sys.getsizeof() result for the same object.
+    No results if the measurement fails.
+    """
+    measured = measure_allocated_size(expr, count, setup)
+    if measured is None:
+        return []
+    traced, rss = measured
+    print_memory_result('  └─ allocated (tracemalloc)', round(traced))
+    print_memory_result('  └─ allocated (RSS)', round(rss))
+    return [
+        MemoryResult(name=f'{name}_allocated', value=traced, unit='bytes', category=category),
+        MemoryResult(name=f'{name}_allocated_rss', value=rss, unit='bytes', category=category),
+    ]
+
+
 # =============================================================================
 # Output Formatting
 # =============================================================================
@@ -457,6 +720,33 @@ def run_benchmarks(
     return results
 
 
+def run_script_json(script: str, args: list[str], timeout: float = 600) -> Any | None:
+    """
+    Run a Python script in a fresh interpreter and parse the JSON on its last line of output.
+
+    Used by benchmarks that need a clean process per measurement (e.g. RSS deltas).
+    Prints an error and returns None if the script fails or runs past `timeout` seconds.
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            [sys.executable, script, *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        print_error(f'{" ".join(args)}: timed out after {timeout:g}s')
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        stderr = result.stderr.strip()
+        print_error(f'{" ".join(args)}: {stderr.splitlines()[-1] if stderr else "no output"}')
+        return None
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
 def collect_results(
     category: str,
     results: list[BenchmarkResult | MemoryResult],
@@ -0,0 +1,26 @@
+"""Tests for measure_deep_size (run with: python -m pytest code/utils)."""
+
+import sys
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import measure_deep_size
+
+ITEMS = [f'item {i}' * 10 for i in range(100)]
+
+
+class DequeSubclass(deque):
+    pass
+
+
+def test_deque_subclass_counts_items():
+    plain = measure_deep_size(deque(ITEMS))
+    subclass = DequeSubclass(ITEMS)
+    subclass.label = 'subclass'
+
+    expected = plain + sys.getsizeof(subclass) - sys.getsizeof(deque(ITEMS))
+    size = measure_deep_size(subclass)
+    assert size >= expected + sys.getsizeof(subclass.label)
+    assert size - expected < 1024  # The __dict__ and its one entry, each counted once
@@ -2,14 +2,29 @@
 #
 # This module contains minimal web apps for benchmarking.
 # All frameworks run on Granian for consistent, fair comparison.
-# Requires external tools (wrk or hey) to measure request throughput.
+# Measures request throughput with wrk or hey, or the built-in load generator.
 #
 # Usage:
 #   1. Start a server: python run_server.py flask
 #   2. Benchmark: wrk -t4 -c100 -d10s http://127.0.0.1:8000/
-#   3. Or run all: python benchmark_servers.py
+#   3. Or run all: python benchmark_servers.py [--pin | --parallel 3]  (disjoint server/load CPU sets)
+#      run_all pins one partition; WEB_BENCH_PARALLEL=1 runs frameworks concurrently on big hosts
+#   4. Without wrk: python load_generator.py http://127.0.0.1:8000/ -c 100 -d 10 [--no-keepalive]
+#   5. Framework overhead without a server: python in_process.py
+#   6. Worker/thread scaling sweep: python scaling_sweep.py --workers 1 2 4 8
+#   7. Every framework on every server: python server_matrix.py
+#   8. Cold start (spawn to first response, worker RSS): python cold_start.py
+#   9. Payload sizes (/json, /fast, /text at 100 B-1 MB): python payload_matrix.py [--in-process]
+#  10. POST body validation (pydantic, msgspec, hand-written): python body_validation.py [--in-process]
+#  11. Sync vs async handlers (threadpool, blocking SQLite, Django ASGI): python sync_async.py
+#  12. Middleware depth and route table size (in-process): python app_scaling.py
+#  13. Streaming (chunked, SSE) and WebSockets (echo, broadcast): python streaming.py
+#      WebSocket load alone: python ws_load.py ws://127.0.0.1:8000/ws/echo -c 100 -d 10
+#  14. SQLite-backed endpoints (raw sqlite3, Django ORM; connection reuse): python db_endpoints.py [--in-process]
+#  15. Static files (1 KB-100 MB file responses vs Granian static, zero-copy check): python file_serving.py
+#  16. Keep-alive vs connection-per-request vs HTTP/2 (h2c, needs h2load): python connection_modes.py
 #
-# Frameworks (all on Granian):
+# Frameworks (Granian by default; server_matrix.py adds uvicorn, gunicorn, hypercorn):
 #   - Flask     (WSGI)
 #   - Django    (WSGI)
 #   - FastAPI   (ASGI)
@@ -18,9 +33,11 @@
 
 from . import django_app, fastapi_app, flask_app, litestar_app, run_server, starlette_app
 from .benchmarks import run_benchmarks
+from .in_process import run_benchmarks as run_in_process_benchmarks
 
 __all__ = [
     'run_benchmarks',
+    'run_in_process_benchmarks',
     'django_app',
     'fastapi_app',
     'flask_app',
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Middleware stack and routing table scaling, measured in-process.
+
+The benchmark apps have a handful of routes and no middleware. Here each
+framework is rebuilt (app_variants.py) with:
+- 0, 5 and 20 middleware layers at 10 routes -> marginal cost per layer
+- 10, 100 and 1000 static + parametrized routes, no middleware -> whether the
+  router is O(1) or O(n), requesting the last route registered
+
+Each variant is built and timed in a fresh interpreter, since middleware and
+Django settings cannot be torn down in-process. Requests go through
+in_process.py (no sockets), so the differences are pure framework cost.
+
+Usage:
+    python app_scaling.py [--frameworks flask fastapi] [--iterations 2000]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    collect_results,
+    print_comparison_table,
+    print_header,
+    print_subheader,
+    run_script_json,
+)
+
+from web_frameworks.app_variants import BUILDERS, build_app, target_paths
+from web_frameworks.benchmark_servers import SERVERS
+from web_frameworks.in_process import measure_request
+
+CATEGORY = 'web_app_scaling'
+DEFAULT_ITERATIONS = 2_000
+
+MIDDLEWARE_LEVELS = [0, 5, 20]
+ROUTE_LEVELS = [10, 100, 1000]
+BASE_ROUTES = 10
+
+
+def measure_variant(framework: str, middleware: int, routes: int, iterations: int) -> dict[str, float]:
+    """Build one variant and time its static and parametrized target routes (ms per request)."""
+    server = next(s for s in SERVERS if s.name == framework)
+    app = build_app(framework, middleware, routes)
+    static_path, param_path = target_paths(routes)
+    return {
+        'static_ms': measure_request(server, app, static_path, iterations),
+        'param_ms': measure_request(server, app, param_path, iterations),
+    }
+
+
+def run_variant(framework: str, middleware: int, routes: int, iterations: int) -> dict[str, float] | None:
+    """measure_variant in a fresh interpreter."""
+    print(f'  {framework}: {middleware} middleware, {routes} routes')
+    return run_script_json(
+        __file__,
+        [
+            '--measure',
+            framework,
+            '--middleware',
+            str(middleware),
+            '--routes',
+            str(routes),
+            '--iterations',
+            str(iterations),
+        ],
+    )
+
+
+def fmt_us(ms: float | None) -> str:
+    return f'{ms * 1000:.1f} µs' if ms is not None else '-'
+
+
+def run_benchmarks(iterations: int = DEFAULT_ITERATIONS, frameworks: list[str] | None = None) -> dict:
+    """Sweep middleware depth and route count per framework."""
+    print_header('Middleware and Routing Scaling (In-Process)')
+    print(f'  ({iterations:,} requests per run, median of 5 runs)')
+
+    names = [name for name in BUILDERS if not frameworks or name in frameworks]
+    variants = [(m, BASE_ROUTES) for m in MIDDLEWARE_LEVELS] + [(0, r) for r in ROUTE_LEVELS if r != BASE_ROUTES]
+
+    print_subheader('Measuring')
+    measured: dict[str, dict[tuple[int, int], dict[str, float]]] = {}
+    for name in names:
+        for middleware, routes in variants:
+            timing = run_variant(name, middleware, routes, iterations)
+            if timing is not None:
+                measured.setdefault(name, {})[(middleware, routes)] = timing
+
+    results: list[BenchmarkResult] = []
+    for name, by_variant in measured.items():
+        for m in MIDDLEWARE_LEVELS:
+            if (m, BASE_ROUTES) in by_variant:
+                value = by_variant[(m, BASE_ROUTES)]['static_ms']
+                results.append(BenchmarkResult(name=f'{name}_middleware_{m}', value=value, category=CATEGORY))
+        for r in ROUTE_LEVELS:
+            if (0, r) in by_variant:
+                for kind in ('static', 'param'):
+                    value = by_variant[(0, r)][f'{kind}_ms']
+                    results.append(BenchmarkResult(name=f'{name}_routes_{r}_{kind}', value=value, category=CATEGORY))
+
+    print_subheader(f'Middleware layers (GET static route, {BASE_ROUTES} routes)')
+    rows = []
+    for name, by_variant in measured.items():
+        times = [by_variant.get((m, BASE_ROUTES), {}).get('static_ms') for m in MIDDLEWARE_LEVELS]
+        first, last = times[0], times[-1]
+        per_layer = (last - first) / (MIDDLEWARE_LEVELS[-1] - MIDDLEWARE_LEVELS[0]) if first and last else None
+        rows.append([name, *(fmt_us(t) for t in times), fmt_us(per_layer)])
+    print_comparison_table(['Framework', *(f'{m} layers' for m in MIDDLEWARE_LEVELS), 'Per layer'], rows)
+
+    print_subheader('Route table size (GET last route, no middleware)')
+    rows = []
+    for name, by_variant in measured.items():
+        row = [name]
+        for kind in ('static', 'param'):
+            times = [by_variant.get((0, r), {}).get(f'{kind}_ms') for r in ROUTE_LEVELS]
+            row.extend(fmt_us(t) for t in times)
+            row.append(f'{times[-1] / times[0]:.1f}x' if times[0] and times[-1] else '-')
+        rows.append(row)
+    growth = f'{ROUTE_LEVELS[-1]}/{ROUTE_LEVELS[0]}'
+    print_comparison_table(
+        [
+            'Framework',
+            *(f'static {r}' for r in ROUTE_LEVELS),
+            growth,
+            *(f'param {r}' for r in ROUTE_LEVELS),
+            growth,
+        ],
+        rows,
+    )
+    print(f'  {growth} near 1x: lookup is O(1); clearly above 1x: the router scans its table (O(n))')
+
+    return collect_results(CATEGORY, results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark middleware depth and route table size per framework')
+    parser.add_argument(
+        '--iterations',
+        '-n',
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help=f'Requests per timing run (default: {DEFAULT_ITERATIONS:,})',
+    )
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=list(BUILDERS),
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument('--measure', choices=list(BUILDERS), help='Measure one variant and print JSON (internal)')
+    parser.add_argument('--middleware', type=int, default=0, help='Middleware layers for --measure')
+    parser.add_argument('--routes', type=int, default=BASE_ROUTES, help='Routes of each kind for --measure')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_variant(args.measure, args.middleware, args.routes, args.iterations)))
+        return
+
+    results = run_benchmarks(iterations=args.iterations, frameworks=args.frameworks)
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
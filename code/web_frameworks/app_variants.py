@@ -0,0 +1,243 @@
+"""
+Configurable app variants for the middleware and routing scaling benchmark.
+
+build_app(framework, middleware, routes) returns a WSGI/ASGI app with:
+- `middleware` layers, each written the framework's usual way and each adding
+  one response header (X-Layer-<n>)
+- `routes` static routes (/r<i>) and `routes` parametrized routes (/p<i>/<int>),
+  each with its own handler returning a small JSON dict
+
+target_paths(routes) gives the last-registered route of each kind, the worst
+case for a router that scans its table in order.
+
+Framework imports happen inside the builders, so only the framework under test
+needs to be installed. Django settings are process-global: build at most one
+Django variant per process.
+"""
+
+from typing import Any
+
+DJANGO_SECRET_KEY = 'benchmark-secret-key-not-for-production'
+
+# ROOT_URLCONF for the Django variant, filled in by build_django
+urlpatterns: list = []
+
+
+def target_paths(routes: int) -> tuple[str, str]:
+    """(static path, parametrized path) of the last route registered."""
+    return f'/r{routes - 1}', f'/p{routes - 1}/42'
+
+
+# =============================================================================
+# Flask
+# =============================================================================
+
+
+def build_flask(middleware: int, routes: int) -> Any:
+    from flask import Flask, jsonify
+
+    app = Flask(__name__)
+
+    def header_hook(n: int):
+        def add_header(response):
+            response.headers[f'X-Layer-{n}'] = '1'
+            return response
+
+        return add_header
+
+    for n in range(middleware):
+        app.after_request(header_hook(n))
+
+    def static_view(i: int):
+        return lambda: jsonify({'route': i})
+
+    def param_view(i: int):
+        return lambda item_id: jsonify({'route': i, 'item_id': item_id})
+
+    for i in range(routes):
+        app.add_url_rule(f'/r{i}', endpoint=f'r{i}', view_func=static_view(i))
+        app.add_url_rule(f'/p{i}/<int:item_id>', endpoint=f'p{i}', view_func=param_view(i))
+
+    return app
+
+
+# =============================================================================
+# Django
+# =============================================================================
+
+
+class DjangoHeaderMiddleware:
+    """Function-style Django middleware; each instance in MIDDLEWARE is one layer."""
+
+    instances = 0
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header = f'X-Layer-{DjangoHeaderMiddleware.instances}'
+        DjangoHeaderMiddleware.instances += 1
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        response[self.header] = '1'
+        return response
+
+
+def build_django(middleware: int, routes: int) -> Any:
+    import django
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.http import JsonResponse
+    from django.urls import clear_url_caches, path
+
+    if not settings.configured:
+        settings.configure(DEBUG=False, SECRET_KEY=DJANGO_SECRET_KEY, ALLOWED_HOSTS=['*'])
+        django.setup()
+
+    # Importing the web_frameworks package configures settings for django_app; point them here instead
+    settings.ROOT_URLCONF = __name__
+    settings.MIDDLEWARE = [f'{__name__}.DjangoHeaderMiddleware'] * middleware
+
+    def static_view(i: int):
+        return lambda request: JsonResponse({'route': i})
+
+    def param_view(i: int):
+        return lambda request, item_id: JsonResponse({'route': i, 'item_id': item_id})
+
+    urlpatterns[:] = [
+        pattern
+        for i in range(routes)
+        for pattern in (path(f'r{i}', static_view(i)), path(f'p{i}/<int:item_id>', param_view(i)))
+    ]
+    clear_url_caches()
+    return WSGIHandler()
+
+
+# =============================================================================
+# FastAPI and Starlette
+# =============================================================================
+
+
+def header_dispatch(n: int):
+    """BaseHTTPMiddleware dispatch function, the documented way to write middleware for both."""
+
+    async def dispatch(request, call_next):
+        response = await call_next(request)
+        response.headers[f'X-Layer-{n}'] = '1'
+        return response
+
+    return dispatch
+
+
+def build_fastapi(middleware: int, routes: int) -> Any:
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    for n in range(middleware):
+        app.middleware('http')(header_dispatch(n))
+
+    def static_handler(i: int):
+        async def handler():
+            return {'route': i}
+
+        return handler
+
+    def param_handler(i: int):
+        async def handler(item_id: int):
+            return {'route': i, 'item_id': item_id}
+
+        return handler
+
+    for i in range(routes):
+        app.add_api_route(f'/r{i}', static_handler(i), methods=['GET'])
+        app.add_api_route(f'/p{i}/{{item_id}}', param_handler(i), methods=['GET'])
+
+    return app
+
+
+def build_starlette(middleware: int, routes: int) -> Any:
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.base import BaseHTTPMiddleware
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    def static_endpoint(i: int):
+        async def endpoint(request):
+            return JSONResponse({'route': i})
+
+        return endpoint
+
+    def param_endpoint(i: int):
+        async def endpoint(request):
+            return JSONResponse({'route': i, 'item_id': request.path_params['item_id']})
+
+        return endpoint
+
+    route_list = [
+        route
+        for i in range(routes)
+        for route in (Route(f'/r{i}', static_endpoint(i)), Route(f'/p{i}/{{item_id:int}}', param_endpoint(i)))
+    ]
+    return Starlette(
+        routes=route_list,
+        middleware=[Middleware(BaseHTTPMiddleware, dispatch=header_dispatch(n)) for n in range(middleware)],
+    )
+
+
+# =============================================================================
+# Litestar
+# =============================================================================
+
+
+def litestar_header_middleware(n: int):
+    """Litestar middleware factory (called with app=) wrapping `send` to add a header."""
+    from litestar.datastructures import MutableScopeHeaders
+
+    def factory(app):
+        async def middleware(scope, receive, send):
+            async def send_wrapper(message):
+                if message['type'] == 'http.response.start':
+                    MutableScopeHeaders.from_message(message)[f'X-Layer-{n}'] = '1'
+                await send(message)
+
+            await app(scope, receive, send_wrapper)
+
+        return middleware
+
+    return factory
+
+
+def build_litestar(middleware: int, routes: int) -> Any:
+    from litestar import Litestar, get
+
+    def static_handler(i: int):
+        async def handler() -> dict:
+            return {'route': i}
+
+        return get(f'/r{i}')(handler)
+
+    def param_handler(i: int):
+        async def handler(item_id: int) -> dict:
+            return {'route': i, 'item_id': item_id}
+
+        return get(f'/p{i}/{{item_id:int}}')(handler)
+
+    handlers = [handler for i in range(routes) for handler in (static_handler(i), param_handler(i))]
+    return Litestar(
+        handlers,
+        middleware=[litestar_header_middleware(n) for n in range(middleware)],
+        openapi_config=None,
+    )
+
+
+BUILDERS = {
+    'flask': build_flask,
+    'django': build_django,
+    'fastapi': build_fastapi,
+    'starlette': build_starlette,
+    'litestar': build_litestar,
+}
+
+
+def build_app(framework: str, middleware: int = 0, routes: int = 10) -> Any:
+    return BUILDERS[framework](middleware, routes)
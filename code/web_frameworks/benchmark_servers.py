@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 """
-Benchmark web framework servers using wrk or hey.
+Benchmark web framework servers using wrk, hey, or the built-in load generator.
 
 All frameworks run on Granian for consistent, fair comparison.
 Granian supports both WSGI (Flask, Django) and ASGI (FastAPI, Starlette, Litestar).
 
 Prerequisites:
-    brew install wrk   # or: brew install hey
+    brew install wrk   # or: brew install hey, or use --tool builtin (no install needed)
 
 Usage:
-    python benchmark_servers.py [--tool wrk|hey] [--duration 10] [--connections 100]
+    python benchmark_servers.py [--tool wrk|hey|builtin] [--duration 10] [--connections 100]
+    python benchmark_servers.py --tool builtin --rates 1000 2000 4000 8000   # open-loop latency curve
+    python benchmark_servers.py --pin           # server and load generator on disjoint CPU sets
+    python benchmark_servers.py --parallel 3    # three frameworks at once, each on its own ports and cores
 
 The script will:
     1. Start each server with Granian
@@ -20,14 +23,18 @@ The script will:
 """
 
 import argparse
+import importlib.util
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
 import time
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 # Add parent to path for imports
@@ -35,10 +42,22 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.benchmark import print_header, print_subheader
 
+from web_frameworks.load_generator import (
+    PERCENTILES,
+    LoadConfig,
+    find_saturation,
+    latency_curve,
+    print_load_result,
+    run_load,
+    sweep_rates,
+)
+
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
 DEFAULT_WORKERS = 4
 DEFAULT_PORT = 8000
+GTHREAD_THREADS = 4
+CLIENT_SHARE = 0.5  # Fraction of each core partition given to the load generator
 
 
 @dataclass
@@ -46,6 +65,9 @@ class ServerConfig:
     name: str
     module: str
     interface: str  # "wsgi" or "asgi"
+    server: str = 'granian'  # "granian", "uvicorn", "gunicorn" or "hypercorn"
+    worker_class: str | None = None  # gunicorn only: "sync", "gthread" or "uvicorn.workers.UvicornWorker"
+    loop: str | None = None  # Event loop for ASGI, e.g. "uvloop" (server default if None)
 
 
 SERVERS = [
@@ -57,6 +79,43 @@ SERVERS = [
 ]
 
 
+@dataclass
+class ServerVariant:
+    """A server + worker class + loop combination that framework apps can run on."""
+
+    label: str
+    server: str
+    interfaces: tuple[str, ...]
+    worker_class: str | None = None
+    loop: str | None = None
+
+    def apply(self, app: ServerConfig) -> ServerConfig:
+        return replace(app, server=self.server, worker_class=self.worker_class, loop=self.loop)
+
+    def is_installed(self) -> bool:
+        if self.worker_class == 'uvicorn.workers.UvicornWorker' and not check_tool('uvicorn'):
+            return False
+        if self.loop and importlib.util.find_spec(self.loop) is None:
+            return False  # The server fails to start without the loop package
+        return check_tool(self.server)
+
+
+SERVER_VARIANTS = [
+    ServerVariant(label='granian', server='granian', interfaces=('wsgi', 'asgi')),
+    ServerVariant(label='granian-uvloop', server='granian', interfaces=('asgi',), loop='uvloop'),
+    ServerVariant(label='uvicorn', server='uvicorn', interfaces=('asgi',)),
+    ServerVariant(label='gunicorn-sync', server='gunicorn', interfaces=('wsgi',), worker_class='sync'),
+    ServerVariant(label='gunicorn-gthread', server='gunicorn', interfaces=('wsgi',), worker_class='gthread'),
+    ServerVariant(
+        label='gunicorn-uvicorn',
+        server='gunicorn',
+        interfaces=('asgi',),
+        worker_class='uvicorn.workers.UvicornWorker',
+    ),
+    ServerVariant(label='hypercorn', server='hypercorn', interfaces=('asgi',)),
+]
+
+
 @dataclass
 class BenchmarkResult:
     name: str
@@ -65,11 +124,103 @@ class BenchmarkResult:
     latency_p99: str | None = None
     transfer_per_sec: str | None = None
     errors: int = 0
+    details: dict | None = None
+
+    def latency_ms(self, key: str) -> float | None:
+        """Latency from details, e.g. 'mean', 'p50', 'p99.9'; None if the tool did not report it."""
+        return ((self.details or {}).get('latency_ms') or {}).get(key)
+
+
+@dataclass
+class CorePartition:
+    """Disjoint CPU sets for one server and its load generator, and the port the server listens on."""
+
+    server_cpus: list[int]
+    client_cpus: list[int]
+    port: int
+
+
+def available_cpus() -> list[int]:
+    """CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
 
+def can_pin() -> bool:
+    """CPU affinity needs sched_setaffinity (Linux); elsewhere everything runs unpinned."""
+    return hasattr(os, 'sched_setaffinity')
 
-def get_granian_command(server: ServerConfig, port: int, workers: int) -> list[str]:
-    """Build granian command for a server."""
+
+def partition_cores(
+    partitions: int = 1, port: int = DEFAULT_PORT, client_share: float = CLIENT_SHARE
+) -> list[CorePartition]:
+    """
+    Split the available CPUs into `partitions` equal slices on consecutive ports.
+
+    Each slice is divided between server and load generator, so neither
+    competes with the other or with a neighbouring partition.
+    """
+    cpus = available_cpus()
+    size = len(cpus) // partitions
+    if size < 2:
+        raise ValueError(f'{partitions} partition(s) need at least {2 * partitions} CPUs, found {len(cpus)}')
+
+    client_count = min(max(1, int(size * client_share)), size - 1)
     return [
+        CorePartition(
+            server_cpus=cpus[i * size + client_count : (i + 1) * size],
+            client_cpus=cpus[i * size : i * size + client_count],
+            port=port + i,
+        )
+        for i in range(partitions)
+    ]
+
+
+def format_cpus(cpus: list[int]) -> str:
+    return ','.join(map(str, cpus))
+
+
+def parse_cpus(text: str) -> list[int]:
+    """Parse a taskset-style CPU list, e.g. "0-3,8"."""
+    cpus = []
+    for part in text.split(','):
+        first, _, last = part.partition('-')
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+@contextmanager
+def cpu_affinity(cpus: list[int] | None) -> Iterator[None]:
+    """Pin this process, and every process it starts meanwhile, to `cpus`; restore the old set afterwards."""
+    if not cpus or not can_pin():
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def get_granian_command(
+    server: ServerConfig,
+    port: int,
+    workers: int,
+    runtime_threads: int | None = None,
+    websockets: bool = False,
+    static_dir: Path | None = None,
+    http: str | None = None,
+) -> list[str]:
+    """
+    Build granian command for a server. WebSockets stay off unless a benchmark needs them.
+
+    With `static_dir`, Granian itself serves that directory under /static, without calling the app.
+    `http` pins the protocol ("1" or "2"; "2" without TLS is h2c with prior knowledge).
+    """
+    cmd = [
         'granian',
         '--interface',
         server.interface,
@@ -79,11 +230,47 @@ def get_granian_command(server: ServerConfig, port: int, workers: int) -> list[s
         str(port),
         '--workers',
         str(workers),
-        '--no-ws',  # Disable websockets for simpler benchmarking
-        # '--loop',
-        # 'uvloop',
-        server.module,
     ]
+    if not websockets:
+        cmd.append('--no-ws')  # Disable websockets for simpler benchmarking
+    if server.loop:
+        cmd += ['--loop', server.loop]
+    if runtime_threads:
+        cmd += ['--runtime-threads', str(runtime_threads)]
+    if static_dir:
+        cmd += ['--static-path-route', '/static', '--static-path-mount', str(static_dir)]
+    if http:
+        cmd += ['--http', http]
+    return [*cmd, server.module]
+
+
+def get_server_command(server: ServerConfig, port: int, workers: int) -> list[str]:
+    """Build the command for whichever server `server.server` names."""
+    bind = f'127.0.0.1:{port}'
+
+    if server.server == 'granian':
+        return get_granian_command(server, port, workers)
+
+    if server.server == 'uvicorn':
+        cmd = ['uvicorn', server.module, '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers)]
+        if server.loop:
+            cmd += ['--loop', server.loop]
+        return [*cmd, '--no-access-log', '--log-level', 'warning']
+
+    if server.server == 'gunicorn':
+        cmd = ['gunicorn', server.module, '--bind', bind, '--workers', str(workers)]
+        cmd += ['--worker-class', server.worker_class or 'sync']
+        if server.worker_class == 'gthread':
+            cmd += ['--threads', str(GTHREAD_THREADS)]
+        return [*cmd, '--log-level', 'warning']
+
+    if server.server == 'hypercorn':
+        cmd = ['hypercorn', server.module, '--bind', bind, '--workers', str(workers)]
+        if server.loop:
+            cmd += ['--worker-class', server.loop]
+        return [*cmd, '--log-level', 'warning']
+
+    raise ValueError(f'Unknown server: {server.server}')
 
 
 def check_tool(tool: str) -> bool:
@@ -105,20 +292,128 @@ def wait_for_server(port: int, timeout: float = 15.0) -> bool:
     return False
 
 
-def run_wrk(port: int, duration: int, connections: int, threads: int) -> BenchmarkResult | None:
-    """Run wrk benchmark and parse results."""
-    url = f'http://127.0.0.1:{port}/'
+# wrk calls done() once after the run, with latency statistics in microseconds
+WRK_REPORT_LUA = """
+done = function(summary, latency, requests)
+  local percentiles = {}
+  for _, p in ipairs({%(percentiles)s}) do
+    table.insert(percentiles, string.format('"p%%g": %%d', p, latency:percentile(p)))
+  end
+  local errors = summary.errors
+  local f = io.open([==[%(report_path)s]==], "w")
+  f:write(string.format(
+    '{"requests": %%d, "duration_us": %%d, "bytes": %%d, '
+      .. '"latency_us": {"mean": %%.2f, "stdev": %%.2f, "min": %%d, "max": %%d, %%s}, '
+      .. '"errors": {"connect": %%d, "read": %%d, "write": %%d, "timeout": %%d, "status": %%d}}',
+    summary.requests, summary.duration, summary.bytes,
+    latency.mean, latency.stdev, latency.min, latency.max, table.concat(percentiles, ", "),
+    errors.connect, errors.read, errors.write, errors.timeout, errors.status
+  ))
+  f:close()
+end
+"""
+
+
+def write_wrk_script(report_path: str, body: bytes | None = None) -> str:
+    """
+    Write a wrk Lua script that reports JSON to `report_path`; returns its path.
+
+    The report has the full percentile spectrum (PERCENTILES) and wrk's error
+    breakdown. With `body`, the script also POSTs it as JSON.
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.lua', delete=False) as f:
+        if body:
+            f.write('wrk.method = "POST"\n')
+            f.write('wrk.headers["Content-Type"] = "application/json"\n')
+            f.write(f'wrk.body = [==[{body.decode()}]==]\n')
+        f.write(WRK_REPORT_LUA % {'percentiles': ', '.join(f'{p:g}' for p in PERCENTILES), 'report_path': report_path})
+        return f.name
+
+
+def parse_wrk_report(report: dict) -> BenchmarkResult | None:
+    """Convert a WRK_REPORT_LUA report into a result whose details match LoadResult.summary()."""
+    duration_s = report['duration_us'] / 1e6
+    if not report['requests'] or not duration_s:
+        return None
+    latency_ms = {name: value / 1000 for name, value in report['latency_us'].items()}
+    errors = {kind: n for kind, n in report['errors'].items() if n}
+    return BenchmarkResult(
+        name='',
+        requests_per_sec=report['requests'] / duration_s,
+        latency_avg=f'{latency_ms["mean"]:.2f}ms',
+        latency_p99=f'{latency_ms["p99"]:.2f}ms',
+        transfer_per_sec=f'{report["bytes"] / duration_s / 1024 / 1024:.2f}MB',
+        errors=sum(errors.values()),
+        details={
+            'requests': report['requests'],
+            'duration_s': duration_s,
+            'requests_per_sec': report['requests'] / duration_s,
+            'bytes_per_sec': report['bytes'] / duration_s,
+            'errors': errors,
+            'latency_ms': latency_ms,
+        },
+    )
+
+
+def run_wrk(
+    port: int,
+    duration: int,
+    connections: int,
+    threads: int,
+    path: str = '/',
+    body: bytes | None = None,
+) -> BenchmarkResult | None:
+    """Run wrk with a JSON reporting script. With `body`, POSTs it as JSON."""
+    url = f'http://127.0.0.1:{port}{path}'
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = Path(tmp) / 'report.json'
+        script = write_wrk_script(str(report_path), body)
+        try:
+            # Warmup
+            subprocess.run(
+                ['wrk', '-t1', '-c10', '-d2s', '-s', script, url],
+                capture_output=True,
+                text=True,
+            )
+            report_path.unlink(missing_ok=True)
+
+            # Actual benchmark
+            result = subprocess.run(
+                ['wrk', f'-t{threads}', f'-c{connections}', f'-d{duration}s', '--latency', '-s', script, url],
+                capture_output=True,
+                text=True,
+            )
+        finally:
+            os.unlink(script)
+
+        print(result.stdout)
+        if not report_path.exists():
+            print(result.stderr)
+            return None
+        return parse_wrk_report(json.loads(report_path.read_text()))
+
+
+def run_hey(
+    port: int,
+    duration: int,
+    connections: int,
+    path: str = '/',
+    body: bytes | None = None,
+) -> BenchmarkResult | None:
+    """Run hey benchmark and parse results. With `body`, POSTs it as JSON."""
+    url = f'http://127.0.0.1:{port}{path}'
+    body_args = ['-m', 'POST', '-T', 'application/json', '-d', body.decode()] if body else []
 
     # Warmup
     subprocess.run(
-        ['wrk', '-t1', '-c10', '-d2s', url],
+        ['hey', '-n', '1000', '-c', '10', *body_args, url],
         capture_output=True,
         text=True,
     )
 
     # Actual benchmark
     result = subprocess.run(
-        ['wrk', f'-t{threads}', f'-c{connections}', f'-d{duration}s', '--latency', url],
+        ['hey', '-z', f'{duration}s', '-c', str(connections), *body_args, url],
         capture_output=True,
         text=True,
     )
@@ -126,60 +421,170 @@ def run_wrk(port: int, duration: int, connections: int, threads: int) -> Benchma
     output = result.stdout
     print(output)
 
-    # Parse results
+    # Parse results; hey reports every latency in seconds
     rps_match = re.search(r'Requests/sec:\s+([\d.]+)', output)
-    latency_match = re.search(r'Latency\s+([\d.]+\w+)', output)
-    p99_match = re.search(r'99%\s+([\d.]+\w+)', output)
-    transfer_match = re.search(r'Transfer/sec:\s+([\d.]+\w+)', output)
-    errors_match = re.search(r'Socket errors:.*?(\d+) total', output)
+    latency_match = re.search(r'Average:\s+([\d.]+)', output)
 
     if rps_match and latency_match:
+        latency_ms = {'mean': float(latency_match.group(1)) * 1000}
+        for name, pattern in (('min', r'Fastest:\s+([\d.]+)'), ('max', r'Slowest:\s+([\d.]+)')):
+            match = re.search(pattern, output)
+            if match:
+                latency_ms[name] = float(match.group(1)) * 1000
+        for p, secs in re.findall(r'([\d.]+)% in ([\d.]+) secs', output):
+            latency_ms[f'p{float(p):g}'] = float(secs) * 1000
+        p99 = latency_ms.get('p99')
         return BenchmarkResult(
             name='',
             requests_per_sec=float(rps_match.group(1)),
-            latency_avg=latency_match.group(1),
-            latency_p99=p99_match.group(1) if p99_match else None,
-            transfer_per_sec=transfer_match.group(1) if transfer_match else None,
-            errors=int(errors_match.group(1)) if errors_match else 0,
+            latency_avg=f'{latency_ms["mean"]:.2f}ms',
+            latency_p99=f'{p99:.2f}ms' if p99 is not None else None,
+            details={'requests_per_sec': float(rps_match.group(1)), 'latency_ms': latency_ms},
         )
     return None
 
 
-def run_hey(port: int, duration: int, connections: int) -> BenchmarkResult | None:
-    """Run hey benchmark and parse results."""
-    url = f'http://127.0.0.1:{port}/'
+def run_builtin(
+    port: int,
+    duration: int,
+    connections: int,
+    processes: int = 1,
+    path: str = '/',
+    body: bytes | None = None,
+) -> BenchmarkResult | None:
+    """Run the built-in load generator; no external tool or text parsing needed. With `body`, POSTs it as JSON."""
+    config = LoadConfig(url=f'http://127.0.0.1:{port}{path}', connections=connections, duration=duration)
+    if body:
+        config = replace(config, method='POST', body=body, headers={'Content-Type': 'application/json'})
 
     # Warmup
-    subprocess.run(
-        ['hey', '-n', '1000', '-c', '10', url],
-        capture_output=True,
-        text=True,
-    )
+    run_load(replace(config, connections=10, duration=2))
 
     # Actual benchmark
-    result = subprocess.run(
-        ['hey', '-z', f'{duration}s', '-c', str(connections), url],
-        capture_output=True,
-        text=True,
+    load = run_load(config, processes=processes)
+    print_load_result(load)
+
+    if not load.requests:
+        return None
+    return BenchmarkResult(
+        name='',
+        requests_per_sec=load.requests_per_sec,
+        latency_avg=f'{load.latency.mean_us / 1000:.2f}ms',
+        latency_p99=f'{load.latency_ms(99):.2f}ms',
+        transfer_per_sec=f'{load.bytes_per_sec / 1024 / 1024:.2f}MB',
+        errors=load.error_count,
+        details=load.summary(),
     )
 
-    output = result.stdout
-    print(output)
 
-    # Parse results
-    rps_match = re.search(r'Requests/sec:\s+([\d.]+)', output)
-    latency_match = re.search(r'Average:\s+([\d.]+)', output)
-    p99_match = re.search(r'99% in ([\d.]+) secs', output)
+def run_builtin_sweep(
+    port: int,
+    rates: list[float],
+    duration: int,
+    connections: int,
+    processes: int = 1,
+    path: str = '/',
+) -> BenchmarkResult | None:
+    """
+    Sweep open-loop arrival rates with the built-in load generator.
 
-    if rps_match and latency_match:
-        latency_ms = float(latency_match.group(1)) * 1000
-        return BenchmarkResult(
-            name='',
-            requests_per_sec=float(rps_match.group(1)),
-            latency_avg=f'{latency_ms:.2f}ms',
-            latency_p99=f'{float(p99_match.group(1)) * 1000:.2f}ms' if p99_match else None,
-        )
-    return None
+    Latency is measured from each request's intended send time (coordinated-omission
+    corrected). The reported throughput and latency are those at the saturation point,
+    and the full latency-vs-throughput curve goes into details.
+    """
+    url = f'http://127.0.0.1:{port}{path}'
+
+    # Warmup
+    run_load(LoadConfig(url=url, connections=10, duration=2))
+
+    points = sweep_rates(LoadConfig(url=url, connections=connections, duration=duration), rates, processes=processes)
+    saturation = find_saturation(points)
+    if not saturation:
+        print('  Saturation: below the lowest offered rate')
+        return BenchmarkResult(name='', requests_per_sec=0.0, latency_avg='N/A', details=latency_curve(points, None))
+
+    print(f'  Saturation: {saturation.target_rate:,.0f}/s (p99 {saturation.latency_ms(99):.2f}ms)')
+    return BenchmarkResult(
+        name='',
+        requests_per_sec=saturation.requests_per_sec,
+        latency_avg=f'{saturation.latency.mean_us / 1000:.2f}ms',
+        latency_p99=f'{saturation.latency_ms(99):.2f}ms',
+        errors=saturation.error_count,
+        details=latency_curve(points, saturation),
+    )
+
+
+def run_load_tool(
+    tool: str,
+    port: int,
+    duration: int,
+    connections: int,
+    threads: int,
+    rates: list[float] | None = None,
+    path: str = '/',
+    body: bytes | None = None,
+    cpus: list[int] | None = None,
+) -> BenchmarkResult | None:
+    """
+    Run the selected load tool against a ready server. With `body`, POSTs it as JSON.
+
+    With `cpus`, the tool (wrk, hey or the built-in generator's processes) only runs on those CPUs.
+    """
+    with cpu_affinity(cpus):
+        if tool == 'wrk':
+            return run_wrk(port, duration, connections, threads, path, body)
+        if tool == 'hey':
+            return run_hey(port, duration, connections, path, body)
+        if rates:
+            return run_builtin_sweep(port, rates, duration, connections, processes=threads, path=path)
+        return run_builtin(port, duration, connections, processes=threads, path=path, body=body)
+
+
+def spawn_server(cmd: list[str], cpus: list[int] | None = None) -> subprocess.Popen:
+    """Launch a server command from this directory without waiting for it. With `cpus`, pin it (and its workers)."""
+
+    def setup():
+        os.setsid()  # Create new process group for clean shutdown
+        if cpus and can_pin():
+            os.sched_setaffinity(0, cpus)
+
+    return subprocess.Popen(
+        cmd,
+        cwd=SCRIPT_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        preexec_fn=setup,
+    )
+
+
+def start_server(
+    server: ServerConfig,
+    cmd: list[str],
+    port: int,
+    cpus: list[int] | None = None,
+) -> subprocess.Popen | None:
+    """Start a server and wait until it accepts connections; returns None if it never does."""
+    print(f'Starting {server.name}...')
+    print(f'  Command: {" ".join(cmd)}')
+    if cpus:
+        print(f'  CPUs: {format_cpus(cpus)}')
+    proc = spawn_server(cmd, cpus)
+
+    if not wait_for_server(port):
+        print(f'Error: {server.name} failed to start')
+        stop_server(server, proc)
+        return None
+    return proc
+
+
+def stop_server(server: ServerConfig, proc: subprocess.Popen):
+    """Stop a server started with start_server, including orphaned workers."""
+    kill_server(proc)
+    subprocess.run(
+        ['pkill', '-f', f'{server.server}.*{server.module}'],
+        capture_output=True,
+    )
+    time.sleep(1)
 
 
 def kill_server(proc: subprocess.Popen):
@@ -205,8 +610,15 @@ def run_benchmarks(
     workers: int = DEFAULT_WORKERS,
     port: int = DEFAULT_PORT,
     frameworks: list[str] | None = None,
+    rates: list[float] | None = None,
+    partitions: list[CorePartition] | None = None,
 ) -> dict[str, BenchmarkResult]:
-    """Run benchmarks for all servers."""
+    """
+    Run benchmarks for all servers. With the builtin tool, `rates` runs an open-loop sweep.
+
+    One partition pins the server and the load tool to its CPU sets (its port replaces
+    `port`); several run that many frameworks at once, one per partition.
+    """
     results: dict[str, BenchmarkResult] = {}
 
     print_header('Web Framework Benchmark Suite')
@@ -215,6 +627,11 @@ def run_benchmarks(
     print(f'Tool: {tool}')
     print(f'Duration: {duration}s')
     print(f'Connections: {connections}')
+    for i, partition in enumerate(partitions or []):
+        print(
+            f'Partition {i}: port {partition.port}, server CPUs {format_cpus(partition.server_cpus)}, '
+            f'load generator CPUs {format_cpus(partition.client_cpus)}'
+        )
     print()
 
     # Filter servers if specific frameworks requested
@@ -222,53 +639,99 @@ def run_benchmarks(
     if frameworks:
         servers = [s for s in SERVERS if s.name in frameworks]
 
+    if partitions and len(partitions) > 1:
+        return run_partitioned(servers, partitions, tool, duration, connections, threads, workers, rates)
+
+    server_cpus = client_cpus = None
+    if partitions:
+        port, server_cpus, client_cpus = partitions[0].port, partitions[0].server_cpus, partitions[0].client_cpus
+
     for server in servers:
         print_subheader(f'{server.name} ({server.interface.upper()})')
 
-        # Build command
-        cmd = get_granian_command(server, port, workers)
-
-        # Start server
-        print(f'Starting {server.name} with Granian...')
-        print(f'  Command: {" ".join(cmd)}')
-        proc = subprocess.Popen(
-            cmd,
-            cwd=SCRIPT_DIR,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            preexec_fn=os.setsid,  # Create new process group for clean shutdown
-        )
+        proc = start_server(server, get_granian_command(server, port, workers), port, server_cpus)
+        if proc is None:
+            continue
 
         try:
-            # Wait for server
-            if not wait_for_server(port):
-                print(f'Error: {server.name} failed to start')
-                kill_server(proc)
-                continue
-
             print(f'{server.name} ready, running benchmark...')
             print()
 
-            # Run benchmark
-            if tool == 'wrk':
-                result = run_wrk(port, duration, connections, threads)
-            else:
-                result = run_hey(port, duration, connections)
-
+            result = run_load_tool(tool, port, duration, connections, threads, rates, cpus=client_cpus)
             if result:
                 result.name = server.name
                 results[server.name] = result
 
         finally:
-            # Stop server
             print(f'\nStopping {server.name}...')
-            kill_server(proc)
-            # Also kill any orphaned granian workers
-            subprocess.run(
-                ['pkill', '-f', f'granian.*{server.module}'],
-                capture_output=True,
+            stop_server(server, proc)
+
+    return results
+
+
+def run_partitioned(
+    servers: list[ServerConfig],
+    partitions: list[CorePartition],
+    tool: str,
+    duration: int,
+    connections: int,
+    threads: int,
+    workers: int,
+    rates: list[float] | None = None,
+) -> dict[str, BenchmarkResult]:
+    """
+    Benchmark up to len(partitions) frameworks at once, each in a child process pinned to its partition.
+
+    Frameworks are run in waves; each child's output is printed once it finishes.
+    """
+    results: dict[str, BenchmarkResult] = {}
+    for start in range(0, len(servers), len(partitions)):
+        children = []
+        for server, partition in zip(servers[start : start + len(partitions)], partitions):
+            cmd = [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                '--frameworks',
+                server.name,
+                '--port',
+                str(partition.port),
+                '--server-cpus',
+                format_cpus(partition.server_cpus),
+                '--client-cpus',
+                format_cpus(partition.client_cpus),
+                '--tool',
+                tool,
+                '--duration',
+                str(duration),
+                '--connections',
+                str(connections),
+                '--threads',
+                str(threads),
+                '--workers',
+                str(workers),
+                '--result-json',
+            ]
+            if rates:
+                cmd += ['--rates', *map(str, rates)]
+            print(f'Starting {server.name} on port {partition.port}...')
+            children.append(
+                (server, subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True))
             )
-            time.sleep(1)
+
+        for server, child in children:
+            output, _ = child.communicate()
+            lines = output.rstrip().splitlines()
+            try:
+                data = json.loads(lines[-1])
+                lines.pop()
+            except (IndexError, ValueError):
+                data = None
+            print('\n'.join(lines))
+            if data is None:
+                print(f'Error: {server.name} produced no results')
+                continue
+            for name, fields in data.items():
+                results[name] = BenchmarkResult(name=name, **fields)
 
     return results
 
@@ -295,7 +758,9 @@ def output_json(results: dict[str, BenchmarkResult]) -> dict:
             'requests_per_sec': r.requests_per_sec,
             'latency_avg': r.latency_avg,
             'latency_p99': r.latency_p99,
+            'transfer_per_sec': r.transfer_per_sec,
             'errors': r.errors,
+            'details': r.details,
         }
         for name, r in results.items()
     }
@@ -306,7 +771,7 @@ def main():
     parser.add_argument(
         '--tool',
         '-t',
-        choices=['wrk', 'hey'],
+        choices=['wrk', 'hey', 'builtin'],
         default='wrk',
         help='Benchmark tool to use (default: wrk)',
     )
@@ -328,7 +793,7 @@ def main():
         '--threads',
         type=int,
         default=4,
-        help='Number of threads for wrk (default: 4)',
+        help='Number of threads for wrk, or processes for the built-in generator (default: 4)',
     )
     parser.add_argument(
         '--workers',
@@ -351,18 +816,44 @@ def main():
         choices=['flask', 'django', 'fastapi', 'starlette', 'litestar'],
         help='Specific frameworks to benchmark (default: all)',
     )
+    parser.add_argument(
+        '--rates',
+        type=float,
+        nargs='+',
+        help='Open-loop arrival rates (req/sec) to sweep with --tool builtin; reports the saturation point',
+    )
+    parser.add_argument(
+        '--pin',
+        action='store_true',
+        help='Pin servers and the load tool to disjoint CPU sets (Linux)',
+    )
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=1,
+        help='Frameworks to run at once, each on its own port and CPU partition (Linux; implies --pin)',
+    )
+    parser.add_argument(
+        '--client-share',
+        type=float,
+        default=CLIENT_SHARE,
+        help=f"Fraction of each partition's CPUs given to the load tool (default: {CLIENT_SHARE})",
+    )
+    parser.add_argument('--server-cpus', help='Explicit server CPU list, e.g. "4-7" (use with --client-cpus)')
+    parser.add_argument('--client-cpus', help='Explicit load tool CPU list, e.g. "0-3"')
     parser.add_argument(
         '--json',
         action='store_true',
         help='Output results as JSON',
     )
+    parser.add_argument('--result-json', action='store_true', help='Print results as one JSON line (internal)')
 
     args = parser.parse_args()
 
     # Check tool availability
-    if not check_tool(args.tool):
+    if args.tool != 'builtin' and not check_tool(args.tool):
         print(f'Error: {args.tool} not found.')
-        print(f'Install with: brew install {args.tool}')
+        print(f'Install with: brew install {args.tool} (or use --tool builtin)')
         sys.exit(1)
 
     if not check_tool('granian'):
@@ -370,6 +861,19 @@ def main():
         print('Install with: pip install granian')
         sys.exit(1)
 
+    partitions = None
+    if args.server_cpus and args.client_cpus:
+        partitions = [CorePartition(parse_cpus(args.server_cpus), parse_cpus(args.client_cpus), args.port)]
+    elif args.pin or args.parallel > 1:
+        if not can_pin():
+            print('Error: CPU pinning needs os.sched_setaffinity (Linux).')
+            sys.exit(1)
+        try:
+            partitions = partition_cores(args.parallel, args.port, args.client_share)
+        except ValueError as e:
+            print(f'Error: {e}')
+            sys.exit(1)
+
     # Run benchmarks
     results = run_benchmarks(
         tool=args.tool,
@@ -379,8 +883,14 @@ def main():
         workers=args.workers,
         port=args.port,
         frameworks=args.frameworks,
+        rates=args.rates if args.tool == 'builtin' else None,
+        partitions=partitions,
     )
 
+    if args.result_json:
+        print(json.dumps(output_json(results)))
+        return results
+
     # Output
     if results:
         print_summary(results)
@@ -3,6 +3,7 @@
 Wraps benchmark_servers.py to provide the standard run_benchmarks() interface.
 """
 
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -12,46 +13,60 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.benchmark import BenchmarkResult
 
+from web_frameworks.benchmark_servers import (
+    SERVERS,
+    CorePartition,
+    available_cpus,
+    can_pin,
+    partition_cores,
+)
 from web_frameworks.benchmark_servers import run_benchmarks as run_server_benchmarks
 
+# Reported as separate results when the load tool measured them
+LATENCY_PERCENTILES = ['p50', 'p90', 'p99', 'p99.9']
 
-def parse_latency_to_ms(latency_str: str | None) -> float | None:
-    """Parse latency string like '2.5ms' or '150us' to milliseconds."""
-    if not latency_str:
-        return None
+WORKERS = 4
+CPUS_PER_PARTITION = 2 * WORKERS  # A core per server worker, as many again for the load tool
 
-    try:
-        latency_str = latency_str.strip().lower()
-
-        if latency_str.endswith('ms'):
-            return float(latency_str[:-2])
-        elif latency_str.endswith('us') or latency_str.endswith('μs'):
-            return float(latency_str[:-2]) / 1000
-        elif latency_str.endswith('s'):
-            return float(latency_str[:-1]) * 1000
-        else:
-            return float(latency_str)
-    except (ValueError, AttributeError):
+# Opt-in: run frameworks concurrently, one partition each, on hosts with enough CPUs
+PARALLEL = os.environ.get('WEB_BENCH_PARALLEL', '') not in ('', '0')
+
+
+def core_partitions(parallel: bool = PARALLEL) -> list[CorePartition] | None:
+    """
+    Isolated server/load-tool CPU partitions of CPUS_PER_PARTITION cores each.
+
+    By default one partition, so frameworks run one after another on the same
+    cores whatever the host size. With `parallel` (WEB_BENCH_PARALLEL=1), as many
+    as the host fits, at most one per framework, and frameworks run concurrently.
+    None on hosts too small to give both sides their own cores, or without CPU
+    affinity (non-Linux).
+    """
+    count = len(available_cpus()) // CPUS_PER_PARTITION
+    if count < 1 or not can_pin():
         return None
+    partitions = partition_cores(count)
+    return partitions[: len(SERVERS)] if parallel else partitions[:1]
 
 
 def run_benchmarks() -> list[BenchmarkResult]:
     """Run web framework benchmarks and return standardized results."""
     results = []
 
-    # Check if wrk is available
-    if not shutil.which('wrk'):
-        print('⚠️  wrk not found, skipping web framework benchmarks')
-        return results
+    # Prefer wrk, fall back to the built-in load generator
+    tool = 'wrk' if shutil.which('wrk') else 'builtin'
+    if tool == 'builtin':
+        print('⚠️  wrk not found, using built-in load generator')
 
     # Run benchmarks
     try:
         server_results = run_server_benchmarks(
-            tool='wrk',
+            tool=tool,
             duration=10,
             connections=100,
             threads=4,
-            workers=4,
+            workers=WORKERS,
+            partitions=core_partitions(),
         )
     except Exception as e:
         print(f'⚠️  Error running web framework benchmarks: {e}')
@@ -59,9 +74,6 @@ def run_benchmarks() -> list[BenchmarkResult]:
 
     # Convert to standard format
     for framework_name, bench_result in server_results.items():
-        latency_avg_ms = parse_latency_to_ms(bench_result.latency_avg)  # noqa
-        latency_p99_ms = parse_latency_to_ms(bench_result.latency_p99)
-
         # Quick reference metric: actual requests per second (not latency)
         # We show req/sec because latency-to-ops/sec calculation doesn't work for concurrent benchmarks
         results.append(
@@ -81,19 +93,22 @@ def run_benchmarks() -> list[BenchmarkResult]:
                 value=bench_result.requests_per_sec,
                 unit='req/sec',
                 category='web',
+                details=bench_result.details,
             )
         )
 
-        # Latency p99
-        if latency_p99_ms:
-            results.append(
-                BenchmarkResult(
-                    name=f'{framework_name}_latency_p99',
-                    value=latency_p99_ms,
-                    unit='ms',
-                    category='web',
+        # Latency percentiles (the full spectrum is in the requests_per_sec details)
+        for percentile in LATENCY_PERCENTILES:
+            latency_ms = bench_result.latency_ms(percentile)
+            if latency_ms is not None:
+                results.append(
+                    BenchmarkResult(
+                        name=f'{framework_name}_latency_{percentile}',
+                        value=latency_ms,
+                        unit='ms',
+                        category='web',
+                    )
                 )
-            )
 
     return results
 
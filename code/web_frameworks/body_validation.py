@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Request-body parsing and validation benchmark.
+
+Every app accepts POST /users with a COMPLEX_OBJ-shaped JSON body and validates
+it the framework's idiomatic way:
+- FastAPI: pydantic models
+- Litestar: msgspec Structs
+- Flask, Django, Starlette: hand-written validate_user() (payloads.py)
+
+Bodies range from the 3-post COMPLEX_OBJ (~0.5 KB) to 1000 posts (~80 KB), since
+validation cost grows with the input and dominates per-request CPU in most APIs.
+
+Usage:
+    python body_validation.py [--frameworks fastapi litestar] [--in-process]
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web_frameworks.payload_matrix import RequestCase, matrix_main, run_matrix_benchmarks
+from web_frameworks.payloads import BODY_POSTS, request_body
+
+CATEGORY = 'web_validation'
+IN_PROCESS_ITERATIONS = 500
+TITLE = 'Request Body Validation'
+
+BODY_CASES = [RequestCase(label=f'post_users_{name}', path='/users', body=request_body(name)) for name in BODY_POSTS]
+
+
+def run_benchmarks(**kwargs) -> dict:
+    """POST each body size to every framework and print a framework x body size table."""
+    kwargs.setdefault('iterations', IN_PROCESS_ITERATIONS)
+    return run_matrix_benchmarks(TITLE, BODY_CASES, CATEGORY, **kwargs)
+
+
+def main():
+    matrix_main(
+        'Benchmark request body validation per framework',
+        TITLE,
+        BODY_CASES,
+        CATEGORY,
+        IN_PROCESS_ITERATIONS,
+        per='body size',
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Web worker cold start: time to first response, worker RSS and first-request latency.
+
+The throughput benchmarks wait for a TCP connect and warm up before measuring,
+so startup cost never shows. With autoscaling and worker recycling, it is
+user-visible latency. For each framework this measures:
+- Time from process spawn to the first successful HTTP response
+- RSS of each worker process at idle (right after startup) and after a short load
+- Latency of the first N requests, each on a new connection so they spread over workers
+
+Usage:
+    python cold_start.py [--server granian] [--workers 4] [--first-requests 20]
+"""
+
+import argparse
+import http.client
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from time import perf_counter
+
+import psutil
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    MemoryResult,
+    collect_results,
+    print_comparison_table,
+    print_header,
+    print_skip_message,
+    print_subheader,
+)
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    DEFAULT_WORKERS,
+    SERVER_VARIANTS,
+    SERVERS,
+    ServerConfig,
+    get_server_command,
+    spawn_server,
+    stop_server,
+)
+from web_frameworks.db import ensure_database
+from web_frameworks.load_generator import LoadConfig, run_load
+
+CATEGORY = 'web_cold_start'
+FIRST_REQUESTS = 20
+STARTUP_TIMEOUT = 30.0
+LOAD_DURATION = 5
+
+
+def get_once(port: int, timeout: float = 5.0) -> int:
+    """GET / on a fresh connection and return the status code."""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+    try:
+        conn.request('GET', '/')
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def wait_for_first_response(port: int, timeout: float = STARTUP_TIMEOUT) -> bool:
+    """Poll with real HTTP requests (not just TCP connects) until one returns 200."""
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        try:
+            if get_once(port, timeout=1.0) == 200:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.005)
+    return False
+
+
+def worker_rss_mb(pid: int) -> tuple[float, list[float]]:
+    """
+    Return (server master RSS MB, [RSS MB per worker process]).
+
+    Workers that exit or are recycled while being read are skipped; psutil.NoSuchProcess
+    is only raised if the master itself is gone.
+    """
+    master = psutil.Process(pid)
+    mb = 1024 * 1024
+    worker_mb = []
+    for worker in master.children(recursive=True):
+        try:
+            worker_mb.append(worker.memory_info().rss / mb)
+        except psutil.NoSuchProcess:
+            continue
+    return master.memory_info().rss / mb, worker_mb
+
+
+def measure_cold_start(server: ServerConfig, port: int, workers: int, first_requests: int) -> dict | None:
+    """
+    Spawn one server and measure its cold start.
+
+    Returns None (after printing why) if it never answers or exits while being measured.
+    Failed first requests are counted, not timed.
+    """
+    cmd = get_server_command(server, port, workers)
+    print(f'  Command: {" ".join(cmd)}')
+
+    start = perf_counter()
+    proc = spawn_server(cmd)
+    try:
+        if not wait_for_first_response(port):
+            print(f'  {server.name} did not respond within {STARTUP_TIMEOUT:.0f}s')
+            return None
+        first_response_ms = (perf_counter() - start) * 1000
+
+        time.sleep(1)  # Let the remaining workers finish booting
+        master_idle_mb, idle_mb = worker_rss_mb(proc.pid)
+
+        latencies_ms = []
+        failed = 0
+        for _ in range(first_requests):
+            request_start = perf_counter()
+            try:
+                get_once(port)
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                continue
+            latencies_ms.append((perf_counter() - request_start) * 1000)
+
+        run_load(LoadConfig(url=f'http://127.0.0.1:{port}/', connections=50, duration=LOAD_DURATION))
+        master_loaded_mb, loaded_mb = worker_rss_mb(proc.pid)
+    except psutil.NoSuchProcess:
+        print(f'  {server.name} server exited during the measurement')
+        return None
+    finally:
+        stop_server(server, proc)
+
+    if failed:
+        print(f'  {failed} of {first_requests} first requests failed')
+    if not latencies_ms:
+        return None
+
+    return {
+        'first_response_ms': first_response_ms,
+        'master_rss_idle_mb': master_idle_mb,
+        'worker_rss_idle_mb': statistics.mean(idle_mb) if idle_mb else master_idle_mb,
+        'worker_rss_loaded_mb': statistics.mean(loaded_mb) if loaded_mb else master_loaded_mb,
+        'first_request_ms': latencies_ms[0],
+        'first_requests_median_ms': statistics.median(latencies_ms),
+        'first_requests_max_ms': max(latencies_ms),
+        'first_requests_failed': failed,
+    }
+
+
+def run_benchmarks(
+    server_label: str = 'granian',
+    workers: int = DEFAULT_WORKERS,
+    port: int = DEFAULT_PORT,
+    first_requests: int = FIRST_REQUESTS,
+    frameworks: list[str] | None = None,
+) -> dict:
+    """Measure cold start for each framework on one server variant."""
+    print_header('Web Worker Cold Start')
+
+    variant = next(v for v in SERVER_VARIANTS if v.label == server_label)
+    if not variant.is_installed():
+        print_skip_message(variant.label)
+        return collect_results(CATEGORY, [])
+
+    print(f'Server: {variant.label}, {workers} workers')
+    print(f'First requests: {first_requests}, load for RSS: {LOAD_DURATION}s')
+
+    apps = [s for s in SERVERS if s.interface in variant.interfaces and (not frameworks or s.name in frameworks)]
+
+    ensure_database()
+    results: list[BenchmarkResult | MemoryResult] = []
+    rows: list[list[str]] = []
+    for app in apps:
+        print_subheader(app.name)
+        measured = measure_cold_start(variant.apply(app), port, workers, first_requests)
+        if measured is None:
+            continue
+
+        results.extend(
+            [
+                BenchmarkResult(
+                    name=f'{app.name}_first_response',
+                    value=measured['first_response_ms'],
+                    category=CATEGORY,
+                ),
+                BenchmarkResult(
+                    name=f'{app.name}_first_{first_requests}_requests_median',
+                    value=measured['first_requests_median_ms'],
+                    category=CATEGORY,
+                    details={
+                        'first_ms': measured['first_request_ms'],
+                        'max_ms': measured['first_requests_max_ms'],
+                        'failed': measured['first_requests_failed'],
+                    },
+                ),
+                MemoryResult(
+                    name=f'{app.name}_worker_rss_idle',
+                    value=measured['worker_rss_idle_mb'],
+                    unit='MB',
+                    category=CATEGORY,
+                ),
+                MemoryResult(
+                    name=f'{app.name}_worker_rss_loaded',
+                    value=measured['worker_rss_loaded_mb'],
+                    unit='MB',
+                    category=CATEGORY,
+                ),
+            ]
+        )
+        rows.append(
+            [
+                app.name,
+                f'{measured["first_response_ms"]:,.0f} ms',
+                f'{measured["first_request_ms"]:.2f} ms',
+                f'{measured["first_requests_median_ms"]:.2f} ms',
+                f'{measured["first_requests_max_ms"]:.2f} ms',
+                f'{measured["worker_rss_idle_mb"]:.1f} MB',
+                f'{measured["worker_rss_loaded_mb"]:.1f} MB',
+            ]
+        )
+
+    print_subheader('Summary')
+    print_comparison_table(
+        ['Framework', 'Spawn→200', '1st req', f'Median of {first_requests}', 'Max', 'Worker idle', 'After load'],
+        rows,
+    )
+
+    return collect_results(CATEGORY, results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure web worker cold start per framework')
+    parser.add_argument(
+        '--server',
+        '-s',
+        choices=[v.label for v in SERVER_VARIANTS],
+        default='granian',
+        help='Server variant (default: granian)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Worker processes (default: {DEFAULT_WORKERS})',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--first-requests',
+        '-n',
+        type=int,
+        default=FIRST_REQUESTS,
+        help=f'Requests timed right after startup (default: {FIRST_REQUESTS})',
+    )
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        server_label=args.server,
+        workers=args.workers,
+        port=args.port,
+        first_requests=args.first_requests,
+        frameworks=args.frameworks,
+    )
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
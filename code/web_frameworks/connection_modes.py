@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Connection handling: keep-alive vs connection-per-request vs HTTP/2.
+
+The other server benchmarks reuse persistent connections. Proxies in front of
+real deployments reuse them to varying degrees, and TCP setup and teardown can
+cost more than the framework itself. Per framework, on Granian:
+- keepalive: HTTP/1.1, persistent connections (built-in load generator)
+- close: HTTP/1.1, a new connection per request ("Connection: close"); latency
+  includes the handshake
+- h2c: Granian pinned to HTTP/2 over cleartext, driven by h2load (nghttp2)
+  with `--streams` concurrent streams per connection
+
+Latency percentiles for h2c come from h2load's per-request log, so all three
+modes report through the same histogram.
+
+Usage:
+    python connection_modes.py [--frameworks flask starlette] [--connections 50] [--streams 1]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    collect_results,
+    print_comparison_table,
+    print_header,
+    print_skip_message,
+    print_subheader,
+)
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    DEFAULT_WORKERS,
+    SERVERS,
+    check_tool,
+    get_granian_command,
+    start_server,
+    stop_server,
+)
+from web_frameworks.load_generator import LoadConfig, LoadResult, print_load_result, run_load
+
+CATEGORY = 'web_connections'
+MODES = ['keepalive', 'close', 'h2c']
+CONNECTIONS = 50
+WARMUP_SECONDS = 2
+
+
+def run_h2load(url: str, duration: int, connections: int, streams: int = 1, threads: int = 1) -> LoadResult | None:
+    """
+    Run h2load against an h2c server and return its results as a LoadResult.
+
+    Throughput and traffic come from the summary; latency from --log-file, which has
+    one "start time, status, microseconds to end of response" row per request
+    (status -1 for failed streams).
+    """
+    with tempfile.NamedTemporaryFile(suffix='.log') as log:
+        cmd = [
+            'h2load',
+            '-c',
+            str(connections),
+            '-m',
+            str(streams),
+            '-t',
+            str(min(threads, connections)),
+            '-D',
+            str(duration),
+            f'--log-file={log.name}',
+            url,
+        ]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        rows = Path(log.name).read_text().splitlines()
+
+    finished_match = re.search(r'finished in ([\d.]+)s', proc.stdout)
+    if not finished_match:
+        print(proc.stdout or proc.stderr)
+        return None
+
+    result = LoadResult(duration_s=float(finished_match.group(1)))
+    traffic_match = re.search(r'traffic: \S+ \((\d+)\) total', proc.stdout)
+    if traffic_match:
+        result.bytes_received = int(traffic_match.group(1))
+    timeout_match = re.search(r'(\d+) timeout', proc.stdout)
+    if timeout_match and int(timeout_match.group(1)):
+        result.errors['timeout'] += int(timeout_match.group(1))
+
+    for row in rows:
+        _, status, elapsed_us = row.split('\t')[:3]
+        if status == '-1':
+            result.errors['stream'] += 1
+            continue
+        result.latency.record(int(elapsed_us))
+        result.requests += 1
+        if int(status) >= 400:
+            result.errors[f'status_{status}'] += 1
+    return result
+
+
+def run_connection_modes(
+    duration: int = 5,
+    connections: int = CONNECTIONS,
+    streams: int = 1,
+    processes: int = 1,
+    workers: int = DEFAULT_WORKERS,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+    modes: list[str] | None = None,
+) -> dict[str, dict[str, LoadResult]]:
+    """Return results keyed by framework, then mode."""
+    modes = modes or MODES
+    servers = [s for s in SERVERS if not frameworks or s.name in frameworks]
+    http1_modes = [m for m in modes if m != 'h2c']
+    url = f'http://127.0.0.1:{port}/'
+    config = LoadConfig(url=url, connections=connections, duration=duration)
+
+    results: dict[str, dict[str, LoadResult]] = {}
+    for server in servers:
+        print_subheader(f'{server.name} ({server.interface.upper()})')
+
+        if http1_modes:
+            proc = start_server(server, get_granian_command(server, port, workers, http='1'), port)
+            if proc is not None:
+                try:
+                    run_load(replace(config, connections=10, duration=WARMUP_SECONDS))
+                    for mode in http1_modes:
+                        print(f'\n{server.name} {mode} with {connections} connections')
+                        load = run_load(replace(config, keep_alive=mode == 'keepalive'), processes=processes)
+                        print_load_result(load)
+                        if load.requests:
+                            results.setdefault(server.name, {})[mode] = load
+                finally:
+                    stop_server(server, proc)
+
+        if 'h2c' in modes:
+            proc = start_server(server, get_granian_command(server, port, workers, http='2'), port)
+            if proc is not None:
+                try:
+                    run_h2load(url, WARMUP_SECONDS, 10)
+                    print(f'\n{server.name} h2c with {connections} connections x {streams} streams')
+                    load = run_h2load(url, duration, connections, streams, threads=processes)
+                    if load is not None:
+                        print_load_result(load)
+                    if load is not None and load.requests:
+                        results.setdefault(server.name, {})['h2c'] = load
+                finally:
+                    stop_server(server, proc)
+
+    return results
+
+
+def print_tables(results: dict[str, dict[str, LoadResult]], modes: list[str]):
+    tables = [
+        ('Requests/sec', lambda r: f'{r.requests_per_sec:,.0f}'),
+        ('p50 latency', lambda r: f'{r.latency_ms(50):.2f}ms'),
+        ('p99 latency', lambda r: f'{r.latency_ms(99):.2f}ms'),
+    ]
+    for title, cell in tables:
+        print_subheader(title)
+        rows = [
+            [framework, *(cell(by_mode[mode]) if mode in by_mode else '-' for mode in modes)]
+            for framework, by_mode in results.items()
+        ]
+        print_comparison_table(['Framework', *modes], rows)
+
+    if 'keepalive' in modes and 'close' in modes:
+        print_subheader('Connection-per-request cost')
+        rows = []
+        for framework, by_mode in results.items():
+            if 'keepalive' in by_mode and 'close' in by_mode:
+                ratio = by_mode['close'].requests_per_sec / by_mode['keepalive'].requests_per_sec
+                rows.append([framework, f'{ratio:.0%}'])
+        print_comparison_table(['Framework', 'close / keepalive req/sec'], rows)
+
+    print_subheader('Ranking by requests/sec')
+    rankings = {
+        mode: sorted(
+            (f for f in results if mode in results[f]),
+            key=lambda f: results[f][mode].requests_per_sec,
+            reverse=True,
+        )
+        for mode in modes
+    }
+    rows = [
+        [str(rank + 1), *(ranked[rank] if rank < len(ranked) else '-' for ranked in rankings.values())]
+        for rank in range(len(results))
+    ]
+    print_comparison_table(['Rank', *modes], rows)
+
+
+def run_benchmarks(
+    duration: int = 5,
+    connections: int = CONNECTIONS,
+    streams: int = 1,
+    processes: int = 1,
+    workers: int = DEFAULT_WORKERS,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+    modes: list[str] | None = None,
+) -> dict:
+    """Run every framework in every connection mode and print comparison tables."""
+    modes = modes or MODES
+    if 'h2c' in modes and not check_tool('h2load'):
+        print_skip_message('h2c', 'h2load not found (install nghttp2)')
+        modes = [m for m in modes if m != 'h2c']
+
+    print_header(f'Connection Modes (Granian, {workers} workers)')
+    print(f'Modes: {", ".join(modes)}')
+    print(f'Connections: {connections}' + (f' ({streams} streams each for h2c)' if 'h2c' in modes else ''))
+    print(f'Duration: {duration}s per mode')
+
+    results = run_connection_modes(duration, connections, streams, processes, workers, port, frameworks, modes)
+    if results:
+        print_tables(results, modes)
+
+    benchmark_results = [
+        BenchmarkResult(
+            name=f'{framework}_{mode}',
+            value=load.requests_per_sec,
+            unit='req/sec',
+            category=CATEGORY,
+            details=load.summary(),
+        )
+        for framework, by_mode in results.items()
+        for mode, load in by_mode.items()
+    ]
+    return collect_results(CATEGORY, benchmark_results)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark keep-alive, connection-per-request and HTTP/2 per framework'
+    )
+    parser.add_argument('--duration', '-d', type=int, default=5, help='Seconds per mode (default: 5)')
+    parser.add_argument(
+        '--connections',
+        '-c',
+        type=int,
+        default=CONNECTIONS,
+        help=f'Concurrent connections (default: {CONNECTIONS})',
+    )
+    parser.add_argument(
+        '--streams',
+        '-m',
+        type=int,
+        default=1,
+        help='Concurrent HTTP/2 streams per connection for h2c (default: 1, like HTTP/1.1 without pipelining)',
+    )
+    parser.add_argument(
+        '--processes',
+        '-P',
+        type=int,
+        default=1,
+        help='Load generator processes (h2load threads for h2c) (default: 1)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of Granian workers (default: {DEFAULT_WORKERS})',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument('--modes', nargs='+', choices=MODES, help='Connection modes (default: all)')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if not check_tool('granian'):
+        print('Error: granian not found.')
+        print('Install with: pip install granian')
+        sys.exit(1)
+
+    results = run_benchmarks(
+        duration=args.duration,
+        connections=args.connections,
+        streams=args.streams,
+        processes=args.processes,
+        workers=args.workers,
+        port=args.port,
+        frameworks=args.frameworks,
+        modes=args.modes,
+    )
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+SQLite database shared by the benchmark apps.
+
+The file lives in the system temp directory, so every worker process of every
+server sees the same rows. It is not created on import (1,000 inserts and a
+commit per worker start would show in cold_start.py); the driver scripts run
+ensure_database() once before starting servers.
+
+blocking_query() is a small, genuinely blocking read (~tens of microseconds)
+used by the /sync/db and /async/db endpoints to show what a blocking call costs
+in a sync handler (threadpool hop) versus an async one (stalls the event loop).
+
+fetch_user() reads and decodes one row, the way a real endpoint would. The
+/db/<id> endpoints pass it the reused per-thread connection; /db/<id>/connect
+opens and closes a connection for every request.
+"""
+
+import json
+import sqlite3
+import tempfile
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+DB_PATH = Path(tempfile.gettempdir()) / 'web_frameworks_bench.sqlite3'
+ROW_COUNT = 1_000
+SCAN_ROWS = 100
+
+_local = threading.local()
+
+
+def ensure_database(path: Path = DB_PATH):
+    """Create the users table with ROW_COUNT rows unless it already exists."""
+    conn = sqlite3.connect(path, timeout=30)
+    try:
+        with conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, username TEXT, email TEXT, data TEXT)'
+            )
+            conn.executemany(
+                'INSERT OR IGNORE INTO users (id, username, email, data) VALUES (?, ?, ?, ?)',
+                (
+                    (i, f'user_{i}', f'user_{i}@example.com', json.dumps({'id': i, 'views': i * 7 % 1000}))
+                    for i in range(1, ROW_COUNT + 1)
+                ),
+            )
+    finally:
+        conn.close()
+
+
+def get_connection() -> sqlite3.Connection:
+    """Connection for the calling thread, opened on first use.
+
+    sqlite3 connections may not cross threads by default, and sync handlers run
+    on whichever threadpool thread the framework picks.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        _local.conn = conn
+    return conn
+
+
+def fetch_user(conn: sqlite3.Connection, user_id: int) -> dict[str, Any] | None:
+    """One row by primary key, with its JSON column decoded; None if missing."""
+    row = conn.execute('SELECT id, username, email, data FROM users WHERE id = ?', (user_id,)).fetchone()
+    if row is None:
+        return None
+    return {'id': row[0], 'username': row[1], 'email': row[2], 'data': json.loads(row[3])}
+
+
+def fetch_user_fresh(user_id: int) -> dict[str, Any] | None:
+    """fetch_user on a connection opened for this call only."""
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        return fetch_user(conn, user_id)
+
+
+def blocking_query(start: int = 1) -> dict:
+    """Aggregate over SCAN_ROWS rows starting at `start`. Blocks the calling thread."""
+    count, total = (
+        get_connection()
+        .execute('SELECT COUNT(*), SUM(LENGTH(data)) FROM users WHERE id >= ? AND id < ?', (start, start + SCAN_ROWS))
+        .fetchone()
+    )
+    return {'rows': count, 'bytes': total}
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Database-backed endpoints: one SQLite row read and serialized per request.
+
+Every app serves the shared users table (db.py) at:
+- /db/<id>          raw sqlite3 on a per-thread connection reused across requests
+- /db/<id>/connect  raw sqlite3 on a connection opened and closed per request
+- Django only: /orm/<id> (persistent connection, CONN_MAX_AGE=None) and
+  /orm/<id>/connect (Django's default, closed after each request)
+
+"/" (a constant dict) is the no-I/O baseline, to show whether the gaps between
+frameworks survive once real I/O is in the loop. ASGI apps use sync handlers
+here, so the blocking read runs on their threadpool.
+
+Usage:
+    python db_endpoints.py [--frameworks django fastapi] [--in-process]
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web_frameworks.db import ensure_database
+from web_frameworks.payload_matrix import RequestCase, matrix_main, run_matrix_benchmarks
+
+CATEGORY = 'web_database'
+IN_PROCESS_ITERATIONS = 2_000
+TITLE = 'Database-Backed Endpoints'
+USER_ID = 42
+
+DB_CASES = [
+    RequestCase(label='no_db', path='/'),
+    RequestCase(label='sqlite_reuse', path=f'/db/{USER_ID}'),
+    RequestCase(label='sqlite_connect', path=f'/db/{USER_ID}/connect'),
+    RequestCase(label='orm_reuse', path=f'/orm/{USER_ID}', frameworks=('django',)),
+    RequestCase(label='orm_connect', path=f'/orm/{USER_ID}/connect', frameworks=('django',)),
+]
+
+
+def run_benchmarks(**kwargs) -> dict:
+    """Request every database endpoint on every framework and print a framework x endpoint table."""
+    kwargs.setdefault('iterations', IN_PROCESS_ITERATIONS)
+    ensure_database()
+    return run_matrix_benchmarks(TITLE, DB_CASES, CATEGORY, **kwargs)
+
+
+def main():
+    ensure_database()
+    matrix_main('Benchmark SQLite-backed endpoints per framework', TITLE, DB_CASES, CATEGORY, IN_PROCESS_ITERATIONS)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,48 @@
 """
 Django benchmark application.
 
-Minimal ASGI app returning JSON payload for benchmarking.
-Run with: gunicorn -w 4 -b 127.0.0.1:8002 django_app:application
+Minimal setup without a full project structure, served as WSGI (`application`)
+or ASGI (`asgi_application`).
+
+Endpoints:
+- /: the standard JSON response
+- /json/<size>, /fast/<size> (orjson), /text/<size>: 100 B, 10 KB and 1 MB payloads (payloads.py)
+- POST /users: body validated by hand
+- /sync, /async, /sync/db, /async/db: sync and async views, plain and with a blocking SQLite read
+- /stream/chunked, /stream/sse: StreamingHttpResponse (WebSockets would need Channels)
+- /db/<id>, /db/<id>/connect: a SQLite row via raw sqlite3 on a reused or a fresh connection (db.py)
+- /orm/<id>, /orm/<id>/connect: the same row via the ORM, CONN_MAX_AGE=None or 0
+- /files/<size>: file responses via FileResponse (files.py)
+
+Under ASGI, Django runs sync views via sync_to_async on one shared thread per
+worker; under WSGI it runs async views in a fresh event loop per request.
 
-This is a minimal Django setup without a full project structure.
+Run with: gunicorn -w 4 -b 127.0.0.1:8002 django_app:application
 """
 
+import json
+import sys
+from pathlib import Path
+
 import django
+import orjson
+from django.apps import apps
 from django.conf import settings
+from django.core.asgi import get_asgi_application
 from django.core.management import execute_from_command_line
 from django.core.wsgi import get_wsgi_application
-from django.http import JsonResponse
+from django.db import models
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.urls import path
 
+# Shared payloads live next to this file (apps are also imported as top-level modules)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from db import DB_PATH, blocking_query, fetch_user, fetch_user_fresh, get_connection
+from files import file_path, wsgi_file_support
+from payloads import SIZES, get_json_payload, get_text_payload, iter_chunks, iter_sse, validate_user
+
 # Configure Django settings
 if not settings.configured:
     settings.configure(
@@ -22,6 +51,10 @@ if not settings.configured:
         ROOT_URLCONF=__name__,
         ALLOWED_HOSTS=['*'],
         MIDDLEWARE=[],
+        DATABASES={
+            'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': DB_PATH, 'CONN_MAX_AGE': None},
+            'per_request': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': DB_PATH, 'CONN_MAX_AGE': 0},
+        },
     )
     django.setup()
 
@@ -37,11 +70,137 @@ RESPONSE_DATA = {
 }
 
 
+try:
+    # This file is imported both as web_frameworks.django_app and as top-level django_app
+    # (in_process.py, Granian); the second import must reuse the model, not register it again
+    User = apps.get_registered_model('benchmark', 'user')
+except LookupError:
+
+    class User(models.Model):
+        """The shared users table (db.py); Django neither creates nor migrates it."""
+
+        id = models.IntegerField(primary_key=True)
+        username = models.TextField()
+        email = models.TextField()
+        data = models.JSONField()
+
+        class Meta:
+            app_label = 'benchmark'
+            db_table = 'users'
+            managed = False
+
+
 def index(request):
     """Root endpoint returning JSON."""
     return JsonResponse(RESPONSE_DATA)
 
 
+def index_sync(request):
+    """Root endpoint from a sync view."""
+    return JsonResponse(RESPONSE_DATA)
+
+
+async def index_async(request):
+    """Root endpoint from an async view."""
+    return JsonResponse(RESPONSE_DATA)
+
+
+def db_sync(request):
+    """Blocking SQLite read in a sync view."""
+    return JsonResponse(blocking_query())
+
+
+async def db_async(request):
+    """Blocking SQLite read in an async view, stalling the event loop while it runs."""
+    return JsonResponse(blocking_query())
+
+
+def json_payload(request, size):
+    """JSON payload of the given size via JsonResponse (stdlib json)."""
+    if size not in SIZES:
+        raise Http404
+    return JsonResponse(get_json_payload(size))
+
+
+def fast_payload(request, size):
+    """JSON payload serialized with orjson."""
+    if size not in SIZES:
+        raise Http404
+    return HttpResponse(orjson.dumps(get_json_payload(size)), content_type='application/json')
+
+
+def text_payload(request, size):
+    """Plain text payload of the given size."""
+    if size not in SIZES:
+        raise Http404
+    return HttpResponse(get_text_payload(size), content_type='text/plain')
+
+
+def create_user(request):
+    """Accept a COMPLEX_OBJ-shaped user, validated by hand (no CSRF middleware is installed)."""
+    if request.method != 'POST':
+        return JsonResponse({'detail': 'method not allowed'}, status=405)
+    try:
+        user = validate_user(json.loads(request.body))
+    except ValueError as e:
+        return JsonResponse({'detail': str(e)}, status=422)
+    return JsonResponse({'id': user['id'], 'posts': len(user['posts'])})
+
+
+def db_user(request, user_id):
+    """SQLite row with raw sqlite3 on this thread's reused connection."""
+    user = fetch_user(get_connection(), user_id)
+    if user is None:
+        raise Http404
+    return JsonResponse(user)
+
+
+def db_user_connect(request, user_id):
+    """SQLite row with raw sqlite3 on a connection opened for this request."""
+    user = fetch_user_fresh(user_id)
+    if user is None:
+        raise Http404
+    return JsonResponse(user)
+
+
+def orm_user_response(alias, user_id):
+    user = get_object_or_404(User.objects.using(alias), pk=user_id)
+    return JsonResponse({'id': user.id, 'username': user.username, 'email': user.email, 'data': user.data})
+
+
+def orm_user(request, user_id):
+    """SQLite row through the ORM on a persistent connection."""
+    return orm_user_response('default', user_id)
+
+
+def orm_user_connect(request, user_id):
+    """SQLite row through the ORM on a connection Django closes when the request finishes."""
+    return orm_user_response('per_request', user_id)
+
+
+def file_download(request, name):
+    """File of the given size via FileResponse."""
+    path = file_path(name)
+    if path is None:
+        raise Http404
+    return FileResponse(open(path, 'rb'))
+
+
+def file_support(request):
+    """Whether the server offers wsgi.file_wrapper."""
+    return JsonResponse(wsgi_file_support(request.META))
+
+
+def stream_chunked(request):
+    """1 KB chunks from a generator."""
+    return StreamingHttpResponse(iter_chunks(), content_type='text/plain')
+
+
+def stream_sse(request):
+    """Server-sent events from a generator."""
+    return StreamingHttpResponse(iter_sse(), content_type='text/event-stream')
+
+
 def health(request):
     """Health check endpoint."""
     return JsonResponse({'status': 'healthy'})
@@ -50,11 +209,28 @@ def health(request):
 # URL patterns
 urlpatterns = [
     path('', index),
+    path('sync', index_sync),
+    path('async', index_async),
+    path('sync/db', db_sync),
+    path('async/db', db_async),
+    path('json/<str:size>', json_payload),
+    path('fast/<str:size>', fast_payload),
+    path('text/<str:size>', text_payload),
+    path('users', create_user),
+    path('db/<int:user_id>', db_user),
+    path('db/<int:user_id>/connect', db_user_connect),
+    path('orm/<int:user_id>', orm_user),
+    path('orm/<int:user_id>/connect', orm_user_connect),
+    path('files/<str:name>', file_download),
+    path('file-support', file_support),
+    path('stream/chunked', stream_chunked),
+    path('stream/sse', stream_sse),
     path('health', health),
 ]
 
 
 application = get_wsgi_application()
+asgi_application = get_asgi_application()
 
 
 if __name__ == '__main__':
@@ -1,13 +1,34 @@
 """
 FastAPI benchmark application.
 
-Minimal endpoint returning JSON payload for benchmarking.
+Endpoints:
+- /: the standard JSON response
+- /json/{size}, /fast/{size} (ORJSONResponse), /text/{size}: 100 B, 10 KB and 1 MB payloads (payloads.py)
+- POST /users: body validated with pydantic
+- /sync, /async, /sync/db, /async/db: sync and async handlers, plain and with a blocking SQLite read
+- /stream/chunked, /stream/sse: streaming responses
+- /ws/echo, /ws/broadcast: WebSockets
+- /db/{id}, /db/{id}/connect: a SQLite row on a reused or a fresh connection (db.py)
+- /files/{size}: file responses (files.py)
+
 Run with: uvicorn fastapi_app:app --host 127.0.0.1 --port 8003 --workers 4
 """
 
+import sys
+from datetime import datetime
+from pathlib import Path
+
 import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import ORJSONResponse
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, ORJSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
+
+# Shared payloads live next to this file (apps are also imported as top-level modules)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from db import blocking_query, fetch_user, fetch_user_fresh, get_connection
+from files import asgi_file_support, file_path
+from payloads import SIZES, aiter_chunks, aiter_sse, broadcast_text, get_json_payload, get_text_payload
 
 app = FastAPI()
 
@@ -25,7 +46,13 @@ RESPONSE_DATA = {
 
 @app.get('/')
 async def index():
-    """Root endpoint returning JSON (sync)."""
+    """Root endpoint returning JSON (async, like the other ASGI apps)."""
+    return RESPONSE_DATA
+
+
+@app.get('/sync')
+def index_sync():
+    """Root endpoint returning JSON from a def handler, which FastAPI runs in its threadpool."""
     return RESPONSE_DATA
 
 
@@ -35,12 +62,157 @@ async def index_async():
     return RESPONSE_DATA
 
 
+@app.get('/sync/db')
+def db_sync():
+    """Blocking SQLite read in a def handler (threadpool)."""
+    return blocking_query()
+
+
+@app.get('/async/db')
+async def db_async():
+    """Blocking SQLite read in an async handler, stalling the event loop while it runs."""
+    return blocking_query()
+
+
 @app.get('/orjson', response_class=ORJSONResponse)
 async def index_orjson():
     """Root endpoint using ORJSONResponse for faster serialization."""
     return RESPONSE_DATA
 
 
+@app.get('/json/{size}')
+async def json_payload(size: str):
+    """JSON payload of the given size via FastAPI's default encoder."""
+    if size not in SIZES:
+        raise HTTPException(status_code=404)
+    return get_json_payload(size)
+
+
+@app.get('/fast/{size}', response_class=ORJSONResponse)
+async def fast_payload(size: str):
+    """JSON payload returned as an ORJSONResponse, skipping jsonable_encoder."""
+    if size not in SIZES:
+        raise HTTPException(status_code=404)
+    return ORJSONResponse(get_json_payload(size))
+
+
+@app.get('/text/{size}', response_class=PlainTextResponse)
+async def text_payload(size: str):
+    """Plain text payload of the given size."""
+    if size not in SIZES:
+        raise HTTPException(status_code=404)
+    return PlainTextResponse(get_text_payload(size))
+
+
+class Profile(BaseModel):
+    bio: str
+    location: str
+    website: str
+    joined: datetime
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+    tags: list[str]
+    views: int
+
+
+class UserSettings(BaseModel):
+    theme: str
+    notifications: bool
+    email_frequency: str
+
+
+class User(BaseModel):
+    id: int
+    username: str
+    email: str
+    profile: Profile
+    posts: list[Post]
+    settings: UserSettings
+
+
+@app.post('/users')
+async def create_user(user: User):
+    """Accept a COMPLEX_OBJ-shaped user, validated by pydantic."""
+    return {'id': user.id, 'posts': len(user.posts)}
+
+
+@app.get('/db/{user_id}')
+def db_user(user_id: int):
+    """SQLite row on this thread's reused connection (def handler, so the blocking read runs in the threadpool)."""
+    user = fetch_user(get_connection(), user_id)
+    if user is None:
+        raise HTTPException(status_code=404)
+    return user
+
+
+@app.get('/db/{user_id}/connect')
+def db_user_connect(user_id: int):
+    """SQLite row on a connection opened for this request."""
+    user = fetch_user_fresh(user_id)
+    if user is None:
+        raise HTTPException(status_code=404)
+    return user
+
+
+@app.get('/files/{name}')
+async def file_download(name: str):
+    """File of the given size via FileResponse."""
+    path = file_path(name)
+    if path is None:
+        raise HTTPException(status_code=404)
+    return FileResponse(path)
+
+
+@app.get('/file-support')
+async def file_support(request: Request):
+    """Zero-copy extensions the server offers."""
+    return asgi_file_support(request.scope)
+
+
+@app.get('/stream/chunked')
+async def stream_chunked():
+    """1 KB chunks with chunked transfer encoding."""
+    return StreamingResponse(aiter_chunks(), media_type='text/plain')
+
+
+@app.get('/stream/sse')
+async def stream_sse():
+    """Server-sent events."""
+    return StreamingResponse(aiter_sse(), media_type='text/event-stream')
+
+
+@app.websocket('/ws/echo')
+async def ws_echo(websocket: WebSocket):
+    """Send every text message straight back."""
+    await websocket.accept()
+    try:
+        while True:
+            await websocket.send_text(await websocket.receive_text())
+    except WebSocketDisconnect:
+        pass
+
+
+# Clients of /ws/broadcast connected to this worker
+broadcast_clients: set[WebSocket] = set()
+
+
+@app.websocket('/ws/broadcast')
+async def ws_broadcast(websocket: WebSocket):
+    """Send every text message to all clients connected to this worker, sender included."""
+    await websocket.accept()
+    broadcast_clients.add(websocket)
+    try:
+        while True:
+            await broadcast_text(broadcast_clients, await websocket.receive_text())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broadcast_clients.discard(websocket)
+
+
 @app.get('/health')
 async def health():
     """Health check endpoint."""
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Static file serving throughput, 1 KB to 100 MB.
+
+Each framework serves /files/<size> through its own file response (Starlette and
+FastAPI FileResponse, Litestar File, Flask send_file, Django FileResponse), and
+granian-static has Granian serve the same directory itself, never entering Python.
+
+Whether a response avoids copying the file through Python is checked two ways:
+- /file-support reports the zero-copy hooks the server offers the app
+  (wsgi.file_wrapper, ASGI http.response.pathsend / zerocopy)
+- Server CPU time (all worker processes, user and system) per GB sent: reading
+  and writing through Python shows up as user time, sendfile as a little system time
+
+Usage:
+    python file_serving.py [--frameworks starlette flask] [--sizes 1mb 100mb] [--connections 16]
+"""
+
+import argparse
+import http.client
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import psutil
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    collect_results,
+    format_bytes,
+    print_comparison_table,
+    print_header,
+    print_subheader,
+)
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    DEFAULT_WORKERS,
+    SERVERS,
+    ServerConfig,
+    check_tool,
+    get_granian_command,
+    start_server,
+    stop_server,
+)
+from web_frameworks.files import FILE_DIR, FILE_SIZES, ensure_files
+from web_frameworks.load_generator import LoadConfig, LoadResult, print_load_result, run_load
+
+CATEGORY = 'web_files'
+CONNECTIONS = 16
+WARMUP_SECONDS = 1
+GB = 1024**3
+
+# Any app will do: Granian answers /static/* before the app is called
+GRANIAN_STATIC = ServerConfig(name='granian-static', module='starlette_app:app', interface='asgi')
+FILE_SERVERS = [*SERVERS, GRANIAN_STATIC]
+
+
+def file_url_path(server: ServerConfig, size: str) -> str:
+    if server is GRANIAN_STATIC:
+        return f'/static/{size}.bin'
+    return f'/files/{size}'
+
+
+def fetch_json(port: int, path: str) -> dict | None:
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    try:
+        conn.request('GET', path)
+        response = conn.getresponse()
+        body = response.read()
+        return json.loads(body) if response.status == 200 else None
+    except (OSError, ValueError):
+        return None
+    finally:
+        conn.close()
+
+
+def server_cpu_seconds(pid: int) -> tuple[float, float]:
+    """(user, system) CPU seconds used so far by the server and all its workers."""
+    master = psutil.Process(pid)
+    user = system = 0.0
+    for proc in [master, *master.children(recursive=True)]:
+        try:
+            times = proc.cpu_times()
+        except psutil.NoSuchProcess:
+            continue
+        user += times.user
+        system += times.system
+    return user, system
+
+
+def run_file_serving(
+    duration: int = 5,
+    connections: int = CONNECTIONS,
+    processes: int = 1,
+    workers: int = DEFAULT_WORKERS,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+    sizes: list[str] | None = None,
+) -> tuple[dict[str, dict[str, dict]], dict[str, dict | None]]:
+    """
+    Return ({framework: {size: {'load', 'cpu_user', 'cpu_system'}}}, {framework: /file-support}).
+
+    CPU seconds cover the measured run only, not the warmup.
+    """
+    sizes = sizes or list(FILE_SIZES)
+    servers = [s for s in FILE_SERVERS if not frameworks or s.name in frameworks]
+
+    print('Creating files...')
+    ensure_files()
+
+    results: dict[str, dict[str, dict]] = {}
+    support: dict[str, dict | None] = {}
+    for server in servers:
+        print_subheader(f'{server.name} ({server.interface.upper()})')
+        static_dir = FILE_DIR if server is GRANIAN_STATIC else None
+        proc = start_server(server, get_granian_command(server, port, workers, static_dir=static_dir), port)
+        if proc is None:
+            continue
+
+        try:
+            support[server.name] = None if static_dir else fetch_json(port, '/file-support')
+            for size in sizes:
+                config = LoadConfig(
+                    url=f'http://127.0.0.1:{port}{file_url_path(server, size)}', connections=connections
+                )
+                run_load(replace(config, connections=min(4, connections), duration=WARMUP_SECONDS))
+
+                print(f'\n{server.name} {size} with {connections} connections')
+                user_before, system_before = server_cpu_seconds(proc.pid)
+                load = run_load(replace(config, duration=duration), processes=processes)
+                user_after, system_after = server_cpu_seconds(proc.pid)
+                print_load_result(load)
+
+                if load.requests:
+                    results.setdefault(server.name, {})[size] = {
+                        'load': load,
+                        'cpu_user': user_after - user_before,
+                        'cpu_system': system_after - system_before,
+                    }
+        finally:
+            stop_server(server, proc)
+
+    return results, support
+
+
+def cpu_per_gb(measured: dict) -> tuple[float, float]:
+    load: LoadResult = measured['load']
+    gb = load.bytes_received / GB
+    return measured['cpu_user'] / gb, measured['cpu_system'] / gb
+
+
+def print_tables(results: dict[str, dict[str, dict]], support: dict[str, dict | None], sizes: list[str]):
+    print_subheader('Transfer/sec')
+    rows = [
+        [name, *(format_bytes(int(by_size[s]['load'].bytes_per_sec)) if s in by_size else '-' for s in sizes)]
+        for name, by_size in results.items()
+    ]
+    print_comparison_table(['Framework', *sizes], rows)
+
+    print_subheader('Requests/sec')
+    rows = [
+        [name, *(f'{by_size[s]["load"].requests_per_sec:,.0f}' if s in by_size else '-' for s in sizes)]
+        for name, by_size in results.items()
+    ]
+    print_comparison_table(['Framework', *sizes], rows)
+
+    print_subheader('Server CPU seconds per GB sent (user / system)')
+    rows = []
+    for name, by_size in results.items():
+        row = [name]
+        for s in sizes:
+            if s in by_size:
+                user, system = cpu_per_gb(by_size[s])
+                row.append(f'{user:.2f} / {system:.2f}')
+            else:
+                row.append('-')
+        rows.append(row)
+    print_comparison_table(['Framework', *sizes], rows)
+
+    print_subheader('Zero-copy hooks offered by the server')
+    rows = []
+    for name, offered in support.items():
+        if name == GRANIAN_STATIC.name:
+            rows.append([name, 'served by Granian (Rust), no app call'])
+        elif offered is None:
+            rows.append([name, 'unknown (/file-support failed)'])
+        else:
+            rows.append([name, ', '.join(hook for hook, available in offered.items() if available) or 'none'])
+    print_comparison_table(['Framework', 'Hooks'], rows)
+
+
+def run_benchmarks(
+    duration: int = 5,
+    connections: int = CONNECTIONS,
+    processes: int = 1,
+    workers: int = DEFAULT_WORKERS,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+    sizes: list[str] | None = None,
+) -> dict:
+    """Serve every file size from every framework and print throughput and CPU cost tables."""
+    sizes = sizes or list(FILE_SIZES)
+    print_header(f'Static File Serving (Granian, {workers} workers)')
+    print(f'Sizes: {", ".join(sizes)}')
+    print(f'Connections: {connections}')
+    print(f'Duration: {duration}s per size')
+
+    results, support = run_file_serving(duration, connections, processes, workers, port, frameworks, sizes)
+    if results:
+        print_tables(results, support, sizes)
+
+    benchmark_results = []
+    for name, by_size in results.items():
+        for size, measured in by_size.items():
+            load = measured['load']
+            user, system = cpu_per_gb(measured)
+            benchmark_results.append(
+                BenchmarkResult(
+                    name=f'{name}_file_{size}',
+                    value=load.bytes_per_sec / 1024 / 1024,
+                    unit='MB/sec',
+                    category=CATEGORY,
+                    details={
+                        'requests_per_sec': load.requests_per_sec,
+                        'cpu_user_s_per_gb': user,
+                        'cpu_system_s_per_gb': system,
+                        'zero_copy_hooks': support.get(name),
+                        **load.summary(),
+                    },
+                )
+            )
+    return collect_results(CATEGORY, benchmark_results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark static file serving per framework')
+    parser.add_argument('--duration', '-d', type=int, default=5, help='Seconds per file size (default: 5)')
+    parser.add_argument(
+        '--connections',
+        '-c',
+        type=int,
+        default=CONNECTIONS,
+        help=f'Concurrent connections (default: {CONNECTIONS})',
+    )
+    parser.add_argument(
+        '--processes',
+        '-P',
+        type=int,
+        default=1,
+        help='Load generator processes; raise it if the client, not the server, is the bottleneck (default: 1)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of Granian workers (default: {DEFAULT_WORKERS})',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in FILE_SERVERS],
+        help='Specific frameworks to benchmark (default: all, plus granian-static)',
+    )
+    parser.add_argument('--sizes', nargs='+', choices=list(FILE_SIZES), help='File sizes (default: all)')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if not check_tool('granian'):
+        print('Error: granian not found.')
+        print('Install with: pip install granian')
+        sys.exit(1)
+
+    results = run_benchmarks(
+        duration=args.duration,
+        connections=args.connections,
+        processes=args.processes,
+        workers=args.workers,
+        port=args.port,
+        frameworks=args.frameworks,
+        sizes=args.sizes,
+    )
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
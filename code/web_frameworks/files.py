@@ -0,0 +1,62 @@
+"""
+Static files served by the benchmark apps' /files/<size> endpoints.
+
+The files live in the system temp directory and are not created on import
+(100 MB per worker start would dominate startup); run ensure_files() first, as
+file_serving.py does. Unknown or missing files give 404.
+
+/file-support reports which zero-copy hooks the server offers the app:
+wsgi.file_wrapper for WSGI, the http.response.pathsend / zerocopy extensions
+for ASGI. A file response can only avoid copying through Python when the
+server offers one and the framework uses it.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+FILE_DIR = Path(tempfile.gettempdir()) / 'web_frameworks_files'
+FILE_SIZES = {
+    '1kb': 1024,
+    '100kb': 100 * 1024,
+    '1mb': 1024 * 1024,
+    '10mb': 10 * 1024 * 1024,
+    '100mb': 100 * 1024 * 1024,
+}
+BLOCK_SIZE = 1024 * 1024
+
+
+def file_path(name: str) -> Path | None:
+    """Path of the file for a size name, or None if the name is unknown or the file missing."""
+    if name not in FILE_SIZES:
+        return None
+    path = FILE_DIR / f'{name}.bin'
+    return path if path.exists() else None
+
+
+def ensure_files() -> None:
+    """Create any missing file (random, incompressible bytes), writing to a temp name first."""
+    FILE_DIR.mkdir(exist_ok=True)
+    block = os.urandom(BLOCK_SIZE)
+    for name, size in FILE_SIZES.items():
+        path = FILE_DIR / f'{name}.bin'
+        if path.exists() and path.stat().st_size == size:
+            continue
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            for offset in range(0, size, BLOCK_SIZE):
+                f.write(block[: min(BLOCK_SIZE, size - offset)])
+        tmp.replace(path)
+
+
+def wsgi_file_support(environ: dict[str, Any]) -> dict[str, bool]:
+    return {'wsgi.file_wrapper': 'wsgi.file_wrapper' in environ}
+
+
+def asgi_file_support(scope: dict[str, Any]) -> dict[str, bool]:
+    extensions = scope.get('extensions') or {}
+    return {
+        'http.response.pathsend': 'http.response.pathsend' in extensions,
+        'http.response.zerocopy': 'http.response.zerocopy' in extensions,
+    }
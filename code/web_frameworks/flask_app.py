@@ -1,11 +1,30 @@
 """
 Flask benchmark application.
 
-Minimal endpoint returning JSON payload for benchmarking.
+Endpoints:
+- /: the standard JSON response
+- /json/<size>, /fast/<size> (orjson), /text/<size>: 100 B, 10 KB and 1 MB payloads (payloads.py)
+- POST /users: body validated by hand
+- /sync, /sync/db: WSGI reference for the threadpool benchmark (plain, blocking SQLite read)
+- /stream/chunked, /stream/sse: streaming responses (WSGI has no WebSockets)
+- /db/<id>, /db/<id>/connect: a SQLite row on a reused or a fresh connection (db.py)
+- /files/<size>: file responses via send_file (files.py)
+
 Run with: gunicorn -w 4 -b 127.0.0.1:8001 flask_app:app
 """
 
-from flask import Flask, jsonify
+import sys
+from pathlib import Path
+
+import orjson
+from flask import Flask, Response, abort, jsonify, request, send_file
+
+# Shared payloads live next to this file (apps are also imported as top-level modules)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from db import blocking_query, fetch_user, fetch_user_fresh, get_connection
+from files import file_path, wsgi_file_support
+from payloads import SIZES, get_json_payload, get_text_payload, iter_chunks, iter_sse, validate_user
 
 app = Flask(__name__)
 
@@ -27,6 +46,97 @@ def index():
     return jsonify(RESPONSE_DATA)
 
 
+@app.route('/sync')
+def index_sync():
+    """Same as /, under the path the sync/async benchmark requests."""
+    return jsonify(RESPONSE_DATA)
+
+
+@app.route('/sync/db')
+def db_sync():
+    """Blocking SQLite read; WSGI handlers already run on the server's threads."""
+    return jsonify(blocking_query())
+
+
+@app.route('/json/<size>')
+def json_payload(size):
+    """JSON payload of the given size via jsonify (stdlib json)."""
+    if size not in SIZES:
+        abort(404)
+    return jsonify(get_json_payload(size))
+
+
+@app.route('/fast/<size>')
+def fast_payload(size):
+    """JSON payload serialized with orjson."""
+    if size not in SIZES:
+        abort(404)
+    return Response(orjson.dumps(get_json_payload(size)), mimetype='application/json')
+
+
+@app.route('/text/<size>')
+def text_payload(size):
+    """Plain text payload of the given size."""
+    if size not in SIZES:
+        abort(404)
+    return Response(get_text_payload(size), mimetype='text/plain')
+
+
+@app.route('/users', methods=['POST'])
+def create_user():
+    """Accept a COMPLEX_OBJ-shaped user, validated by hand."""
+    try:
+        user = validate_user(request.get_json())
+    except ValueError as e:
+        return jsonify({'detail': str(e)}), 422
+    return jsonify({'id': user['id'], 'posts': len(user['posts'])})
+
+
+@app.route('/db/<int:user_id>')
+def db_user(user_id):
+    """SQLite row on this thread's reused connection."""
+    user = fetch_user(get_connection(), user_id)
+    if user is None:
+        abort(404)
+    return jsonify(user)
+
+
+@app.route('/db/<int:user_id>/connect')
+def db_user_connect(user_id):
+    """SQLite row on a connection opened for this request."""
+    user = fetch_user_fresh(user_id)
+    if user is None:
+        abort(404)
+    return jsonify(user)
+
+
+@app.route('/files/<name>')
+def file_download(name):
+    """File of the given size via send_file."""
+    path = file_path(name)
+    if path is None:
+        abort(404)
+    return send_file(path)
+
+
+@app.route('/file-support')
+def file_support():
+    """Whether the server offers wsgi.file_wrapper."""
+    return jsonify(wsgi_file_support(request.environ))
+
+
+@app.route('/stream/chunked')
+def stream_chunked():
+    """1 KB chunks from a generator, streamed by the WSGI server."""
+    return Response(iter_chunks(), mimetype='text/plain')
+
+
+@app.route('/stream/sse')
+def stream_sse():
+    """Server-sent events from a generator."""
+    return Response(iter_sse(), mimetype='text/event-stream')
+
+
 @app.route('/health')
 def health():
     """Health check endpoint."""
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Benchmark web framework overhead in-process, without a server or sockets.
+
+Calls each app's WSGI or ASGI callable directly with a pre-built environ/scope,
+so the numbers are pure framework cost: routing, request/response objects and
+JSON serialization. No HTTP parsing, no event loop I/O, no kernel time.
+
+Usage:
+    python in_process.py [--iterations 10000] [--frameworks flask fastapi]
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib
+import io
+import statistics
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    collect_results,
+    print_comparison_table,
+    print_error,
+    print_header,
+    print_skip_message,
+    print_subheader,
+    time_operation,
+)
+
+from web_frameworks.benchmark_servers import SERVERS, ServerConfig
+
+CATEGORY = 'web_in_process'
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_ITERATIONS = 10_000
+
+HOST = '127.0.0.1'
+PORT = 8000
+
+
+# =============================================================================
+# App Loading
+# =============================================================================
+
+
+def load_app(server: ServerConfig) -> Any:
+    """Import the app the same way Granian does (module:attr relative to this directory)."""
+    if str(SCRIPT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPT_DIR))
+
+    module_name, attr = server.module.split(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+# =============================================================================
+# WSGI
+# =============================================================================
+
+
+def make_environ(
+    path: str = '/',
+    method: str = 'GET',
+    body: bytes = b'',
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Build a WSGI environ for a request; copy it per call since apps mutate it."""
+    path, _, query = path.partition('?')
+    environ: dict[str, Any] = {
+        'REQUEST_METHOD': method,
+        'SCRIPT_NAME': '',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SERVER_NAME': HOST,
+        'SERVER_PORT': str(PORT),
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'REMOTE_ADDR': HOST,
+        'HTTP_HOST': f'{HOST}:{PORT}',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    if body:
+        environ['CONTENT_LENGTH'] = str(len(body))
+    for name, value in (headers or {}).items():
+        key = name.upper().replace('-', '_')
+        if key in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            environ[key] = value
+        else:
+            environ[f'HTTP_{key}'] = value
+    return environ
+
+
+def wsgi_caller(app: Any, environ: dict[str, Any]) -> Callable[[], tuple[int, bytes]]:
+    """Return a zero-argument callable that performs one request and returns (status, body)."""
+    body = environ['wsgi.input'].getvalue()
+    status_holder: list[str] = []
+
+    def start_response(status: str, response_headers: list, exc_info: Any = None) -> Callable[[bytes], None]:
+        status_holder.append(status)
+        return lambda data: None
+
+    def call() -> tuple[int, bytes]:
+        request_environ = environ.copy()
+        request_environ['wsgi.input'] = io.BytesIO(body)
+        status_holder.clear()
+
+        response = app(request_environ, start_response)
+        try:
+            content = b''.join(response)
+        finally:
+            if hasattr(response, 'close'):
+                response.close()
+        return int(status_holder[0].split(' ', 1)[0]), content
+
+    return call
+
+
+# =============================================================================
+# ASGI
+# =============================================================================
+
+
+def make_scope(
+    path: str = '/',
+    method: str = 'GET',
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Build an ASGI HTTP scope for a request."""
+    path, _, query = path.partition('?')
+    raw_headers = [(b'host', f'{HOST}:{PORT}'.encode())]
+    raw_headers.extend((name.lower().encode(), value.encode()) for name, value in (headers or {}).items())
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0', 'spec_version': '2.3'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': raw_headers,
+        'client': (HOST, 50000),
+        'server': (HOST, PORT),
+        'state': {},
+    }
+
+
+def asgi_caller(app: Any, scope: dict[str, Any], body: bytes = b'') -> Callable[[], Any]:
+    """Return a zero-argument coroutine function that performs one request and returns (status, body)."""
+    request_message = {'type': 'http.request', 'body': body, 'more_body': False}
+    disconnect = asyncio.Event()
+
+    async def call() -> tuple[int, bytes]:
+        messages: list[dict[str, Any]] = []
+        received = False
+
+        async def receive() -> dict[str, Any]:
+            nonlocal received
+            if not received:
+                received = True
+                return request_message
+            # Only reached by apps that wait for the client to disconnect
+            await disconnect.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message: dict[str, Any]) -> None:
+            messages.append(message)
+
+        await app(dict(scope), receive, send)
+
+        status = next(m['status'] for m in messages if m['type'] == 'http.response.start')
+        content = b''.join(m.get('body', b'') for m in messages if m['type'] == 'http.response.body')
+        return status, content
+
+    return call
+
+
+class Lifespan:
+    """
+    Run an ASGI app's lifespan protocol so apps with startup hooks are fully initialized.
+
+    Apps that raise or return on the lifespan scope before completing startup
+    (Django's ASGIHandler, for one) don't support it; per the ASGI spec they are
+    run without it, and shutdown is a no-op.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.task: asyncio.Task | None = None
+        self.supported = True
+
+    async def next_event(self) -> dict[str, Any] | None:
+        """The app's next lifespan message, or None if the app task finished first."""
+        assert self.task is not None
+        event = asyncio.ensure_future(self.events.get())
+        await asyncio.wait([self.task, event], return_when=asyncio.FIRST_COMPLETED)
+        if event.done():
+            return event.result()
+        event.cancel()
+        return None
+
+    async def startup(self) -> None:
+        scope = {'type': 'lifespan', 'asgi': {'version': '3.0', 'spec_version': '2.0'}, 'state': {}}
+        self.task = asyncio.create_task(self.app(scope, self.queue.get, self.events.put))
+        await self.queue.put({'type': 'lifespan.startup'})
+        message = await self.next_event()
+        if message is None:
+            self.supported = False
+            if not self.task.cancelled():
+                self.task.exception()  # Retrieved, so asyncio doesn't log it as never retrieved
+            return
+        if message['type'] != 'lifespan.startup.complete':
+            raise RuntimeError(message.get('message', 'lifespan startup failed'))
+
+    async def shutdown(self) -> None:
+        if not self.supported or self.task is None:
+            return
+        await self.queue.put({'type': 'lifespan.shutdown'})
+        await self.next_event()
+        await self.task
+
+
+async def time_async_operation(
+    call: Callable[[], Any],
+    iterations: int = 1000,
+    warmup: int = 100,
+    repeat: int = 5,
+) -> float:
+    """
+    Like time_operation, but awaits `call()` inside an already running event loop.
+
+    Timing happens inside the loop so run_until_complete overhead isn't counted.
+    Returns median time per operation in milliseconds.
+    """
+    for _ in range(warmup):
+        await call()
+
+    gc.collect()
+    gc.disable()
+    try:
+        times: list[float] = []
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            for _ in range(iterations):
+                await call()
+            end = perf_counter_ns()
+            times.append((end - start) / iterations / 1_000_000)
+        return statistics.median(times)
+    finally:
+        gc.enable()
+
+
+async def run_with_lifespan(app: Any, coro_fn: Callable[[], Any]) -> Any:
+    """Run `coro_fn()` between the app's lifespan startup and shutdown."""
+    lifespan = Lifespan(app)
+    await lifespan.startup()
+    try:
+        return await coro_fn()
+    finally:
+        await lifespan.shutdown()
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+
+def measure_request(
+    server: ServerConfig,
+    app: Any,
+    path: str,
+    iterations: int,
+    method: str = 'GET',
+    body: bytes = b'',
+    headers: dict[str, str] | None = None,
+) -> float:
+    """Check one request succeeds, then time it. Returns median ms per request."""
+    if server.interface == 'wsgi':
+        call = wsgi_caller(app, make_environ(path, method, body, headers))
+        status, _ = call()
+        if status != 200:
+            raise RuntimeError(f'{method} {path} returned {status}')
+        return time_operation(call, iterations=iterations)
+
+    call = asgi_caller(app, make_scope(path, method, headers), body)
+
+    async def check_and_time() -> float:
+        status, _ = await call()
+        if status != 200:
+            raise RuntimeError(f'{method} {path} returned {status}')
+        return await time_async_operation(call, iterations=iterations)
+
+    return asyncio.run(run_with_lifespan(app, check_and_time))
+
+
+def run_benchmarks(
+    iterations: int = DEFAULT_ITERATIONS,
+    frameworks: list[str] | None = None,
+) -> dict:
+    """Run in-process framework overhead benchmarks."""
+    print_header('Web Framework Overhead (In-Process, No Networking)')
+    print(f'  ({iterations:,} requests per run, median of 5 runs)')
+
+    results: list[BenchmarkResult] = []
+    timings: list[tuple[ServerConfig, float]] = []
+    rows: list[list[str]] = []
+
+    servers = SERVERS
+    if frameworks:
+        servers = [s for s in SERVERS if s.name in frameworks]
+
+    print_subheader('GET / (JSON)')
+    for server in servers:
+        try:
+            app = load_app(server)
+        except ImportError as e:
+            print_skip_message(server.name, str(e))
+            continue
+
+        try:
+            time_ms = measure_request(server, app, '/', iterations)
+        except Exception as e:
+            print_error(f'{server.name}: {e}')
+            continue
+
+        results.append(BenchmarkResult(name=f'{server.name}_in_process_json', value=time_ms, category=CATEGORY))
+        timings.append((server, time_ms))
+
+    for server, time_ms in sorted(timings, key=lambda t: t[1]):
+        rows.append([server.name, server.interface.upper(), f'{time_ms * 1000:.1f} µs', f'{1000 / time_ms:,.0f}'])
+    print_comparison_table(['Framework', 'Interface', 'Per request', 'Req/sec (1 core)'], rows)
+
+    return collect_results(CATEGORY, results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark web framework overhead in-process (no sockets)')
+    parser.add_argument(
+        '--iterations',
+        '-n',
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help=f'Requests per timing run (default: {DEFAULT_ITERATIONS:,})',
+    )
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    args = parser.parse_args()
+
+    run_benchmarks(iterations=args.iterations, frameworks=args.frameworks)
+
+
+if __name__ == '__main__':
+    main()
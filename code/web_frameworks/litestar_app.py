@@ -1,12 +1,37 @@
 """
 Litestar benchmark application.
 
-Minimal endpoint returning JSON payload for benchmarking.
+Endpoints:
+- /: the standard JSON response
+- /json/{size}, /fast/{size} (encoded directly with msgspec), /text/{size}: 100 B, 10 KB and 1 MB
+  payloads (payloads.py)
+- POST /users: body validated with msgspec Structs
+- /sync, /async, /sync/db, /async/db: sync and async handlers, plain and with a blocking SQLite read
+- /stream/chunked, /stream/sse: streaming responses
+- /ws/echo, /ws/broadcast: WebSockets
+- /db/{id}, /db/{id}/connect: a SQLite row on a reused or a fresh connection (db.py)
+- /files/{size}: file responses (files.py)
+
 Run with: uvicorn litestar_app:app --host 127.0.0.1 --port 8005 --workers 4
 """
 
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import msgspec
 import uvicorn
-from litestar import Litestar, get
+from litestar import Litestar, MediaType, Request, Response, get, post, websocket
+from litestar.connection import WebSocket
+from litestar.exceptions import NotFoundException, WebSocketDisconnect
+from litestar.response import File, ServerSentEvent, ServerSentEventMessage, Stream
+
+# Shared payloads live next to this file (apps are also imported as top-level modules)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from db import blocking_query, fetch_user, fetch_user_fresh, get_connection
+from files import asgi_file_support, file_path
+from payloads import SIZES, SSE_DATA, aiter_chunks, broadcast_text, get_json_payload, get_text_payload
 
 # Standard response payload
 RESPONSE_DATA = {
@@ -26,13 +51,196 @@ async def index() -> dict:
     return RESPONSE_DATA
 
 
+@get('/sync', sync_to_thread=True)
+def index_sync() -> dict:
+    """Root endpoint from a sync handler, offloaded to Litestar's threadpool."""
+    return RESPONSE_DATA
+
+
+@get('/async')
+async def index_async() -> dict:
+    """Root endpoint returning JSON (async)."""
+    return RESPONSE_DATA
+
+
+@get('/sync/db', sync_to_thread=True)
+def db_sync() -> dict:
+    """Blocking SQLite read in a sync handler (threadpool)."""
+    return blocking_query()
+
+
+@get('/async/db')
+async def db_async() -> dict:
+    """Blocking SQLite read in an async handler, stalling the event loop while it runs."""
+    return blocking_query()
+
+
+@get('/json/{size:str}')
+async def json_payload(size: str) -> dict:
+    """JSON payload of the given size via Litestar's default (msgspec) serialization."""
+    if size not in SIZES:
+        raise NotFoundException()
+    return get_json_payload(size)
+
+
+@get('/fast/{size:str}')
+async def fast_payload(size: str) -> Response[bytes]:
+    """JSON payload encoded directly with msgspec, skipping return-type handling."""
+    if size not in SIZES:
+        raise NotFoundException()
+    return Response(content=msgspec.json.encode(get_json_payload(size)), media_type=MediaType.JSON)
+
+
+@get('/text/{size:str}', media_type=MediaType.TEXT)
+async def text_payload(size: str) -> str:
+    """Plain text payload of the given size."""
+    if size not in SIZES:
+        raise NotFoundException()
+    return get_text_payload(size)
+
+
+class Profile(msgspec.Struct):
+    bio: str
+    location: str
+    website: str
+    joined: datetime
+
+
+class Post(msgspec.Struct):
+    id: int
+    title: str
+    tags: list[str]
+    views: int
+
+
+class UserSettings(msgspec.Struct):
+    theme: str
+    notifications: bool
+    email_frequency: str
+
+
+class User(msgspec.Struct):
+    id: int
+    username: str
+    email: str
+    profile: Profile
+    posts: list[Post]
+    settings: UserSettings
+
+
+@post('/users', status_code=200)
+async def create_user(data: User) -> dict:
+    """Accept a COMPLEX_OBJ-shaped user, validated by msgspec."""
+    return {'id': data.id, 'posts': len(data.posts)}
+
+
+@get('/db/{user_id:int}', sync_to_thread=True)
+def db_user(user_id: int) -> dict:
+    """SQLite row on this thread's reused connection (sync handler offloaded to the threadpool)."""
+    user = fetch_user(get_connection(), user_id)
+    if user is None:
+        raise NotFoundException()
+    return user
+
+
+@get('/db/{user_id:int}/connect', sync_to_thread=True)
+def db_user_connect(user_id: int) -> dict:
+    """SQLite row on a connection opened for this request."""
+    user = fetch_user_fresh(user_id)
+    if user is None:
+        raise NotFoundException()
+    return user
+
+
+@get('/files/{name:str}')
+async def file_download(name: str) -> File:
+    """File of the given size via Litestar's File response."""
+    path = file_path(name)
+    if path is None:
+        raise NotFoundException()
+    return File(path=path)
+
+
+@get('/file-support')
+async def file_support(request: Request) -> dict:
+    """Zero-copy extensions the server offers."""
+    return asgi_file_support(request.scope)
+
+
+@get('/stream/chunked')
+async def stream_chunked() -> Stream:
+    """1 KB chunks with chunked transfer encoding."""
+    return Stream(aiter_chunks(), media_type=MediaType.TEXT)
+
+
+async def sse_messages():
+    for i, data in enumerate(SSE_DATA):
+        yield ServerSentEventMessage(data=data, id=str(i))
+
+
+@get('/stream/sse')
+async def stream_sse() -> ServerSentEvent:
+    """Server-sent events via Litestar's ServerSentEvent response."""
+    return ServerSentEvent(sse_messages())
+
+
+@websocket('/ws/echo')
+async def ws_echo(socket: WebSocket) -> None:
+    """Send every text message straight back."""
+    await socket.accept()
+    try:
+        while True:
+            await socket.send_text(await socket.receive_text())
+    except WebSocketDisconnect:
+        pass
+
+
+# Clients of /ws/broadcast connected to this worker
+broadcast_clients: set[WebSocket] = set()
+
+
+@websocket('/ws/broadcast')
+async def ws_broadcast(socket: WebSocket) -> None:
+    """Send every text message to all clients connected to this worker, sender included."""
+    await socket.accept()
+    broadcast_clients.add(socket)
+    try:
+        while True:
+            await broadcast_text(broadcast_clients, await socket.receive_text())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broadcast_clients.discard(socket)
+
+
 @get('/health')
 async def health() -> dict:
     """Health check endpoint."""
     return {'status': 'healthy'}
 
 
-app = Litestar([index, health])
+app = Litestar(
+    [
+        index,
+        index_sync,
+        index_async,
+        db_sync,
+        db_async,
+        json_payload,
+        fast_payload,
+        text_payload,
+        create_user,
+        db_user,
+        db_user_connect,
+        file_download,
+        file_support,
+        stream_chunked,
+        stream_sse,
+        ws_echo,
+        ws_broadcast,
+        health,
+    ]
+)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,684 @@
+#!/usr/bin/env python3
+"""
+Built-in HTTP load generator (a pure-Python replacement for wrk/hey).
+
+Drives an HTTP/1.1 server over raw asyncio TCP streams with keep-alive
+connections and optional request pipelining, in either fixed-duration or
+fixed-request-count mode. --no-keepalive opens a new connection per request
+instead, so TCP setup and teardown is part of every request. Load can be spread over several processes when a
+single Python process can't saturate the server.
+
+Two load models:
+- Closed loop (default, like wrk): each connection sends the next request as
+  soon as the previous response arrives. When the server stalls the client
+  stops sending too, so the stall hides in a handful of samples
+  ("coordinated omission") and tail latency is understated.
+- Open loop (--rate): requests are scheduled at a constant arrival rate and
+  latency is measured from the *intended* send time, so time spent waiting
+  behind a stalled server counts (like wrk2). --sweep runs several rates and
+  reports the latency-vs-throughput curve and the saturation point.
+
+Results are structured (LoadResult) rather than text: request and error
+counts, throughput and a log-linear latency histogram with percentiles.
+
+Usage:
+    python load_generator.py http://127.0.0.1:8000/ -c 100 -d 10
+    python load_generator.py http://127.0.0.1:8000/ -c 50 -n 100000 --pipeline 8 --processes 4 --json
+    python load_generator.py http://127.0.0.1:8000/ -c 50 --no-keepalive
+    python load_generator.py http://127.0.0.1:8000/ -c 200 --rate 5000
+    python load_generator.py http://127.0.0.1:8000/ -c 200 --sweep 1000 2000 4000 8000 16000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+from urllib.parse import urlsplit
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import format_bytes
+
+PERCENTILES = [50, 75, 90, 99, 99.9, 99.99]
+READ_CHUNK = 1024 * 1024
+
+
+# =============================================================================
+# Latency Histogram
+# =============================================================================
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies in microseconds.
+
+    Values below 2**SUB_BUCKET_BITS are exact; larger values keep the top
+    SUB_BUCKET_BITS bits, so every bucket is within 1/128 (< 1%) of the true value.
+    Buckets are sparse, so histograms are cheap to merge and serialize.
+    """
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        self.counts: Counter[int] = Counter()
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    @classmethod
+    def bucket_index(cls, value_us: int) -> int:
+        if value_us < cls.SUB_BUCKETS:
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return cls.SUB_BUCKETS + shift * cls.SUB_BUCKETS + (value_us >> shift) - cls.SUB_BUCKETS
+
+    @classmethod
+    def bucket_value(cls, index: int) -> int:
+        """Representative (midpoint) value of a bucket in microseconds."""
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift, sub = divmod(index - cls.SUB_BUCKETS, cls.SUB_BUCKETS)
+        return ((sub + cls.SUB_BUCKETS) << shift) + (1 << shift) // 2
+
+    def record(self, value_us: int) -> None:
+        value_us = max(value_us, 0)
+        self.counts[self.bucket_index(value_us)] += 1
+        if not self.count or value_us < self.min_us:
+            self.min_us = value_us
+        self.max_us = max(self.max_us, value_us)
+        self.count += 1
+        self.total_us += value_us
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        if not other.count:
+            return
+        self.min_us = min(self.min_us, other.min_us) if self.count else other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total_us += other.total_us
+
+    def percentile(self, p: float) -> int:
+        """Latency in microseconds at percentile p (0-100)."""
+        if not self.count:
+            return 0
+        target = max(1, round(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.bucket_value(index), self.max_us)
+        return self.max_us
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'total_us': self.total_us,
+            'min_us': self.min_us,
+            'max_us': self.max_us,
+            'buckets': {str(index): n for index, n in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'LatencyHistogram':
+        histogram = cls()
+        histogram.counts = Counter({int(index): n for index, n in data['buckets'].items()})
+        histogram.count = data['count']
+        histogram.total_us = data['total_us']
+        histogram.min_us = data['min_us']
+        histogram.max_us = data['max_us']
+        return histogram
+
+
+# =============================================================================
+# Configuration and Results
+# =============================================================================
+
+
+@dataclass
+class LoadConfig:
+    url: str
+    connections: int = 100
+    duration: float | None = 10.0  # Seconds; ignored when `requests` is set
+    requests: int | None = None  # Fixed total request count
+    pipeline: int = 1  # Requests written per batch on each connection
+    timeout: float = 5.0  # Seconds to wait for a batch of responses
+    method: str = 'GET'
+    body: bytes = b''
+    headers: dict[str, str] = field(default_factory=dict)
+    rate: float | None = None  # Open loop: total requests/sec to schedule (pipeline is ignored)
+    keep_alive: bool = True  # False: send "Connection: close" and reconnect for every request (no pipelining)
+
+
+@dataclass
+class LoadResult:
+    requests: int = 0
+    duration_s: float = 0.0
+    bytes_received: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # Open loop only: offered rate, and latency from actual (not intended) send time
+    target_rate: float | None = None
+    service_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def requests_per_sec(self) -> float:
+        return self.requests / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes_received / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def latency_ms(self, p: float) -> float:
+        return self.latency.percentile(p) / 1000
+
+    def merge(self, other: 'LoadResult') -> None:
+        """Combine results from concurrent runs (e.g. one per process)."""
+        self.requests += other.requests
+        self.duration_s = max(self.duration_s, other.duration_s)
+        self.bytes_received += other.bytes_received
+        self.errors.update(other.errors)
+        self.latency.merge(other.latency)
+        self.service_latency.merge(other.service_latency)
+        if other.target_rate is not None:
+            self.target_rate = (self.target_rate or 0) + other.target_rate
+
+    def summary(self) -> dict[str, Any]:
+        """Headline numbers, without the raw histogram buckets."""
+        summary = {
+            'requests': self.requests,
+            'duration_s': self.duration_s,
+            'requests_per_sec': self.requests_per_sec,
+            'bytes_per_sec': self.bytes_per_sec,
+            'errors': dict(self.errors),
+            'latency_ms': histogram_summary_ms(self.latency),
+        }
+        if self.target_rate is not None:
+            summary['target_rate'] = self.target_rate
+            summary['service_latency_ms'] = histogram_summary_ms(self.service_latency)
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {
+            **self.summary(),
+            'bytes_received': self.bytes_received,
+            'histogram': self.latency.to_dict(),
+        }
+        if self.target_rate is not None:
+            data['service_histogram'] = self.service_latency.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'LoadResult':
+        result = cls(
+            requests=data['requests'],
+            duration_s=data['duration_s'],
+            bytes_received=data['bytes_received'],
+            errors=Counter(data['errors']),
+            latency=LatencyHistogram.from_dict(data['histogram']),
+            target_rate=data.get('target_rate'),
+        )
+        if 'service_histogram' in data:
+            result.service_latency = LatencyHistogram.from_dict(data['service_histogram'])
+        return result
+
+
+def histogram_summary_ms(histogram: LatencyHistogram) -> dict[str, float]:
+    return {
+        'mean': histogram.mean_us / 1000,
+        'min': histogram.min_us / 1000,
+        'max': histogram.max_us / 1000,
+        **{f'p{p:g}': histogram.percentile(p) / 1000 for p in PERCENTILES},
+    }
+
+
+# =============================================================================
+# HTTP/1.1 Client
+# =============================================================================
+
+
+def build_request(config: LoadConfig) -> tuple[str, int, bytes]:
+    """Pre-encode the request once; returns (host, port, request bytes)."""
+    url = urlsplit(config.url)
+    if url.scheme != 'http':
+        raise ValueError(f'Only http:// URLs are supported: {config.url}')
+
+    host = url.hostname or '127.0.0.1'
+    port = url.port or 80
+    target = url.path or '/'
+    if url.query:
+        target += f'?{url.query}'
+
+    lines = [
+        f'{config.method} {target} HTTP/1.1',
+        f'Host: {host}:{port}',
+        'User-Agent: python-benchmarks-loadgen',
+        'Accept: */*',
+    ]
+    if not config.keep_alive:
+        lines.append('Connection: close')
+    lines.extend(f'{name}: {value}' for name, value in config.headers.items())
+    if config.body or config.method in ('POST', 'PUT', 'PATCH'):
+        lines.append(f'Content-Length: {len(config.body)}')
+
+    return host, port, ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + config.body
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, int, bool]:
+    """Read one response; returns (status, bytes read, connection reusable)."""
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head[9:12])
+
+    content_length = None
+    chunked = False
+    keep_alive = True
+    for line in head.split(b'\r\n')[1:]:
+        name, _, value = line.partition(b':')
+        name = name.strip().lower()
+        if name == b'content-length':
+            content_length = int(value)
+        elif name == b'transfer-encoding':
+            chunked = b'chunked' in value.lower()
+        elif name == b'connection':
+            keep_alive = value.strip().lower() != b'close'
+
+    size = len(head)
+    if chunked:
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            chunk_size = int(line.split(b';', 1)[0], 16)
+            size += len(line)
+            if chunk_size == 0:
+                size += len(await reader.readuntil(b'\r\n'))
+                break
+            await reader.readexactly(chunk_size + 2)
+            size += chunk_size + 2
+    elif content_length is not None:
+        # Read in pieces: large bodies (file downloads) would otherwise be materialized whole
+        remaining = content_length
+        while remaining:
+            data = await reader.read(min(remaining, READ_CHUNK))
+            if not data:
+                raise asyncio.IncompleteReadError(b'', remaining)
+            remaining -= len(data)
+        size += content_length
+    else:
+        # No framing: the body runs until the server closes the connection
+        size += len(await reader.read())
+        keep_alive = False
+
+    return status, size, keep_alive
+
+
+class RequestBudget:
+    """Hands out requests to connections until the deadline or request count is reached."""
+
+    def __init__(self, config: LoadConfig):
+        self.remaining = config.requests
+        self.deadline = None
+        if config.requests is None:
+            self.deadline = perf_counter_ns() + int((config.duration or 0) * 1e9)
+
+    def take(self, n: int) -> int:
+        if self.remaining is None:
+            return n if perf_counter_ns() < self.deadline else 0
+        n = min(n, self.remaining)
+        self.remaining -= n
+        return n
+
+
+async def run_connection(
+    host: str,
+    port: int,
+    request: bytes,
+    config: LoadConfig,
+    budget: RequestBudget,
+    result: LoadResult,
+) -> None:
+    """
+    Closed loop: send a batch of `pipeline` requests, wait for every response, repeat.
+
+    Without keep-alive every request gets its own connection, and its latency
+    includes the TCP handshake.
+    """
+    batch = budget.take(config.pipeline)
+    while batch:
+        connect_start = perf_counter_ns()
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            result.errors['connect'] += 1
+            await asyncio.sleep(0.01)
+            batch = budget.take(config.pipeline)  # The failed batch counts, so a dead port still ends the run
+            continue
+
+        try:
+            while batch:
+                start = perf_counter_ns() if config.keep_alive else connect_start
+                writer.write(request * batch)
+                keep_alive = True
+                async with asyncio.timeout(config.timeout):
+                    for answered in range(1, batch + 1):
+                        status, size, keep_alive = await read_response(reader)
+                        result.latency.record((perf_counter_ns() - start) // 1000)
+                        result.requests += 1
+                        result.bytes_received += size
+                        if status >= 400:
+                            result.errors[f'status_{status}'] += 1
+                        if not keep_alive:
+                            if answered < batch:
+                                result.errors['closed'] += batch - answered  # Pipelined requests left unanswered
+                            break
+                batch = budget.take(config.pipeline)
+                if not keep_alive or not config.keep_alive:
+                    break
+        except TimeoutError:
+            result.errors['timeout'] += 1
+            batch = budget.take(config.pipeline)
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            result.errors['read'] += 1
+            batch = budget.take(config.pipeline)
+        finally:
+            writer.close()
+
+
+class ArrivalSchedule:
+    """Open loop: intended send times at a constant rate, shared by all connections."""
+
+    def __init__(self, config: LoadConfig):
+        self.interval_ns = 1e9 / config.rate
+        self.start = perf_counter_ns()
+        self.index = 0
+        self.limit = config.requests
+        self.deadline = None
+        if config.requests is None:
+            self.deadline = self.start + int((config.duration or 0) * 1e9)
+
+    def next(self) -> int | None:
+        """Intended send time (perf_counter_ns) of the next request, or None when done."""
+        if self.limit is not None and self.index >= self.limit:
+            return None
+        intended = self.start + int(self.index * self.interval_ns)
+        if self.deadline is not None and intended >= self.deadline:
+            return None
+        self.index += 1
+        return intended
+
+
+async def run_open_loop_connection(
+    host: str,
+    port: int,
+    request: bytes,
+    config: LoadConfig,
+    schedule: ArrivalSchedule,
+    result: LoadResult,
+) -> None:
+    """
+    Open loop: wait for the next scheduled slot, send, record latency from the intended time.
+
+    A connection that falls behind sends immediately, and the time the request spent
+    waiting for it counts as latency. That is the coordinated-omission correction.
+    Use enough connections to cover rate x latency, or every request queues.
+    """
+    intended = schedule.next()
+    while intended is not None:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            result.errors['connect'] += 1
+            await asyncio.sleep(0.01)
+            intended = schedule.next()  # The slot is spent, so the schedule still drains against a dead port
+            continue
+
+        try:
+            while intended is not None:
+                delay_ns = intended - perf_counter_ns()
+                if delay_ns > 0:
+                    await asyncio.sleep(delay_ns / 1e9)
+
+                sent = perf_counter_ns()
+                writer.write(request)
+                async with asyncio.timeout(config.timeout):
+                    status, size, keep_alive = await read_response(reader)
+                done = perf_counter_ns()
+
+                result.latency.record((done - intended) // 1000)
+                result.service_latency.record((done - sent) // 1000)
+                result.requests += 1
+                result.bytes_received += size
+                if status >= 400:
+                    result.errors[f'status_{status}'] += 1
+
+                intended = schedule.next()
+                if not keep_alive or not config.keep_alive:
+                    break
+        except TimeoutError:
+            result.errors['timeout'] += 1
+            intended = schedule.next()
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            result.errors['read'] += 1
+            intended = schedule.next()
+        finally:
+            writer.close()
+
+
+async def run_load_async(config: LoadConfig) -> LoadResult:
+    """Run one load test in the current event loop."""
+    if not config.keep_alive:
+        config = replace(config, pipeline=1)
+    host, port, request = build_request(config)
+    result = LoadResult(target_rate=config.rate)
+
+    start = perf_counter_ns()
+    if config.rate:
+        schedule = ArrivalSchedule(config)
+        connections = (
+            run_open_loop_connection(host, port, request, config, schedule, result) for _ in range(config.connections)
+        )
+    else:
+        budget = RequestBudget(config)
+        connections = (run_connection(host, port, request, config, budget, result) for _ in range(config.connections))
+    await asyncio.gather(*connections)
+    result.duration_s = (perf_counter_ns() - start) / 1e9
+    return result
+
+
+def _run_in_process(config: LoadConfig) -> dict[str, Any]:
+    return asyncio.run(run_load_async(config)).to_dict()
+
+
+def run_load(config: LoadConfig, processes: int = 1) -> LoadResult:
+    """
+    Run a load test, optionally split across worker processes.
+
+    Connections, the open-loop rate and the request count in fixed-request mode
+    are divided between processes and their histograms merged. There are never
+    more processes than connections, so every process gets at least one.
+    """
+    processes = min(processes, config.connections)
+    if processes <= 1:
+        return asyncio.run(run_load_async(config))
+
+    configs = []
+    for i in range(processes):
+        share = replace(config, connections=config.connections // processes + (i < config.connections % processes))
+        if config.requests is not None:
+            share.requests = config.requests // processes + (1 if i < config.requests % processes else 0)
+        if config.rate:
+            share.rate = config.rate / processes
+        configs.append(share)
+
+    result = LoadResult()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for data in executor.map(_run_in_process, configs):
+            result.merge(LoadResult.from_dict(data))
+    return result
+
+
+# =============================================================================
+# Latency vs Throughput
+# =============================================================================
+
+
+def sweep_rates(config: LoadConfig, rates: list[float], processes: int = 1) -> list[LoadResult]:
+    """Run an open-loop test at each offered rate, lowest first."""
+    results = []
+    for rate in sorted(rates):
+        result = run_load(replace(config, rate=rate), processes=processes)
+        print(
+            f'  offered {rate:>10,.0f}/s  achieved {result.requests_per_sec:>10,.0f}/s  '
+            f'p50 {result.latency_ms(50):>9.2f}ms  p99 {result.latency_ms(99):>9.2f}ms  '
+            f'errors {result.error_count:,}'
+        )
+        results.append(result)
+    return results
+
+
+def find_saturation(
+    results: list[LoadResult],
+    min_achieved: float = 0.95,
+    p99_slo_ms: float | None = None,
+) -> LoadResult | None:
+    """
+    Return the highest-rate point before the server saturates.
+
+    A point is saturated once achieved throughput drops below `min_achieved` of
+    the offered rate, it has errors, or p99 exceeds `p99_slo_ms` (if given).
+    """
+    saturation = None
+    for result in sorted(results, key=lambda r: r.target_rate or 0):
+        keeping_up = result.requests_per_sec >= min_achieved * (result.target_rate or 0)
+        within_slo = p99_slo_ms is None or result.latency_ms(99) <= p99_slo_ms
+        if not keeping_up or not within_slo or result.error_count:
+            break
+        saturation = result
+    return saturation
+
+
+def latency_curve(results: list[LoadResult], saturation: LoadResult | None) -> dict[str, Any]:
+    """Structured latency-vs-throughput curve for JSON output."""
+    return {
+        'points': [
+            {
+                'offered_rate': r.target_rate,
+                'achieved_rate': r.requests_per_sec,
+                'latency_ms': histogram_summary_ms(r.latency),
+                'service_latency_ms': histogram_summary_ms(r.service_latency),
+                'errors': dict(r.errors),
+            }
+            for r in results
+        ],
+        'saturation_rate': saturation.target_rate if saturation else None,
+    }
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+
+def print_load_result(result: LoadResult) -> None:
+    """Print a wrk-style text summary."""
+    latency = result.latency
+    print(f'  Requests:      {result.requests:,} in {result.duration_s:.2f}s')
+    if result.target_rate is not None:
+        print(f'  Offered rate:  {result.target_rate:,.2f}/s (latency from intended send time)')
+    print(f'  Requests/sec:  {result.requests_per_sec:,.2f}')
+    print(f'  Transfer/sec:  {format_bytes(int(result.bytes_per_sec))}')
+    print(f'  Latency:       mean {latency.mean_us / 1000:.2f}ms, max {latency.max_us / 1000:.2f}ms')
+    for p in PERCENTILES:
+        print(f'    {f"p{p:g}":<8} {result.latency_ms(p):>10.2f}ms')
+    if result.errors:
+        errors = ', '.join(f'{kind}={n:,}' for kind, n in sorted(result.errors.items()))
+        print(f'  Errors:        {errors}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Built-in HTTP/1.1 load generator (wrk/hey replacement)')
+    parser.add_argument('url', help='Target URL, e.g. http://127.0.0.1:8000/')
+    parser.add_argument('--connections', '-c', type=int, default=100, help='Concurrent connections (default: 100)')
+    parser.add_argument('--duration', '-d', type=float, default=10, help='Test duration in seconds (default: 10)')
+    parser.add_argument('--requests', '-n', type=int, help='Send exactly this many requests instead of a duration')
+    parser.add_argument('--pipeline', type=int, default=1, help='Pipelined requests per batch (default: 1)')
+    parser.add_argument(
+        '--no-keepalive',
+        action='store_true',
+        help='Open a new connection for every request (Connection: close)',
+    )
+    parser.add_argument(
+        '--processes',
+        '-P',
+        type=int,
+        default=1,
+        help=f'Load generator processes (default: 1, this machine has {os.cpu_count()} CPUs)',
+    )
+    parser.add_argument('--rate', '-R', type=float, help='Open loop: constant arrival rate in requests/sec')
+    parser.add_argument('--sweep', type=float, nargs='+', help='Open loop: sweep these rates and find saturation')
+    parser.add_argument('--slo-ms', type=float, help='Sweep: p99 latency above this counts as saturated')
+    parser.add_argument('--timeout', type=float, default=5.0, help='Response timeout in seconds (default: 5)')
+    parser.add_argument('--method', '-m', default='GET', help='HTTP method (default: GET)')
+    parser.add_argument('--body', default='', help='Request body')
+    parser.add_argument('--header', '-H', action='append', default=[], help='Extra header, e.g. "Content-Type: x"')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    headers = {}
+    for header in args.header:
+        name, sep, value = header.partition(':')
+        if not sep or not name.strip():
+            parser.error(f'--header expects "Name: value", got {header!r}')
+        headers[name.strip()] = value.strip()
+
+    config = LoadConfig(
+        url=args.url,
+        connections=args.connections,
+        duration=args.duration,
+        requests=args.requests,
+        pipeline=args.pipeline,
+        timeout=args.timeout,
+        method=args.method.upper(),
+        body=args.body.encode(),
+        headers=headers,
+        rate=args.rate,
+        keep_alive=not args.no_keepalive,
+    )
+
+    if args.sweep:
+        results = sweep_rates(config, args.sweep, processes=args.processes)
+        saturation = find_saturation(results, p99_slo_ms=args.slo_ms)
+        if args.json:
+            print(json.dumps(latency_curve(results, saturation), indent=2))
+        elif saturation:
+            print(f'  Saturation:    {saturation.target_rate:,.0f}/s (p99 {saturation.latency_ms(99):.2f}ms)')
+        else:
+            print('  Saturation:    below the lowest offered rate')
+        return
+
+    result = run_load(config, processes=args.processes)
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_load_result(result)
+
+
+if __name__ == '__main__':
+    main()
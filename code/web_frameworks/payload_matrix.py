@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Payload-size matrix: every framework x every payload endpoint.
+
+Each app serves /json/<size> (default serializer), /fast/<size> (orjson, or
+msgspec in Litestar) and /text/<size> at 100 B, 10 KB and 1 MB (see payloads.py).
+Serialization dominates at larger sizes, so the 100-byte "/" endpoint alone
+says little about real responses.
+
+Two modes:
+- Server (default): each framework on Granian, driven by the load tool
+- --in-process: WSGI/ASGI callables called directly (in_process.py), no sockets
+
+Usage:
+    python payload_matrix.py [--frameworks flask fastapi] [--in-process]
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    collect_results,
+    format_bytes,
+    print_comparison_table,
+    print_error,
+    print_header,
+    print_skip_message,
+    print_subheader,
+)
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    DEFAULT_WORKERS,
+    SERVERS,
+    check_tool,
+    get_granian_command,
+    run_load_tool,
+    start_server,
+    stop_server,
+)
+from web_frameworks.in_process import load_app, measure_request
+from web_frameworks.payloads import ENDPOINTS
+
+CATEGORY = 'web_payloads'
+IN_PROCESS_ITERATIONS = 200
+
+
+@dataclass
+class RequestCase:
+    """One column of a matrix: a GET of `path`, or a JSON POST when `body` is set."""
+
+    label: str
+    path: str
+    body: bytes | None = None
+    frameworks: tuple[str, ...] = ()  # Only these frameworks serve it (default: all)
+
+    def applies_to(self, framework: str) -> bool:
+        return not self.frameworks or framework in self.frameworks
+
+
+PAYLOAD_CASES = [RequestCase(label=path, path=path) for path in ENDPOINTS]
+
+
+def result_name(framework: str, label: str) -> str:
+    """e.g. ('fastapi', '/json/10kb') -> 'fastapi_json_10kb'."""
+    return f'{framework}_{label.strip("/").replace("/", "_")}'
+
+
+def run_server_matrix(
+    cases: list[RequestCase],
+    tool: str,
+    duration: int,
+    connections: int,
+    threads: int,
+    workers: int,
+    port: int,
+    frameworks: list[str] | None,
+) -> dict[str, dict[str, float]]:
+    """Req/sec keyed by framework, then case label."""
+    servers = [s for s in SERVERS if not frameworks or s.name in frameworks]
+
+    table: dict[str, dict[str, float]] = {}
+    for server in servers:
+        print_subheader(f'{server.name} ({server.interface.upper()})')
+        proc = start_server(server, get_granian_command(server, port, workers), port)
+        if proc is None:
+            continue
+
+        try:
+            for case in cases:
+                if not case.applies_to(server.name):
+                    continue
+                print(f'\n{server.name} {case.label}')
+                result = run_load_tool(tool, port, duration, connections, threads, path=case.path, body=case.body)
+                if result:
+                    table.setdefault(server.name, {})[case.label] = result.requests_per_sec
+        finally:
+            stop_server(server, proc)
+
+    return table
+
+
+def run_in_process_matrix(
+    cases: list[RequestCase],
+    iterations: int,
+    frameworks: list[str] | None,
+) -> dict[str, dict[str, float]]:
+    """Req/sec on one core (1000 / ms per request) keyed by framework, then case label."""
+    servers = [s for s in SERVERS if not frameworks or s.name in frameworks]
+
+    table: dict[str, dict[str, float]] = {}
+    for server in servers:
+        try:
+            app = load_app(server)
+        except ImportError as e:
+            print_skip_message(server.name, str(e))
+            continue
+
+        for case in cases:
+            if not case.applies_to(server.name):
+                continue
+            try:
+                if case.body:
+                    headers = {'Content-Type': 'application/json', 'Content-Length': str(len(case.body))}
+                    time_ms = measure_request(server, app, case.path, iterations, 'POST', case.body, headers)
+                else:
+                    time_ms = measure_request(server, app, case.path, iterations)
+            except Exception as e:
+                print_error(f'{server.name} {case.label}: {e}')
+                continue
+            table.setdefault(server.name, {})[case.label] = 1000 / time_ms
+
+    return table
+
+
+def matrix_results(table: dict[str, dict[str, float]], category: str) -> list[BenchmarkResult]:
+    return [
+        BenchmarkResult(name=result_name(framework, label), value=rps, unit='req/sec', category=category)
+        for framework, by_label in table.items()
+        for label, rps in by_label.items()
+    ]
+
+
+def print_matrix(table: dict[str, dict[str, float]], cases: list[RequestCase]):
+    """Print framework rows x case columns of req/sec."""
+    print_subheader('Requests/sec')
+    labels = [case.label for case in cases]
+    rows = [
+        [framework, *(f'{by_label[label]:,.0f}' if label in by_label else '-' for label in labels)]
+        for framework, by_label in table.items()
+    ]
+    print_comparison_table(['Framework', *labels], rows)
+
+
+def run_matrix_benchmarks(
+    title: str,
+    cases: list[RequestCase],
+    category: str,
+    in_process: bool = True,
+    tool: str = 'builtin',
+    duration: int = 10,
+    connections: int = 100,
+    threads: int = 4,
+    workers: int = DEFAULT_WORKERS,
+    port: int = DEFAULT_PORT,
+    iterations: int = IN_PROCESS_ITERATIONS,
+    frameworks: list[str] | None = None,
+) -> dict:
+    """Run `cases` on every framework, in-process or on Granian, and print a framework x case table of req/sec."""
+    mode = 'in-process, 1 core' if in_process else f'Granian, {workers} workers, {tool}'
+    print_header(f'{title} ({mode})')
+    for case in cases:
+        if case.body:
+            print(f'  {case.label}: {format_bytes(len(case.body))}')
+
+    if in_process:
+        table = run_in_process_matrix(cases, iterations, frameworks)
+    else:
+        table = run_server_matrix(cases, tool, duration, connections, threads, workers, port, frameworks)
+
+    print_matrix(table, cases)
+    return collect_results(category, matrix_results(table, category))
+
+
+def matrix_main(
+    description: str,
+    title: str,
+    cases: list[RequestCase],
+    category: str,
+    default_iterations: int = IN_PROCESS_ITERATIONS,
+    per: str = 'endpoint',
+):
+    """Command line shared by the matrix benchmarks; `per` names a case in the --duration help."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='Call the apps directly instead of running servers',
+    )
+    parser.add_argument(
+        '--tool',
+        '-t',
+        choices=['wrk', 'hey', 'builtin'],
+        default='wrk' if check_tool('wrk') else 'builtin',
+        help='Benchmark tool to use (default: wrk if installed, else builtin)',
+    )
+    parser.add_argument('--duration', '-d', type=int, default=10, help=f'Seconds per {per} (default: 10)')
+    parser.add_argument('--connections', '-c', type=int, default=100, help='Concurrent connections (default: 100)')
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=4,
+        help='Number of threads for wrk, or processes for the built-in generator (default: 4)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of Granian workers (default: {DEFAULT_WORKERS})',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--iterations',
+        '-n',
+        type=int,
+        default=default_iterations,
+        help=f'In-process requests per timing run (default: {default_iterations})',
+    )
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if not args.in_process:
+        if args.tool != 'builtin' and not check_tool(args.tool):
+            print(f'Error: {args.tool} not found.')
+            sys.exit(1)
+        if not check_tool('granian'):
+            print('Error: granian not found.')
+            print('Install with: pip install granian')
+            sys.exit(1)
+
+    results = run_matrix_benchmarks(
+        title,
+        cases,
+        category,
+        in_process=args.in_process,
+        tool=args.tool,
+        duration=args.duration,
+        connections=args.connections,
+        threads=args.threads,
+        workers=args.workers,
+        port=args.port,
+        iterations=args.iterations,
+        frameworks=args.frameworks,
+    )
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps(results, indent=2))
+
+
+def run_benchmarks(**kwargs) -> dict:
+    """Run the payload matrix and print a framework x endpoint table of req/sec."""
+    return run_matrix_benchmarks('Web Payload Matrix', PAYLOAD_CASES, CATEGORY, **kwargs)
+
+
+def main():
+    matrix_main('Benchmark every framework on every payload endpoint', 'Web Payload Matrix', PAYLOAD_CASES, CATEGORY)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+Request and response payloads shared by the benchmark apps.
+
+Every app exposes the same parametrized endpoints, keyed by size name:
+- /json/<size>  JSON via the framework's default serializer
+- /fast/<size>  JSON via the framework's fastest path (orjson, msgspec in Litestar)
+- /text/<size>  plain text
+
+Sizes are approximate serialized lengths: 100 B, 10 KB and 1 MB, each built on
+first request.
+
+And a POST /users endpoint that validates a COMPLEX_OBJ-shaped user with the
+framework's idiomatic tool (pydantic, msgspec) or validate_user() where the
+framework has none. request_body() builds users with 3 to 1000 posts.
+
+Streaming endpoints send the same content everywhere:
+- /stream/chunked  STREAM_CHUNKS chunks of 1 KB (chunked transfer encoding)
+- /stream/sse      SSE_EVENTS server-sent events
+"""
+
+import copy
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+SIZES = {
+    '100b': 100,
+    '10kb': 10 * 1024,
+    '1mb': 1024 * 1024,
+}
+
+
+def build_json_payload(size: int) -> dict:
+    """A list of user records, as many as fit in `size` bytes of JSON (at least one)."""
+    payload: dict = {'status': 'ok', 'items': []}
+    length = len(json.dumps(payload))
+    i = 0
+    while True:
+        item = {'id': 100_000 + i, 'username': f'user_{i}', 'email': f'user_{i}@example.com'}
+        item_length = len(json.dumps(item)) + 2  # ", " separator
+        if payload['items'] and length + item_length > size:
+            return payload
+        payload['items'].append(item)
+        length += item_length
+        i += 1
+
+
+def build_text_payload(size: int) -> str:
+    line = 'Hello, World! '
+    return (line * (size // len(line) + 1))[:size]
+
+
+# Payloads are built on first request per size, not at import, so they stay out of worker startup (cold_start.py)
+@cache
+def get_json_payload(name: str) -> dict:
+    """JSON payload for a size name in SIZES."""
+    return build_json_payload(SIZES[name])
+
+
+@cache
+def get_text_payload(name: str) -> str:
+    """Text payload for a size name in SIZES."""
+    return build_text_payload(SIZES[name])
+
+
+ENDPOINTS = [f'/{kind}/{size}' for kind in ('json', 'fast', 'text') for size in SIZES]
+
+
+# =============================================================================
+# Request Bodies
+# =============================================================================
+
+
+# A copy of utils.benchmark.COMPLEX_OBJ: importing utils.benchmark (and colorama) would add to every worker's startup
+USER_BODY = {
+    'id': 12345,
+    'username': 'alice_dev',
+    'email': 'alice@example.com',
+    'profile': {
+        'bio': 'Software engineer who loves Python',
+        'location': 'Portland, OR',
+        'website': 'https://alice.dev',
+        'joined': '2020-03-15T08:30:00Z',
+    },
+    'posts': [
+        {'id': 1, 'title': 'First Post', 'tags': ['python', 'tutorial'], 'views': 1520},
+        {'id': 2, 'title': 'Second Post', 'tags': ['rust', 'wasm'], 'views': 843},
+        {'id': 3, 'title': 'Third Post', 'tags': ['python', 'async'], 'views': 2341},
+    ],
+    'settings': {'theme': 'dark', 'notifications': True, 'email_frequency': 'weekly'},
+}
+
+
+def build_user_body(posts: int) -> dict:
+    """USER_BODY with its posts list repeated out to `posts` entries."""
+    user = copy.deepcopy(USER_BODY)
+    templates = USER_BODY['posts']
+    user['posts'] = [{**templates[i % len(templates)], 'id': i + 1} for i in range(posts)]
+    return user
+
+
+BODY_POSTS = {
+    'small': 3,
+    'medium': 50,
+    'large': 1000,
+}
+
+
+@cache
+def request_body(name: str) -> bytes:
+    """Serialized user for a body name in BODY_POSTS."""
+    return json.dumps(build_user_body(BODY_POSTS[name])).encode()
+
+
+def _require(obj: dict, fields: dict[str, type]) -> None:
+    for name, expected in fields.items():
+        value = obj.get(name)
+        # bool is an int subclass, but True is not a valid id
+        if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise ValueError(f'{name}: expected {expected.__name__}')
+
+
+def validate_user(data: Any) -> dict:
+    """Hand-written validation of a COMPLEX_OBJ-shaped user. Raises ValueError."""
+    if not isinstance(data, dict):
+        raise ValueError('expected an object')
+    _require(data, {'id': int, 'username': str, 'email': str, 'profile': dict, 'posts': list, 'settings': dict})
+
+    profile = data['profile']
+    _require(profile, {'bio': str, 'location': str, 'website': str, 'joined': str})
+    datetime.fromisoformat(profile['joined'])
+
+    for post in data['posts']:
+        if not isinstance(post, dict):
+            raise ValueError('posts: expected objects')
+        _require(post, {'id': int, 'title': str, 'tags': list, 'views': int})
+        if not all(isinstance(tag, str) for tag in post['tags']):
+            raise ValueError('tags: expected strings')
+
+    _require(data['settings'], {'theme': str, 'notifications': bool, 'email_frequency': str})
+    return data
+
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+STREAM_CHUNKS = 64
+STREAM_CHUNK = build_text_payload(1024)
+SSE_EVENTS = 64
+SSE_DATA = [json.dumps({'seq': i, 'status': 'ok', 'message': 'Hello, World!'}) for i in range(SSE_EVENTS)]
+
+
+def format_sse(event_id: int, data: str) -> str:
+    return f'id: {event_id}\ndata: {data}\n\n'
+
+
+def iter_chunks() -> Iterator[str]:
+    for _ in range(STREAM_CHUNKS):
+        yield STREAM_CHUNK
+
+
+async def aiter_chunks() -> AsyncIterator[str]:
+    """Async version, so ASGI frameworks don't iterate it in their threadpool."""
+    for _ in range(STREAM_CHUNKS):
+        yield STREAM_CHUNK
+
+
+def iter_sse() -> Iterator[str]:
+    for i, data in enumerate(SSE_DATA):
+        yield format_sse(i, data)
+
+
+async def aiter_sse() -> AsyncIterator[str]:
+    for i, data in enumerate(SSE_DATA):
+        yield format_sse(i, data)
+
+
+async def broadcast_text(clients: set, message: str) -> None:
+    """Send to every connected WebSocket (Starlette and Litestar share send_text), dropping dead ones."""
+    for client in list(clients):
+        try:
+            await client.send_text(message)
+        except Exception:
+            clients.discard(client)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Granian worker and thread scaling sweep.
+
+Runs each framework on Granian at every combination of worker count, runtime
+threads and client connections, and reports throughput, p99 latency and
+scaling efficiency relative to a single worker:
+
+    efficiency = req/sec at N workers / (N x req/sec at 1 worker)
+
+100% is perfect linear scaling; where efficiency collapses is where adding
+workers stops paying off on this host.
+
+Usage:
+    python scaling_sweep.py [--workers 1 2 4 8] [--runtime-threads 1 2] [--connections 64 256]
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import print_comparison_table, print_header, print_subheader
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    SERVERS,
+    check_tool,
+    get_granian_command,
+    run_load_tool,
+    start_server,
+    stop_server,
+)
+
+
+def default_worker_counts() -> list[int]:
+    """Powers of two up to the core count, plus the core count itself."""
+    cores = os.cpu_count() or 1
+    counts = []
+    n = 1
+    while n < cores:
+        counts.append(n)
+        n *= 2
+    counts.append(cores)
+    return counts
+
+
+@dataclass
+class ScalingPoint:
+    framework: str
+    workers: int
+    runtime_threads: int
+    connections: int
+    requests_per_sec: float
+    latency_p99_ms: float | None
+    errors: int
+    efficiency: float | None = None  # vs 1 worker at the same threads/connections
+
+
+def run_sweep(
+    tool: str = 'builtin',
+    duration: int = 10,
+    threads: int = 4,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+    worker_counts: list[int] | None = None,
+    runtime_threads: list[int] | None = None,
+    connection_counts: list[int] | None = None,
+) -> list[ScalingPoint]:
+    """Run every framework at every (workers, runtime threads, connections) point."""
+    worker_counts = sorted(set(worker_counts or default_worker_counts()))
+    runtime_threads = runtime_threads or [1]
+    connection_counts = connection_counts or [100]
+
+    print_header('Granian Scaling Sweep')
+    print(f'Workers: {worker_counts}')
+    print(f'Runtime threads: {runtime_threads}')
+    print(f'Connections: {connection_counts}')
+    print(f'Tool: {tool}, {duration}s per point')
+    print()
+
+    servers = SERVERS
+    if frameworks:
+        servers = [s for s in SERVERS if s.name in frameworks]
+
+    points: list[ScalingPoint] = []
+    for server in servers:
+        for rt_threads in runtime_threads:
+            for workers in worker_counts:
+                print_subheader(f'{server.name}: {workers} workers, {rt_threads} runtime threads')
+                proc = start_server(server, get_granian_command(server, port, workers, rt_threads), port)
+                if proc is None:
+                    continue
+
+                try:
+                    # One server start per (workers, threads); connection counts reuse it
+                    for connections in connection_counts:
+                        result = run_load_tool(tool, port, duration, connections, threads)
+                        if result is None:
+                            continue
+                        points.append(
+                            ScalingPoint(
+                                framework=server.name,
+                                workers=workers,
+                                runtime_threads=rt_threads,
+                                connections=connections,
+                                requests_per_sec=result.requests_per_sec,
+                                latency_p99_ms=result.latency_ms('p99'),
+                                errors=result.errors,
+                            )
+                        )
+                finally:
+                    stop_server(server, proc)
+
+    compute_efficiency(points)
+    return points
+
+
+def compute_efficiency(points: list[ScalingPoint]) -> None:
+    """Fill in efficiency vs the 1-worker point with the same framework, threads and connections."""
+    baselines = {(p.framework, p.runtime_threads, p.connections): p for p in points if p.workers == 1}
+    for point in points:
+        baseline = baselines.get((point.framework, point.runtime_threads, point.connections))
+        if baseline and baseline.requests_per_sec:
+            point.efficiency = point.requests_per_sec / (point.workers * baseline.requests_per_sec)
+
+
+def print_sweep(points: list[ScalingPoint]):
+    """Print one table per framework."""
+    for framework in dict.fromkeys(p.framework for p in points):
+        print_subheader(framework)
+        rows = [
+            [
+                str(p.workers),
+                str(p.runtime_threads),
+                str(p.connections),
+                f'{p.requests_per_sec:,.0f}',
+                f'{p.latency_p99_ms:.2f}ms' if p.latency_p99_ms is not None else 'N/A',
+                f'{p.efficiency:.0%}' if p.efficiency is not None else 'N/A',
+            ]
+            for p in points
+            if p.framework == framework
+        ]
+        print_comparison_table(['Workers', 'RT threads', 'Conns', 'Req/sec', 'p99', 'Efficiency'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sweep Granian workers, runtime threads and connections')
+    parser.add_argument(
+        '--tool',
+        '-t',
+        choices=['wrk', 'hey', 'builtin'],
+        default='wrk' if check_tool('wrk') else 'builtin',
+        help='Benchmark tool to use (default: wrk if installed, else builtin)',
+    )
+    parser.add_argument('--duration', '-d', type=int, default=10, help='Seconds per point (default: 10)')
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=4,
+        help='Number of threads for wrk, or processes for the built-in generator (default: 4)',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        nargs='+',
+        help=f'Worker counts (default: {" ".join(map(str, default_worker_counts()))})',
+    )
+    parser.add_argument('--runtime-threads', type=int, nargs='+', help='Granian runtime threads (default: 1)')
+    parser.add_argument('--connections', '-c', type=int, nargs='+', help='Client connections (default: 100)')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if args.tool != 'builtin' and not check_tool(args.tool):
+        print(f'Error: {args.tool} not found.')
+        sys.exit(1)
+
+    if not check_tool('granian'):
+        print('Error: granian not found.')
+        print('Install with: pip install granian')
+        sys.exit(1)
+
+    points = run_sweep(
+        tool=args.tool,
+        duration=args.duration,
+        threads=args.threads,
+        port=args.port,
+        frameworks=args.frameworks,
+        worker_counts=args.workers,
+        runtime_threads=args.runtime_threads,
+        connection_counts=args.connections,
+    )
+
+    print_header('Scaling Summary')
+    print_sweep(points)
+
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps([p.__dict__ for p in points], indent=2))
+
+
+if __name__ == '__main__':
+    main()
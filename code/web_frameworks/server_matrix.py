@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Server x framework matrix.
+
+Runs every framework app on every installed server variant that supports its
+interface (Granian, Granian + uvloop, uvicorn, gunicorn sync/gthread/uvicorn
+worker, hypercorn) and prints server-by-framework tables of req/sec and p99.
+The server choice moves throughput as much as the framework choice does.
+
+Usage:
+    python server_matrix.py [--servers granian uvicorn] [--frameworks fastapi starlette]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import print_comparison_table, print_header, print_skip_message, print_subheader
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    DEFAULT_WORKERS,
+    SERVER_VARIANTS,
+    SERVERS,
+    BenchmarkResult,
+    check_tool,
+    get_server_command,
+    run_load_tool,
+    start_server,
+    stop_server,
+)
+
+
+def run_matrix(
+    tool: str = 'builtin',
+    duration: int = 10,
+    connections: int = 100,
+    threads: int = 4,
+    workers: int = DEFAULT_WORKERS,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+    servers: list[str] | None = None,
+) -> dict[str, dict[str, BenchmarkResult]]:
+    """Return results keyed by framework, then server variant label."""
+    print_header('Server x Framework Matrix')
+    print(f'Workers: {workers}')
+    print(f'Tool: {tool}')
+    print(f'Duration: {duration}s')
+    print(f'Connections: {connections}')
+    print()
+
+    variants = [v for v in SERVER_VARIANTS if not servers or v.label in servers]
+    for variant in variants:
+        if not variant.is_installed():
+            print_skip_message(variant.label)
+    variants = [v for v in variants if v.is_installed()]
+
+    apps = SERVERS
+    if frameworks:
+        apps = [s for s in SERVERS if s.name in frameworks]
+
+    results: dict[str, dict[str, BenchmarkResult]] = {}
+    for app in apps:
+        for variant in variants:
+            if app.interface not in variant.interfaces:
+                continue
+
+            server = variant.apply(app)
+            print_subheader(f'{app.name} on {variant.label}')
+            proc = start_server(server, get_server_command(server, port, workers), port)
+            if proc is None:
+                continue
+
+            try:
+                result = run_load_tool(tool, port, duration, connections, threads)
+                if result:
+                    result.name = f'{app.name}_{variant.label}'
+                    results.setdefault(app.name, {})[variant.label] = result
+            finally:
+                stop_server(server, proc)
+
+    return results
+
+
+def print_matrix(results: dict[str, dict[str, BenchmarkResult]]):
+    """Print framework rows x server columns for req/sec and p99."""
+    labels = [v.label for v in SERVER_VARIANTS if any(v.label in by_server for by_server in results.values())]
+
+    print_subheader('Requests/sec')
+    rows = [
+        [framework, *(f'{by_server[label].requests_per_sec:,.0f}' if label in by_server else '-' for label in labels)]
+        for framework, by_server in results.items()
+    ]
+    print_comparison_table(['Framework', *labels], rows)
+
+    print_subheader('p99 latency')
+    rows = [
+        [framework, *((by_server[label].latency_p99 or 'N/A') if label in by_server else '-' for label in labels)]
+        for framework, by_server in results.items()
+    ]
+    print_comparison_table(['Framework', *labels], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every framework on every installed server')
+    parser.add_argument(
+        '--tool',
+        '-t',
+        choices=['wrk', 'hey', 'builtin'],
+        default='wrk' if check_tool('wrk') else 'builtin',
+        help='Benchmark tool to use (default: wrk if installed, else builtin)',
+    )
+    parser.add_argument('--duration', '-d', type=int, default=10, help='Seconds per cell (default: 10)')
+    parser.add_argument('--connections', '-c', type=int, default=100, help='Concurrent connections (default: 100)')
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=4,
+        help='Number of threads for wrk, or processes for the built-in generator (default: 4)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Worker processes per server (default: {DEFAULT_WORKERS})',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument(
+        '--servers',
+        '-s',
+        nargs='+',
+        choices=[v.label for v in SERVER_VARIANTS],
+        help='Specific server variants (default: all installed)',
+    )
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if args.tool != 'builtin' and not check_tool(args.tool):
+        print(f'Error: {args.tool} not found.')
+        sys.exit(1)
+
+    results = run_matrix(
+        tool=args.tool,
+        duration=args.duration,
+        connections=args.connections,
+        threads=args.threads,
+        workers=args.workers,
+        port=args.port,
+        frameworks=args.frameworks,
+        servers=args.servers,
+    )
+
+    if results:
+        print_header('Summary')
+        print_matrix(results)
+
+        if args.json:
+            print('\nJSON Results:')
+            print(
+                json.dumps(
+                    {
+                        framework: {
+                            label: {
+                                'requests_per_sec': r.requests_per_sec,
+                                'latency_avg': r.latency_avg,
+                                'latency_p99': r.latency_p99,
+                                'errors': r.errors,
+                                'details': r.details,
+                            }
+                            for label, r in by_server.items()
+                        }
+                        for framework, by_server in results.items()
+                    },
+                    indent=2,
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
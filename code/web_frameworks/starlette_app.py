@@ -1,14 +1,36 @@
 """
 Starlette benchmark application.
 
-Minimal endpoint returning JSON payload for benchmarking.
+Endpoints:
+- /: the standard JSON response
+- /json/{size}, /fast/{size} (orjson), /text/{size}: 100 B, 10 KB and 1 MB payloads (payloads.py)
+- POST /users: body validated by hand (Starlette has no validation layer)
+- /sync, /async, /sync/db, /async/db: sync and async handlers, plain and with a blocking SQLite read
+- /stream/chunked, /stream/sse: streaming responses
+- /ws/echo, /ws/broadcast: WebSockets
+- /db/{id}, /db/{id}/connect: a SQLite row on a reused or a fresh connection (db.py)
+- /files/{size}: file responses (files.py)
+
 Run with: uvicorn starlette_app:app --host 127.0.0.1 --port 8004 --workers 4
 """
 
+import sys
+from pathlib import Path
+
+import orjson
 import uvicorn
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
-from starlette.routing import Route
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+# Shared payloads live next to this file (apps are also imported as top-level modules)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from db import blocking_query, fetch_user, fetch_user_fresh, get_connection
+from files import asgi_file_support, file_path
+from payloads import SIZES, aiter_chunks, aiter_sse, broadcast_text, get_json_payload, get_text_payload, validate_user
 
 # Standard response payload
 RESPONSE_DATA = {
@@ -27,6 +49,125 @@ async def index(request):
     return JSONResponse(RESPONSE_DATA)
 
 
+def index_sync(request):
+    """Root endpoint from a plain def, which Starlette runs in its threadpool."""
+    return JSONResponse(RESPONSE_DATA)
+
+
+async def index_async(request):
+    """Root endpoint returning JSON (async)."""
+    return JSONResponse(RESPONSE_DATA)
+
+
+def db_sync(request):
+    """Blocking SQLite read in a def endpoint (threadpool)."""
+    return JSONResponse(blocking_query())
+
+
+async def db_async(request):
+    """Blocking SQLite read in an async endpoint, stalling the event loop while it runs."""
+    return JSONResponse(blocking_query())
+
+
+async def json_payload(request):
+    """JSON payload of the given size via JSONResponse (stdlib json)."""
+    size = request.path_params['size']
+    if size not in SIZES:
+        raise HTTPException(status_code=404)
+    return JSONResponse(get_json_payload(size))
+
+
+async def fast_payload(request):
+    """JSON payload serialized with orjson."""
+    size = request.path_params['size']
+    if size not in SIZES:
+        raise HTTPException(status_code=404)
+    return Response(orjson.dumps(get_json_payload(size)), media_type='application/json')
+
+
+async def text_payload(request):
+    """Plain text payload of the given size."""
+    size = request.path_params['size']
+    if size not in SIZES:
+        raise HTTPException(status_code=404)
+    return PlainTextResponse(get_text_payload(size))
+
+
+async def create_user(request):
+    """Accept a COMPLEX_OBJ-shaped user, validated by hand."""
+    try:
+        user = validate_user(await request.json())
+    except ValueError as e:
+        return JSONResponse({'detail': str(e)}, status_code=422)
+    return JSONResponse({'id': user['id'], 'posts': len(user['posts'])})
+
+
+def db_user(request):
+    """SQLite row on this thread's reused connection (plain def, so the blocking read runs in the threadpool)."""
+    user = fetch_user(get_connection(), request.path_params['user_id'])
+    if user is None:
+        raise HTTPException(status_code=404)
+    return JSONResponse(user)
+
+
+def db_user_connect(request):
+    """SQLite row on a connection opened for this request."""
+    user = fetch_user_fresh(request.path_params['user_id'])
+    if user is None:
+        raise HTTPException(status_code=404)
+    return JSONResponse(user)
+
+
+async def file_download(request):
+    """File of the given size via FileResponse."""
+    path = file_path(request.path_params['name'])
+    if path is None:
+        raise HTTPException(status_code=404)
+    return FileResponse(path)
+
+
+async def file_support(request):
+    """Zero-copy extensions the server offers."""
+    return JSONResponse(asgi_file_support(request.scope))
+
+
+async def stream_chunked(request):
+    """1 KB chunks with chunked transfer encoding."""
+    return StreamingResponse(aiter_chunks(), media_type='text/plain')
+
+
+async def stream_sse(request):
+    """Server-sent events."""
+    return StreamingResponse(aiter_sse(), media_type='text/event-stream')
+
+
+async def ws_echo(websocket: WebSocket):
+    """Send every text message straight back."""
+    await websocket.accept()
+    try:
+        while True:
+            await websocket.send_text(await websocket.receive_text())
+    except WebSocketDisconnect:
+        pass
+
+
+# Clients of /ws/broadcast connected to this worker
+broadcast_clients: set[WebSocket] = set()
+
+
+async def ws_broadcast(websocket: WebSocket):
+    """Send every text message to all clients connected to this worker, sender included."""
+    await websocket.accept()
+    broadcast_clients.add(websocket)
+    try:
+        while True:
+            await broadcast_text(broadcast_clients, await websocket.receive_text())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broadcast_clients.discard(websocket)
+
+
 async def health(request):
     """Health check endpoint."""
     return JSONResponse({'status': 'healthy'})
@@ -34,6 +175,22 @@ async def health(request):
 
 routes = [
     Route('/', index),
+    Route('/sync', index_sync),
+    Route('/async', index_async),
+    Route('/sync/db', db_sync),
+    Route('/async/db', db_async),
+    Route('/json/{size}', json_payload),
+    Route('/fast/{size}', fast_payload),
+    Route('/text/{size}', text_payload),
+    Route('/users', create_user, methods=['POST']),
+    Route('/db/{user_id:int}', db_user),
+    Route('/db/{user_id:int}/connect', db_user_connect),
+    Route('/files/{name}', file_download),
+    Route('/file-support', file_support),
+    Route('/stream/chunked', stream_chunked),
+    Route('/stream/sse', stream_sse),
+    WebSocketRoute('/ws/echo', ws_echo),
+    WebSocketRoute('/ws/broadcast', ws_broadcast),
     Route('/health', health),
 ]
 
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Streaming responses and WebSocket throughput.
+
+Per framework, on Granian with WebSockets enabled:
+- /stream/chunked and /stream/sse (all frameworks): requests/sec and bytes/sec
+  for 64 KB chunked bodies and 64-event SSE streams, via the built-in load generator
+- /ws/echo (ASGI frameworks): round-trip messages/sec and latency at each connection count
+- /ws/broadcast (ASGI frameworks): delivered messages/sec and publish-to-delivery
+  latency with one publisher fanning out to every subscriber
+
+Broadcast state lives in each worker, so the server runs a single worker by
+default; with more, a message only reaches clients of the publisher's worker.
+
+Usage:
+    python streaming.py [--frameworks fastapi litestar] [--connections 10 100 500]
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import (
+    BenchmarkResult,
+    collect_results,
+    format_bytes,
+    print_comparison_table,
+    print_header,
+    print_subheader,
+)
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    SERVERS,
+    check_tool,
+    get_granian_command,
+    start_server,
+    stop_server,
+)
+from web_frameworks.load_generator import LoadConfig, LoadResult, print_load_result, run_load
+from web_frameworks.ws_load import WsLoadConfig, print_ws_result, run_ws_load
+
+CATEGORY = 'web_streaming'
+
+STREAM_PATHS = ['/stream/chunked', '/stream/sse']
+WS_MODES = ['echo', 'broadcast']
+CONNECTION_LEVELS = [10, 100, 500]
+HTTP_CONNECTIONS = 100
+WARMUP_SECONDS = 1
+
+
+def run_streaming(
+    duration: int = 5,
+    connection_levels: list[int] | None = None,
+    http_connections: int = HTTP_CONNECTIONS,
+    processes: int = 1,
+    workers: int = 1,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+) -> dict[str, dict[str, LoadResult]]:
+    """Return results keyed by framework, then case label ('/stream/sse', 'echo/100', ...)."""
+    connection_levels = connection_levels or CONNECTION_LEVELS
+    servers = [s for s in SERVERS if not frameworks or s.name in frameworks]
+
+    results: dict[str, dict[str, LoadResult]] = {}
+    for server in servers:
+        print_subheader(f'{server.name} ({server.interface.upper()})')
+        proc = start_server(server, get_granian_command(server, port, workers, websockets=True), port)
+        if proc is None:
+            continue
+
+        try:
+            for path in STREAM_PATHS:
+                config = LoadConfig(url=f'http://127.0.0.1:{port}{path}', connections=http_connections)
+                run_load(replace(config, connections=10, duration=WARMUP_SECONDS))
+                print(f'\n{server.name} {path} with {http_connections} connections')
+                load = run_load(replace(config, duration=duration), processes=processes)
+                print_load_result(load)
+                if load.requests:
+                    results.setdefault(server.name, {})[path] = load
+
+            if server.interface != 'asgi':
+                continue
+
+            for mode in WS_MODES:
+                ws_config = WsLoadConfig(url=f'ws://127.0.0.1:{port}/ws/{mode}', mode=mode)
+                run_ws_load(replace(ws_config, connections=10, duration=WARMUP_SECONDS))
+                for connections in connection_levels:
+                    print(f'\n{server.name} /ws/{mode} with {connections} connections')
+                    load = run_ws_load(replace(ws_config, connections=connections, duration=duration), processes)
+                    print_ws_result(load)
+                    if load.requests:
+                        results.setdefault(server.name, {})[f'{mode}/{connections}'] = load
+        finally:
+            stop_server(server, proc)
+
+    return results
+
+
+def result_name(framework: str, label: str) -> str:
+    """e.g. ('fastapi', '/stream/sse') -> 'fastapi_stream_sse', ('fastapi', 'echo/100') -> 'fastapi_ws_echo_c100'."""
+    if label.startswith('/'):
+        return f'{framework}_{label.strip("/").replace("/", "_")}'
+    mode, connections = label.split('/')
+    return f'{framework}_ws_{mode}_c{connections}'
+
+
+def print_tables(results: dict[str, dict[str, LoadResult]], labels: list[str]):
+    """Framework rows x case columns for throughput, transfer and p99."""
+    tables = [
+        ('Requests/sec (streams) and messages/sec (WebSockets)', lambda r: f'{r.requests_per_sec:,.0f}'),
+        ('Transfer/sec', lambda r: format_bytes(int(r.bytes_per_sec))),
+        ('p99 latency', lambda r: f'{r.latency_ms(99):.2f}ms'),
+    ]
+    for title, cell in tables:
+        print_subheader(title)
+        rows = [
+            [framework, *(cell(by_label[label]) if label in by_label else '-' for label in labels)]
+            for framework, by_label in results.items()
+        ]
+        print_comparison_table(['Framework', *labels], rows)
+
+
+def run_benchmarks(
+    duration: int = 5,
+    connection_levels: list[int] | None = None,
+    http_connections: int = HTTP_CONNECTIONS,
+    processes: int = 1,
+    workers: int = 1,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+) -> dict:
+    """Run streaming and WebSocket benchmarks and print summary tables."""
+    connection_levels = connection_levels or CONNECTION_LEVELS
+    print_header(f'Streaming and WebSocket Throughput (Granian, {workers} worker(s))')
+    print(f'WebSocket connections: {", ".join(map(str, connection_levels))}')
+    print(f'Stream connections: {http_connections}')
+    print(f'Duration: {duration}s per case')
+
+    results = run_streaming(duration, connection_levels, http_connections, processes, workers, port, frameworks)
+
+    labels = [*STREAM_PATHS, *(f'{mode}/{n}' for mode in WS_MODES for n in connection_levels)]
+    if results:
+        print_tables(results, labels)
+
+    benchmark_results = [
+        BenchmarkResult(
+            name=result_name(framework, label),
+            value=load.requests_per_sec,
+            unit='req/sec' if label.startswith('/') else 'msg/sec',
+            category=CATEGORY,
+            details=load.summary(),
+        )
+        for framework, by_label in results.items()
+        for label, load in by_label.items()
+    ]
+    return collect_results(CATEGORY, benchmark_results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streaming responses and WebSockets per framework')
+    parser.add_argument('--duration', '-d', type=int, default=5, help='Seconds per case (default: 5)')
+    parser.add_argument(
+        '--connections',
+        '-c',
+        type=int,
+        nargs='+',
+        default=CONNECTION_LEVELS,
+        help=f'WebSocket connection counts (default: {" ".join(map(str, CONNECTION_LEVELS))})',
+    )
+    parser.add_argument(
+        '--http-connections',
+        type=int,
+        default=HTTP_CONNECTIONS,
+        help=f'Connections for the streaming endpoints (default: {HTTP_CONNECTIONS})',
+    )
+    parser.add_argument(
+        '--processes',
+        '-P',
+        type=int,
+        default=1,
+        help='Load generator processes; raise it if the client, not the server, is the bottleneck (default: 1)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=1,
+        help='Number of Granian workers (default: 1, so broadcasts reach every subscriber)',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if not check_tool('granian'):
+        print('Error: granian not found.')
+        print('Install with: pip install granian')
+        sys.exit(1)
+
+    results = run_benchmarks(
+        duration=args.duration,
+        connection_levels=args.connections,
+        http_connections=args.http_connections,
+        processes=args.processes,
+        workers=args.workers,
+        port=args.port,
+        frameworks=args.frameworks,
+    )
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Sync vs async handlers: threadpool offload and event-loop blocking.
+
+Every ASGI app serves paired endpoints:
+- /sync      def handler, run on the framework's threadpool
+- /async     async handler, run on the event loop
+- /sync/db   def handler doing a blocking SQLite read (db.py)
+- /async/db  async handler doing the same read, which stalls the event loop
+
+Django runs both as WSGI and as ASGI (django-asgi). Under ASGI its sync views
+go through sync_to_async on a single thread per worker. Flask's /sync and
+/sync/db are the plain WSGI reference.
+
+Each endpoint is measured at several connection counts: the threadpool hop is a
+fixed per-request cost at low concurrency, while a blocking call in an async
+handler serializes the whole worker as concurrency grows.
+
+Usage:
+    python sync_async.py [--frameworks fastapi django-asgi] [--connections 1 16 128]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import BenchmarkResult, collect_results, print_comparison_table, print_header, print_subheader
+
+from web_frameworks.benchmark_servers import (
+    DEFAULT_PORT,
+    SERVERS,
+    ServerConfig,
+    check_tool,
+    get_granian_command,
+    run_load_tool,
+    start_server,
+    stop_server,
+)
+from web_frameworks.benchmark_servers import BenchmarkResult as ServerResult
+from web_frameworks.db import ensure_database
+
+CATEGORY = 'web_sync_async'
+
+DJANGO_ASGI = ServerConfig(name='django-asgi', module='django_app:asgi_application', interface='asgi')
+SYNC_ASYNC_SERVERS = [*SERVERS, DJANGO_ASGI]
+
+PATHS = ['/sync', '/async', '/sync/db', '/async/db']
+SYNC_ONLY = {'flask'}  # No async views
+CONNECTION_LEVELS = [1, 16, 128]
+
+
+def paths_for(server: ServerConfig) -> list[str]:
+    return [p for p in PATHS if server.name not in SYNC_ONLY or p.startswith('/sync')]
+
+
+def result_name(framework: str, path: str, connections: int) -> str:
+    """e.g. ('fastapi', '/sync/db', 128) -> 'fastapi_sync_db_c128'."""
+    return f'{framework}_{path.strip("/").replace("/", "_")}_c{connections}'
+
+
+def run_sync_async(
+    tool: str = 'builtin',
+    duration: int = 5,
+    connection_levels: list[int] | None = None,
+    threads: int = 4,
+    workers: int = 1,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+) -> dict[str, dict[tuple[str, int], ServerResult]]:
+    """Return results keyed by framework, then (path, connections)."""
+    connection_levels = connection_levels or CONNECTION_LEVELS
+    servers = [s for s in SYNC_ASYNC_SERVERS if not frameworks or s.name in frameworks]
+
+    ensure_database()
+    results: dict[str, dict[tuple[str, int], ServerResult]] = {}
+    for server in servers:
+        print_subheader(f'{server.name} ({server.interface.upper()})')
+        proc = start_server(server, get_granian_command(server, port, workers), port)
+        if proc is None:
+            continue
+
+        try:
+            for connections in connection_levels:
+                for path in paths_for(server):
+                    print(f'\n{server.name} {path} with {connections} connections')
+                    result = run_load_tool(tool, port, duration, connections, min(threads, connections), path=path)
+                    if result:
+                        result.name = result_name(server.name, path, connections)
+                        results.setdefault(server.name, {})[(path, connections)] = result
+        finally:
+            stop_server(server, proc)
+
+    return results
+
+
+def print_tables(results: dict[str, dict[tuple[str, int], ServerResult]], connection_levels: list[int]):
+    """Print one framework x endpoint table of req/sec per connection count, then p99 at the highest."""
+    for connections in connection_levels:
+        print_subheader(f'Requests/sec, {connections} connections')
+        rows = [
+            [
+                framework,
+                *(
+                    f'{by_key[(path, connections)].requests_per_sec:,.0f}' if (path, connections) in by_key else '-'
+                    for path in PATHS
+                ),
+            ]
+            for framework, by_key in results.items()
+        ]
+        print_comparison_table(['Framework', *PATHS], rows)
+
+    connections = connection_levels[-1]
+    print_subheader(f'p99 latency, {connections} connections')
+    rows = [
+        [
+            framework,
+            *(
+                (by_key[(path, connections)].latency_p99 or 'N/A') if (path, connections) in by_key else '-'
+                for path in PATHS
+            ),
+        ]
+        for framework, by_key in results.items()
+    ]
+    print_comparison_table(['Framework', *PATHS], rows)
+
+
+def run_benchmarks(
+    tool: str = 'builtin',
+    duration: int = 5,
+    connection_levels: list[int] | None = None,
+    threads: int = 4,
+    workers: int = 1,
+    port: int = DEFAULT_PORT,
+    frameworks: list[str] | None = None,
+) -> dict:
+    """Run the sync/async matrix and print req/sec and p99 tables."""
+    connection_levels = connection_levels or CONNECTION_LEVELS
+    print_header(f'Sync vs Async Handlers (Granian, {workers} worker(s), {tool})')
+    print(f'Connections: {", ".join(map(str, connection_levels))}')
+    print(f'Duration: {duration}s per endpoint')
+
+    results = run_sync_async(tool, duration, connection_levels, threads, workers, port, frameworks)
+    if results:
+        print_tables(results, connection_levels)
+
+    benchmark_results = [
+        BenchmarkResult(
+            name=r.name,
+            value=r.requests_per_sec,
+            unit='req/sec',
+            category=CATEGORY,
+            details=r.details,
+        )
+        for by_key in results.values()
+        for r in by_key.values()
+    ]
+    return collect_results(CATEGORY, benchmark_results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sync vs async handlers per framework')
+    parser.add_argument(
+        '--tool',
+        '-t',
+        choices=['wrk', 'hey', 'builtin'],
+        default='wrk' if check_tool('wrk') else 'builtin',
+        help='Benchmark tool to use (default: wrk if installed, else builtin)',
+    )
+    parser.add_argument('--duration', '-d', type=int, default=5, help='Seconds per endpoint (default: 5)')
+    parser.add_argument(
+        '--connections',
+        '-c',
+        type=int,
+        nargs='+',
+        default=CONNECTION_LEVELS,
+        help=f'Connection counts to test (default: {" ".join(map(str, CONNECTION_LEVELS))})',
+    )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=4,
+        help='Number of threads for wrk, or processes for the built-in generator (default: 4)',
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=1,
+        help='Number of Granian workers (default: 1, so one event loop/threadpool is measured)',
+    )
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--frameworks',
+        '-f',
+        nargs='+',
+        choices=[s.name for s in SYNC_ASYNC_SERVERS],
+        help='Specific frameworks to benchmark (default: all)',
+    )
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if args.tool != 'builtin' and not check_tool(args.tool):
+        print(f'Error: {args.tool} not found.')
+        sys.exit(1)
+    if not check_tool('granian'):
+        print('Error: granian not found.')
+        print('Install with: pip install granian')
+        sys.exit(1)
+
+    results = run_benchmarks(
+        tool=args.tool,
+        duration=args.duration,
+        connection_levels=args.connections,
+        threads=args.threads,
+        workers=args.workers,
+        port=args.port,
+        frameworks=args.frameworks,
+    )
+    if args.json:
+        print('\nJSON Results:')
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
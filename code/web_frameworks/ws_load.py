@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Built-in WebSocket load generator (RFC 6455 over raw asyncio streams).
+
+Two modes against the apps' /ws/echo and /ws/broadcast endpoints:
+- echo: every connection sends a text message, waits for the echo, repeats.
+  Latency is the round trip.
+- broadcast: `connections` subscribers plus one publisher. The publisher sends
+  a message, the server fans it out to every client of its worker (publisher
+  included), and the publisher sends the next one once its own copy arrives.
+  Latency is publish-to-delivery, read from the send timestamp each message
+  carries; perf_counter_ns is CLOCK_MONOTONIC, so it is comparable across
+  local processes.
+
+Results reuse LoadResult, with `requests` counting messages received.
+
+Usage:
+    python ws_load.py ws://127.0.0.1:8000/ws/echo -c 100 -d 10
+    python ws_load.py ws://127.0.0.1:8000/ws/broadcast --mode broadcast -c 500 --size 256
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+from urllib.parse import urlsplit
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.benchmark import format_bytes
+
+from web_frameworks.load_generator import PERCENTILES, LoadResult
+
+OP_TEXT = 0x1
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+TIMESTAMP_DIGITS = 20
+
+
+@dataclass
+class WsLoadConfig:
+    url: str
+    connections: int = 100
+    duration: float = 10.0
+    message_size: int = 64  # Bytes per text message, including the timestamp
+    mode: str = 'echo'  # "echo" or "broadcast"
+    publisher: bool = True  # Broadcast: run the publisher in this process
+    timeout: float = 5.0  # Seconds to wait for a message
+
+
+# =============================================================================
+# WebSocket Client
+# =============================================================================
+
+
+async def ws_connect(url: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a connection and complete the upgrade handshake."""
+    parts = urlsplit(url)
+    if parts.scheme != 'ws':
+        raise ValueError(f'Only ws:// URLs are supported: {url}')
+    host = parts.hostname or '127.0.0.1'
+    port = parts.port or 80
+
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write(
+        (
+            f'GET {parts.path or "/"} HTTP/1.1\r\n'
+            f'Host: {host}:{port}\r\n'
+            'Upgrade: websocket\r\n'
+            'Connection: Upgrade\r\n'
+            f'Sec-WebSocket-Key: {key}\r\n'
+            'Sec-WebSocket-Version: 13\r\n\r\n'
+        ).encode('latin-1')
+    )
+    head = await reader.readuntil(b'\r\n\r\n')
+    if head[9:12] != b'101':
+        writer.close()
+        status_line = head.split(b'\r\n', 1)[0].decode('latin-1')
+        raise ConnectionError(f'Upgrade refused: {status_line}')
+    return reader, writer
+
+
+def encode_frame(payload: bytes, opcode: int = OP_TEXT) -> bytes:
+    """
+    Encode one final client frame.
+
+    Client frames must be masked, but any key is valid; an all-zero key makes
+    masking the identity, so the payload needs no per-byte XOR in Python.
+    """
+    length = len(payload)
+    if length < 126:
+        header = bytes([0x80 | opcode, 0x80 | length])
+    elif length < 1 << 16:
+        header = bytes([0x80 | opcode, 0x80 | 126]) + length.to_bytes(2, 'big')
+    else:
+        header = bytes([0x80 | opcode, 0x80 | 127]) + length.to_bytes(8, 'big')
+    return header + b'\x00\x00\x00\x00' + payload
+
+
+async def read_message(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bytes:
+    """Read the next data frame, answering pings. Servers send unmasked, unfragmented messages here."""
+    while True:
+        head = await reader.readexactly(2)
+        opcode = head[0] & 0x0F
+        length = head[1] & 0x7F
+        if length == 126:
+            length = int.from_bytes(await reader.readexactly(2), 'big')
+        elif length == 127:
+            length = int.from_bytes(await reader.readexactly(8), 'big')
+        payload = await reader.readexactly(length)
+
+        if opcode == OP_PING:
+            writer.write(encode_frame(payload, OP_PONG))
+        elif opcode == OP_CLOSE:
+            raise ConnectionError('Server closed the WebSocket')
+        elif opcode != OP_PONG:
+            return payload
+
+
+def make_message(size: int) -> bytes:
+    """Zero-padded send timestamp followed by padding up to `size` bytes."""
+    return str(perf_counter_ns()).zfill(TIMESTAMP_DIGITS).encode() + b'x' * max(0, size - TIMESTAMP_DIGITS)
+
+
+def message_latency_us(message: bytes) -> int:
+    return (perf_counter_ns() - int(message[:TIMESTAMP_DIGITS])) // 1000
+
+
+async def close(writer: asyncio.StreamWriter) -> None:
+    try:
+        writer.write(encode_frame(b'\x03\xe8', OP_CLOSE))  # 1000: normal closure
+        await writer.drain()
+    except OSError:
+        pass
+    writer.close()
+
+
+# =============================================================================
+# Load
+# =============================================================================
+
+
+async def run_echo_connection(config: WsLoadConfig, deadline: int, result: LoadResult) -> None:
+    try:
+        reader, writer = await ws_connect(config.url)
+    except (OSError, ConnectionError, asyncio.IncompleteReadError):
+        result.errors['connect'] += 1
+        return
+
+    try:
+        while perf_counter_ns() < deadline:
+            writer.write(encode_frame(make_message(config.message_size)))
+            async with asyncio.timeout(config.timeout):
+                message = await read_message(reader, writer)
+            result.latency.record(message_latency_us(message))
+            result.requests += 1
+            result.bytes_received += len(message)
+    except TimeoutError:
+        result.errors['timeout'] += 1
+    except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+        result.errors['read'] += 1
+    finally:
+        await close(writer)
+
+
+async def run_subscriber(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    config: WsLoadConfig,
+    deadline: int,
+    result: LoadResult,
+) -> None:
+    """Record every broadcast message until the deadline."""
+    try:
+        while (remaining := deadline - perf_counter_ns()) > 0:
+            try:
+                async with asyncio.timeout(remaining / 1e9):
+                    message = await read_message(reader, writer)
+            except TimeoutError:
+                break
+            result.latency.record(message_latency_us(message))
+            result.requests += 1
+            result.bytes_received += len(message)
+    except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+        result.errors['read'] += 1
+    finally:
+        await close(writer)
+
+
+async def run_publisher(config: WsLoadConfig, deadline: int, result: LoadResult) -> None:
+    """Publish, wait for our own copy to come back, repeat."""
+    try:
+        reader, writer = await ws_connect(config.url)
+    except (OSError, ConnectionError, asyncio.IncompleteReadError):
+        result.errors['connect'] += 1
+        return
+
+    try:
+        while perf_counter_ns() < deadline:
+            sent = make_message(config.message_size)
+            writer.write(encode_frame(sent))
+            async with asyncio.timeout(config.timeout):
+                while await read_message(reader, writer) != sent:
+                    pass
+    except TimeoutError:
+        result.errors['timeout'] += 1
+    except (OSError, ConnectionError, asyncio.IncompleteReadError):
+        result.errors['read'] += 1
+    finally:
+        await close(writer)
+
+
+async def run_ws_load_async(config: WsLoadConfig) -> LoadResult:
+    """Run one WebSocket load test in the current event loop."""
+    result = LoadResult()
+
+    if config.mode == 'echo':
+        start = perf_counter_ns()
+        deadline = start + int(config.duration * 1e9)
+        await asyncio.gather(*(run_echo_connection(config, deadline, result) for _ in range(config.connections)))
+    else:
+        # Connect every subscriber before the first publish
+        connected = await asyncio.gather(
+            *(ws_connect(config.url) for _ in range(config.connections)),
+            return_exceptions=True,
+        )
+        subscribers = [c for c in connected if not isinstance(c, BaseException)]
+        if len(subscribers) < len(connected):
+            result.errors['connect'] += len(connected) - len(subscribers)
+
+        start = perf_counter_ns()
+        deadline = start + int(config.duration * 1e9)
+        tasks = [run_subscriber(reader, writer, config, deadline, result) for reader, writer in subscribers]
+        if config.publisher:
+            tasks.append(run_publisher(config, deadline, result))
+        await asyncio.gather(*tasks)
+
+    result.duration_s = (perf_counter_ns() - start) / 1e9
+    return result
+
+
+def _run_in_process(config: WsLoadConfig) -> dict[str, Any]:
+    return asyncio.run(run_ws_load_async(config)).to_dict()
+
+
+def run_ws_load(config: WsLoadConfig, processes: int = 1) -> LoadResult:
+    """Run a WebSocket load test, optionally splitting connections across processes (one publisher in total)."""
+    if processes <= 1:
+        return asyncio.run(run_ws_load_async(config))
+
+    configs = []
+    for i in range(processes):
+        share = replace(config, connections=config.connections // processes, publisher=config.publisher and i == 0)
+        if i < config.connections % processes:
+            share.connections += 1
+        configs.append(share)
+
+    result = LoadResult()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for data in executor.map(_run_in_process, configs):
+            result.merge(LoadResult.from_dict(data))
+    return result
+
+
+def print_ws_result(result: LoadResult) -> None:
+    latency = result.latency
+    print(f'  Messages:      {result.requests:,} in {result.duration_s:.2f}s')
+    print(f'  Messages/sec:  {result.requests_per_sec:,.2f}')
+    print(f'  Transfer/sec:  {format_bytes(int(result.bytes_per_sec))}')
+    print(f'  Latency:       mean {latency.mean_us / 1000:.2f}ms, max {latency.max_us / 1000:.2f}ms')
+    for p in PERCENTILES:
+        print(f'    {f"p{p:g}":<8} {result.latency_ms(p):>10.2f}ms')
+    if result.errors:
+        errors = ', '.join(f'{kind}={n:,}' for kind, n in sorted(result.errors.items()))
+        print(f'  Errors:        {errors}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Built-in WebSocket load generator (echo and broadcast)')
+    parser.add_argument('url', help='Target URL, e.g. ws://127.0.0.1:8000/ws/echo')
+    parser.add_argument('--mode', choices=['echo', 'broadcast'], default='echo', help='Load pattern (default: echo)')
+    parser.add_argument('--connections', '-c', type=int, default=100, help='Connections/subscribers (default: 100)')
+    parser.add_argument('--duration', '-d', type=float, default=10, help='Test duration in seconds (default: 10)')
+    parser.add_argument('--size', type=int, default=64, help='Message size in bytes (default: 64)')
+    parser.add_argument(
+        '--processes',
+        '-P',
+        type=int,
+        default=1,
+        help=f'Load generator processes (default: 1, this machine has {os.cpu_count()} CPUs)',
+    )
+    parser.add_argument('--timeout', type=float, default=5.0, help='Message timeout in seconds (default: 5)')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    config = WsLoadConfig(
+        url=args.url,
+        connections=args.connections,
+        duration=args.duration,
+        message_size=args.size,
+        mode=args.mode,
+        timeout=args.timeout,
+    )
+    result = run_ws_load(config, processes=args.processes)
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_ws_result(result)
+
+
+if __name__ == '__main__':
+    main()